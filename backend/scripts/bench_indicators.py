@@ -0,0 +1,86 @@
+"""
+İndikatör backend'leri: parity kontrolü + mikro benchmark (numpy vs pandas).
+
+Parity: NumPy kernel'leri pandas versiyonlarıyla birebir aynı sonucu vermeli (NaN dahil).
+Farklılık varsa script 1 ile çıkar.
+Benchmark: 50 / 250 / 300 barlık serilerde tam pipeline (ohlcv -> tüm indikatörler) süresi.
+
+Çalıştırma:
+  cd backend
+  set PYTHONPATH=src
+  python scripts/bench_indicators.py
+"""
+
+import math
+import random
+import sys
+import timeit
+from pathlib import Path
+
+backend = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend / "src"))
+
+
+def _random_ohlcv(n: int, seed: int, with_nan: bool = False) -> list:
+    rng = random.Random(seed)
+    price = 100.0
+    rows = []
+    for i in range(n):
+        price *= math.exp(rng.gauss(0, 0.01))
+        close = price * (1 + rng.gauss(0, 0.003))
+        rows.append([i * 900_000, price, max(price, close) * 1.004, min(price, close) * 0.996, close, 1.0])
+    if with_nan and n > 20:
+        rows[n // 3][4] = float("nan")
+        rows[n // 2][2] = float("nan")
+    return rows
+
+
+def check_parity() -> int:
+    """Her seri ve sütun için numpy ile pandas çıktısını karşılaştırır. Hata sayısını döndürür."""
+    import numpy as np
+    from strategy.indicators import compute_indicators
+
+    cases = [_random_ohlcv(n, seed) for n in (1, 2, 30, 50, 250, 300) for seed in range(5)]
+    cases.append(_random_ohlcv(300, 99, with_nan=True))
+    cases.append([[i, 1.0, 1.0, 1.0, 1.0, 1.0] for i in range(60)])  # sabit seri
+
+    params = [
+        dict(ema_period=200, macd_fast=12, macd_slow=26, macd_signal=9, rsi_period=14, atr_period=14),
+        dict(ema_period=20, macd_fast=5, macd_slow=35, macd_signal=5, rsi_period=7, atr_period=10),
+    ]
+    failures = 0
+    for rows in cases:
+        for p in params:
+            fast = compute_indicators(rows, backend="numpy", **p)
+            ref = compute_indicators(rows, backend="pandas", **p)
+            for col in ("ema", "macd", "macd_signal", "macd_hist", "rsi", "atr"):
+                if not np.array_equal(fast[col], ref[col], equal_nan=True):
+                    failures += 1
+                    print(f"PARITY FAIL n={len(rows)} params={p} col={col}")
+    return failures
+
+
+def run_benchmark(repeat: int = 200) -> None:
+    from strategy.indicators import add_indicators_to_df, compute_indicators, ohlcv_to_dataframe
+
+    print(f"{'bars':>6} {'pandas (us)':>12} {'numpy (us)':>12} {'speedup':>8}")
+    for n in (50, 250, 300):
+        rows = _random_ohlcv(n, seed=n)
+        t_pd = min(timeit.repeat(lambda: add_indicators_to_df(ohlcv_to_dataframe(rows)), number=repeat, repeat=3))
+        t_np = min(timeit.repeat(lambda: compute_indicators(rows, backend="numpy"), number=repeat, repeat=3))
+        us_pd = t_pd / repeat * 1e6
+        us_np = t_np / repeat * 1e6
+        print(f"{n:>6} {us_pd:>12.1f} {us_np:>12.1f} {us_pd / us_np:>7.1f}x")
+
+
+def main():
+    failures = check_parity()
+    if failures:
+        print(f"Parity: {failures} farklılık bulundu.")
+        sys.exit(1)
+    print("Parity: numpy ve pandas çıktıları birebir aynı.")
+    run_benchmark()
+
+
+if __name__ == "__main__":
+    main()
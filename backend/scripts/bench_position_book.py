@@ -0,0 +1,146 @@
+"""
+PositionBook: parity kontrolü + benchmark (TrailingStopState döngüsü vs vektörel update).
+
+Parity: rastgele long/short pozisyonlar ve fiyat yollarında her adımda kapatma kararı, stop ve
+break-even bayrağı TrailingStopState.update ile birebir aynı olmalı. Farklılık varsa script 1 ile çıkar.
+Benchmark: 500 (ve 50 / 2000) simüle pozisyonun tek kontrol adımı süresi.
+
+Çalıştırma:
+  cd backend
+  set PYTHONPATH=src
+  python scripts/bench_position_book.py
+"""
+
+import math
+import random
+import sys
+import timeit
+from pathlib import Path
+
+backend = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend / "src"))
+
+
+def _random_positions(n: int, seed: int) -> list:
+    rng = random.Random(seed)
+    positions = []
+    for i in range(n):
+        side = "long" if rng.random() < 0.5 else "short"
+        entry = 100.0 * math.exp(rng.gauss(0, 1))
+        dist = entry * rng.uniform(0.002, 0.03)
+        stop = entry - dist if side == "long" else entry + dist
+        mult = rng.choice([0.5, 1.0, 1.5, 2.0])
+        positions.append((f"SYM{i}/USDT", side, entry, stop, rng.uniform(0.01, 5.0), mult))
+    return positions
+
+
+def _random_marks(positions: list, steps: int, seed: int) -> list:
+    """Her pozisyon için `steps` adımlık fiyat yolu; [adım][pozisyon]."""
+    rng = random.Random(seed)
+    prices = [p[2] for p in positions]
+    vols = [rng.uniform(0.001, 0.01) for _ in positions]
+    paths = []
+    for _ in range(steps):
+        prices = [px * math.exp(rng.gauss(0, vol)) for px, vol in zip(prices, vols)]
+        paths.append(list(prices))
+    return paths
+
+
+def _states(positions: list) -> list:
+    from execution.trailing_stop import TrailingStopState
+
+    return [
+        TrailingStopState(sym, side, entry, stop, qty, atr_trailing_mult=mult)
+        for sym, side, entry, stop, qty, mult in positions
+    ]
+
+
+def _book(positions: list):
+    from execution.position_book import PositionBook
+
+    book = PositionBook(capacity=8)  # büyüme de test edilsin
+    views = [
+        book.add(sym, side, entry, stop, qty, break_even_r=1.0, atr_trailing_mult=mult)
+        for sym, side, entry, stop, qty, mult in positions
+    ]
+    return book, views
+
+
+def check_parity() -> int:
+    """Kapanan pozisyonlar çıkarılarak adım adım karşılaştırır. Hata sayısını döndürür."""
+    import numpy as np
+
+    failures = 0
+    for seed in range(5):
+        positions = _random_positions(500, seed)
+        paths = _random_marks(positions, 300, seed + 100)
+        atrs = np.array([abs(p[2] - p[3]) * random.Random(seed + i).uniform(0.3, 1.5) for i, p in enumerate(positions)])
+        states = _states(positions)
+        book, views = _book(positions)
+        open_idx = list(range(len(positions)))
+        for step, marks in enumerate(paths):
+            idx = np.array(open_idx)
+            slots = np.array([views[i].slot for i in open_idx])
+            close, stops = book.update(np.array(marks)[idx], atrs[idx], slots)
+            still_open = []
+            for k, i in enumerate(open_idx):
+                ref_close, ref_stop = states[i].update(marks[i], float(atrs[i]))
+                if (
+                    bool(close[k]) != ref_close
+                    or float(stops[k]) != ref_stop
+                    or views[i].break_even_done != states[i].break_even_done
+                ):
+                    failures += 1
+                    print(f"PARITY FAIL seed={seed} step={step} pos={i} side={positions[i][1]}")
+                if ref_close:
+                    book.release(views[i])
+                else:
+                    still_open.append(i)
+            open_idx = still_open
+            if not open_idx:
+                break
+        # Tek satırlık view.update da aynı sonucu vermeli
+        if open_idx:
+            i = open_idx[0]
+            if views[i].update(paths[-1][i], float(atrs[i])) != states[i].update(paths[-1][i], float(atrs[i])):
+                failures += 1
+                print(f"PARITY FAIL seed={seed} view.update pos={i}")
+    return failures
+
+
+def run_benchmark(repeat: int = 200) -> None:
+    import numpy as np
+
+    print(f"{'positions':>9} {'scalar (us)':>12} {'book (us)':>12} {'speedup':>8}")
+    for n in (50, 500, 2000):
+        positions = _random_positions(n, seed=n)
+        # Stop'a gelmeyen fiyatlar: her adımda tüm pozisyonlar güncellenir
+        marks = [p[2] for p in positions]
+        atrs = [abs(p[2] - p[3]) for p in positions]
+        states = _states(positions)
+        book, views = _book(positions)
+        slots = np.array([v.slot for v in views])
+        marks_arr, atrs_arr = np.array(marks), np.array(atrs)
+
+        def scalar():
+            for state, mark, atr in zip(states, marks, atrs):
+                state.update(mark, atr)
+
+        t_sc = min(timeit.repeat(scalar, number=repeat, repeat=3))
+        t_bk = min(timeit.repeat(lambda: book.update(marks_arr, atrs_arr, slots), number=repeat, repeat=3))
+        us_sc = t_sc / repeat * 1e6
+        us_bk = t_bk / repeat * 1e6
+        print(f"{n:>9} {us_sc:>12.1f} {us_bk:>12.1f} {us_sc / us_bk:>7.1f}x")
+
+
+def main():
+    failures = check_parity()
+    if failures:
+        print(f"Parity: {failures} farklılık bulundu.")
+        sys.exit(1)
+    print("Parity: PositionBook ve TrailingStopState sonuçları birebir aynı.")
+    run_benchmark()
+
+
+if __name__ == "__main__":
+    main()
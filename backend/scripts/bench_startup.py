@@ -0,0 +1,178 @@
+"""
+API başlangıcı: ilk /health yanıtına kadar geçen süre + import profili.
+
+Electron arayüzü backend'i başlatıp /health hazır olana kadar bekler; bu süre kullanıcının gördüğü
+açılış gecikmesidir. Script:
+  - import profili: `python -X importtime -c "import api.main"` çıktısından en pahalı modüller
+  - ağır modül kontrolü: api.main import edildikten sonra pandas / ccxt / httpx / strategy.indicators /
+    utils.telegram yüklenmemiş olmalı (ilk kullanıldıkları yerde import edilirler)
+  - ilk /health: uvicorn ile yeni süreçte başlatılır ve HTTP ile yoklanır; uvicorn kurulu değilse
+    yeni süreçte api.main import + ASGI lifespan.startup (exchange-warmup thread'i başlar) + ASGI
+    üzerinden /health çağrısı ölçülür
+Süre --budget'ı (varsayılan 1.0 sn) aşarsa veya ağır modül yüklenmişse script 1 ile çıkar.
+
+Çalıştırma:
+  cd backend
+  set PYTHONPATH=src
+  python scripts/bench_startup.py [--budget 1.0] [--top 15]
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+backend = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend / "src"))
+
+HEAVY_MODULES = ("pandas", "numpy", "ccxt", "httpx", "strategy.indicators", "utils.telegram")
+
+# Yeni süreçte: api.main import (ağır modül kontrolü burada) + uvicorn gibi önce lifespan.startup
+# (exchange-warmup thread'i başlar), sonra ASGI /health, en son lifespan.shutdown
+_ASGI_PROBE = """
+import asyncio, json, sys
+import api.main
+
+heavy = [m for m in %r if m in sys.modules]
+
+async def call():
+    app = api.main.app
+    lifespan_in = asyncio.Queue()
+    lifespan_out = asyncio.Queue()
+    lifespan = asyncio.create_task(app({"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}},
+                                       lifespan_in.get, lifespan_out.put))
+    await lifespan_in.put({"type": "lifespan.startup"})
+    started = await lifespan_out.get()
+    if started["type"] != "lifespan.startup.complete":
+        raise RuntimeError(started.get("message") or started["type"])
+    sent = []
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    async def send(message):
+        sent.append(message)
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+             "scheme": "http", "path": "/health", "raw_path": b"/health", "query_string": b"",
+             "root_path": "", "headers": [], "client": ("127.0.0.1", 0), "server": ("127.0.0.1", 80)}
+    await app(scope, receive, send)
+    await lifespan_in.put({"type": "lifespan.shutdown"})
+    await lifespan
+    return sent[0]["status"]
+
+status = asyncio.run(call())
+print(json.dumps({"status": status, "heavy": heavy}))
+""" % (HEAVY_MODULES,)
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(backend / "src"), env.get("PYTHONPATH")]))
+    return env
+
+
+def import_profile(top: int) -> None:
+    """-X importtime çıktısında kümülatif süreye göre en pahalı modüller."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import api.main"],
+        cwd=str(backend), env=_env(), capture_output=True, text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|", 2)
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+    total = next((c for c, _, n in rows if n == "api.main"), 0)
+    print(f"import api.main: {total / 1000:.0f} ms (kümülatif)")
+    print(f"{'cumulative (ms)':>16} {'self (ms)':>10}  module")
+    for cumulative, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative / 1000:>16.1f} {self_us / 1000:>10.1f}  {name}")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def health_via_uvicorn(timeout: float = 20.0) -> float:
+    """uvicorn sürecini başlatır; /health 200 dönene kadar 10 ms aralıkla yoklar. Süreyi döndürür."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=str(backend), env=_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn çıktı (kod {proc.returncode})")
+            try:
+                with urllib.request.urlopen(url, timeout=1.0) as r:
+                    if r.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f"/health {timeout:.0f} sn içinde yanıt vermedi")
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def health_via_asgi() -> tuple:
+    """Yeni süreçte api.main import + lifespan.startup + ASGI /health; (süre, import sonrası ağır modüller)."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", _ASGI_PROBE],
+        cwd=str(backend), env=_env(), capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "probe başarısız")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    if result["status"] != 200:
+        raise RuntimeError(f"/health status {result['status']}")
+    return elapsed, result["heavy"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API başlangıç süresi ve import profili")
+    parser.add_argument("--budget", type=float, default=1.0, help="İlk /health için üst sınır (sn)")
+    parser.add_argument("--top", type=int, default=15, help="Profilde gösterilecek modül sayısı")
+    args = parser.parse_args()
+
+    import_profile(args.top)
+    print()
+
+    asgi_seconds, heavy = health_via_asgi()
+    print(f"Süreç başlangıcı -> ASGI /health: {asgi_seconds * 1000:.0f} ms")
+    if heavy:
+        print(f"Ağır modüller api.main ile yüklendi: {', '.join(heavy)}")
+    else:
+        print("Ağır modül yüklenmedi: " + ", ".join(HEAVY_MODULES))
+
+    elapsed = asgi_seconds
+    try:
+        import uvicorn  # noqa: F401
+    except ImportError:
+        print("uvicorn kurulu değil; HTTP ölçümü atlandı (bütçe ASGI süresine uygulanır).")
+    else:
+        elapsed = health_via_uvicorn()
+        print(f"Süreç başlangıcı -> HTTP /health (uvicorn): {elapsed * 1000:.0f} ms")
+
+    if heavy or elapsed > args.budget:
+        print(f"BAŞARISIZ: bütçe {args.budget:.2f} sn, ölçülen {elapsed:.2f} sn")
+        sys.exit(1)
+    print(f"Bütçe içinde: {elapsed:.2f} sn <= {args.budget:.2f} sn")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Sahte borsa (ağ ve API key gerekmez) + async engine smoke testi.
+
+FakeExchange: BaseExchange'in sentetik, deterministik implementasyonu. Fiyat sembol ve zamana
+bağlı bir dalga; mumlar istenen timeframe'de bu fiyattan üretilir, market order'lar anında dolar.
+Engine'i gerçek borsaya bağlanmadan çalıştırmak için PaperTrader + AsyncExchangeAdapter ile sarılır:
+
+    exchange = AsyncExchangeAdapter(PaperTrader(initial_balance=1000, data_exchange=FakeExchange()))
+    await run_engine_async(1, stop_event, exchange=exchange)
+
+Smoke testi: async engine'i birkaç saniye çalıştırır, durdurur; engine'in veri çektiğini ve
+zamanında durduğunu kontrol eder. Başarısızsa script 1 ile çıkar.
+
+Çalıştırma:
+  cd backend
+  set PYTHONPATH=src
+  python scripts/fake_exchange.py [--seconds 3]
+"""
+
+import argparse
+import asyncio
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+backend = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend / "src"))
+
+from core.timeframes import timeframe_to_ms  # noqa: E402
+from exchanges.base_exchange import BaseExchange  # noqa: E402
+
+
+def price_at(symbol: str, ts_ms: int) -> float:
+    """Sembol başına farklı fazda iki dalganın toplamı (~90–113)."""
+    phase = sum(map(ord, symbol))
+    return 100 + 10 * math.sin(ts_ms / 1.8e7 + phase) + 3 * math.sin(ts_ms / 7e5 + phase * 2)
+
+
+class FakeExchange(BaseExchange):
+    """Sentetik fiyatlı sahte borsa. now_ms verilirse saat sabittir (testte elle ilerletilir)."""
+
+    def __init__(self, now_ms: Optional[int] = None, balance: float = 1000.0):
+        self.now_ms = now_ms
+        self.balance = balance
+        self.calls: List[tuple] = []
+        self.orders: List[Dict[str, Any]] = []
+
+    def now(self) -> int:
+        return self.now_ms if self.now_ms is not None else int(time.time() * 1000)
+
+    def _bar(self, symbol: str, tf_ms: int, ts: int) -> List[float]:
+        end = min(ts + tf_ms, self.now())
+        points = [price_at(symbol, int(ts + k * (end - ts) / 8)) for k in range(9)]
+        return [ts, points[0], max(points), min(points), points[-1], 1.0]
+
+    def get_balance(self) -> float:
+        return self.balance
+
+    def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        return []
+
+    def get_klines(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 500,
+        since: Optional[int] = None,
+    ) -> List[List[Any]]:
+        self.calls.append(("klines", symbol, timeframe, limit, since))
+        tf_ms = timeframe_to_ms(timeframe)
+        current = self.now() // tf_ms * tf_ms
+        start = current - (limit - 1) * tf_ms if since is None else (since + tf_ms - 1) // tf_ms * tf_ms
+        bars = []
+        ts = start
+        while ts <= current and len(bars) < limit:
+            bars.append(self._bar(symbol, tf_ms, ts))
+            ts += tf_ms
+        return bars
+
+    def get_ticker(self, symbol: str) -> Dict[str, float]:
+        self.calls.append(("ticker", symbol))
+        price = price_at(symbol, self.now())
+        return {"last": price, "bid": price, "ask": price}
+
+    def place_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        order_type: str = "market",
+        stop_price: Optional[float] = None,
+        reduce_only: bool = False,
+    ) -> Dict[str, Any]:
+        fill = price_at(symbol, self.now())
+        order_id = f"fake-{len(self.orders) + 1}"
+        self.orders.append({"order_id": order_id, "symbol": symbol, "side": side, "quantity": quantity})
+        return {"order_id": order_id, "filled": quantity, "avg_price": fill}
+
+    def cancel_order(self, order_id: str, symbol: str) -> bool:
+        return True
+
+
+async def smoke(seconds: float) -> int:
+    """Async engine'i FakeExchange üzerinde çalıştırıp durdurur. Hata sayısını döndürür."""
+    from engine.async_loop import run_engine_async
+    from exchanges import AsyncExchangeAdapter, PaperTrader
+
+    fake = FakeExchange()
+    exchange = AsyncExchangeAdapter(PaperTrader(initial_balance=1000, data_exchange=fake))
+    stop_event = asyncio.Event()
+    task = asyncio.create_task(run_engine_async(1, stop_event, exchange=exchange))
+    await asyncio.sleep(seconds)
+    stop_event.set()
+    failures = 0
+    try:
+        await asyncio.wait_for(task, timeout=10)
+    except asyncio.TimeoutError:
+        print("HATA: engine stop_event sonrası 10 sn içinde durmadı")
+        failures += 1
+    klines = sum(1 for call in fake.calls if call[0] == "klines")
+    print(f"Engine {seconds:.0f} sn çalıştı: {klines} mum isteği, {len(fake.orders)} order")
+    if klines == 0:
+        print("HATA: engine hiç mum çekmedi")
+        failures += 1
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FakeExchange ile async engine smoke testi")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Engine çalışma süresi (sn)")
+    args = parser.parse_args()
+    failures = asyncio.run(smoke(args.seconds))
+    if failures:
+        sys.exit(1)
+    print("Smoke testi geçti.")
+
+
+if __name__ == "__main__":
+    main()
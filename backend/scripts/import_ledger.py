@@ -0,0 +1,49 @@
+"""
+Eski istatistikleri SQLite trade ledger'a aktarır (data/stats.json + logs/trades_*.log).
+
+Engine ledger'ı ilk açtığında bu aktarım otomatik yapılır; script farklı dosyalardan aktarmak
+veya toplamları trade satırlarından yeniden hesaplamak için kullanılır.
+
+Çalıştırma:
+  cd backend
+  set PYTHONPATH=src
+  python scripts/import_ledger.py                       # varsayılan yollar
+  python scripts/import_ledger.py --stats eski/stats.json --logs eski/logs --db data/ledger.db
+  python scripts/import_ledger.py --rebuild             # totals/daily'yi trades'ten yeniden hesapla
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+backend = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend / "src"))
+
+
+def main():
+    from stats.trade_logger import _log_dir
+    from storage.trade_ledger import TradeLedger
+
+    parser = argparse.ArgumentParser(description="stats.json + trade log -> SQLite ledger")
+    parser.add_argument("--db", type=Path, default=backend / "data" / "ledger.db")
+    parser.add_argument("--stats", type=Path, default=backend / "data" / "stats.json")
+    parser.add_argument("--logs", type=Path, default=None, help="trades_*.log klasörü (varsayılan: logging.log_dir)")
+    parser.add_argument("--rebuild", action="store_true", help="Aktarmadan sonra toplamları trade satırlarından hesapla")
+    args = parser.parse_args()
+
+    ledger = TradeLedger(args.db)
+    if ledger.imported():
+        print(f"{args.db}: eski veriler zaten aktarılmış.")
+    else:
+        result = ledger.import_legacy(args.stats, args.logs or _log_dir())
+        print(f"Aktarıldı: {result['trades']} trade, {result['days']} gün -> {args.db}")
+    if args.rebuild:
+        ledger.rebuild_aggregates()
+        print("Toplamlar trade satırlarından yeniden hesaplandı.")
+    totals = ledger.totals()
+    print(f"Toplam: {totals['total_trades']} trade, PnL {totals['total_pnl']:.2f}, R {totals['total_r']:.2f}")
+    ledger.close()
+
+
+if __name__ == "__main__":
+    main()
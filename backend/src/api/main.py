@@ -3,15 +3,39 @@ FastAPI uygulaması - GUI ve dış entegrasyon için REST API.
 
 Çalıştırma (backend klasöründen, PYTHONPATH=src):
   uvicorn api.main:app --reload --port 8000
+
+Başlangıç hızlı tutulur: route modülleri ağır paketleri (pandas, ccxt, httpx) fonksiyon içinde
+import eder; /health ilk istekte hazırdır. Paylaşılan exchange startup'ta arka planda kurulur
+(ccxt import + market cache), dashboard'un ilk isteği beklemez. Ölçüm: scripts/bench_startup.py
 """
 
+import logging
+import threading
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .routes import config as config_routes
 from .routes import dashboard, engine_control
 
-app = FastAPI(title="WinnerTrade API", version="0.1.0")
+
+def _warm_exchange() -> None:
+    """Paylaşılan exchange'i kurar (exchanges/registry.py); config yoksa veya hata olursa ilk istek dener."""
+    try:
+        from exchanges.registry import shared_exchange
+        shared_exchange()
+    except Exception as e:
+        logging.getLogger(__name__).debug("Exchange ön yüklemesi atlandı: %s", e)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    threading.Thread(target=_warm_exchange, name="exchange-warmup", daemon=True).start()
+    yield
+
+
+app = FastAPI(title="WinnerTrade API", version="0.1.0", lifespan=_lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,6 +49,7 @@ app.include_router(config_routes.router, prefix="/api", tags=["config"])
 app.include_router(dashboard.router, prefix="/api", tags=["dashboard"])
 app.include_router(engine_control.router, prefix="/api", tags=["engine"])
 
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
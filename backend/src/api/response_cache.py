@@ -0,0 +1,127 @@
+"""
+Response Cache - Dashboard'un borsaya giden endpoint'leri için TTL cache + istek birleştirme.
+
+Her sekme /positions, /ticker, /balance'ı saniyede bir çağırıyor; cache olmadan her çağrı bir borsa
+isteği demek. ResponseCache.get(key, loader, ttl, stale):
+  - kayıt ttl'den yeniyse direkt döner (hit)
+  - ttl geçmiş ama ttl + stale içindeyse eski değer hemen döner, yenileme arka planda yapılır (stale)
+  - yoksa loader çağrılır (miss); aynı anahtar için eşzamanlı istekler aynı çağrıyı bekler (coalesced)
+
+loader hata verirse sonuç cache'lenmez, bekleyen isteklerin hepsine aynı hata döner; arka plan
+yenilemesi hata verirse eski değer stale süresi bitene kadar kullanılmaya devam eder.
+İstatistik: stats() (endpoint başına hits / stale / misses / coalesced / errors; hit_rate = borsaya
+gitmeden karşılanan isteklerin oranı).
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# (endpoint, argümanlar...)
+CacheKey = Tuple[Hashable, ...]
+
+_COUNTERS = ("hits", "stale", "misses", "coalesced", "errors")
+
+
+class _Flight:
+    """Süren tek bir loader çağrısı; bekleyenler event'i bekler."""
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ResponseCache:
+    """Thread-safe TTL cache; anahtarın ilk elemanı endpoint adıdır (istatistikler onunla gruplanır)."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max(1, int(max_entries))
+        self._entries: Dict[CacheKey, Tuple[Any, float]] = {}
+        self._flights: Dict[CacheKey, _Flight] = {}
+        self._counters: Dict[Hashable, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, key: CacheKey, counter: str) -> None:
+        counters = self._counters.get(key[0])
+        if counters is None:
+            counters = self._counters[key[0]] = dict.fromkeys(_COUNTERS, 0)
+        counters[counter] += 1
+
+    def get(self, key: CacheKey, loader: Callable[[], Any], ttl: float, stale: float = 0.0) -> Any:
+        """
+        Args:
+            key: (endpoint, argümanlar...) — örn. ("ticker", "BTC/USDT")
+            loader: Borsadan veriyi alan fonksiyon
+            ttl: Kaydın taze sayıldığı süre (saniye)
+            stale: ttl'den sonra eski değerin (arka planda yenilenirken) dönebileceği ek süre
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            age = now - entry[1] if entry is not None else None
+            if age is not None and age < ttl:
+                self._count(key, "hits")
+                return entry[0]
+            flight = self._flights.get(key)
+            if age is not None and age < ttl + stale:
+                self._count(key, "stale")
+                if flight is None:
+                    flight = self._flights[key] = _Flight()
+                    threading.Thread(
+                        target=self._load, args=(key, flight, loader), name="response-cache", daemon=True
+                    ).start()
+                return entry[0]
+            leader = flight is None
+            if leader:
+                self._count(key, "misses")
+                flight = self._flights[key] = _Flight()
+            else:
+                self._count(key, "coalesced")
+        if leader:
+            self._load(key, flight, loader)
+        else:
+            flight.event.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def _load(self, key: CacheKey, flight: _Flight, loader: Callable[[], Any]) -> None:
+        try:
+            flight.value = loader()
+        except BaseException as e:
+            flight.error = e
+        with self._lock:
+            if flight.error is None:
+                self._entries[key] = (flight.value, time.monotonic())
+                if len(self._entries) > self.max_entries:
+                    oldest = min(self._entries, key=lambda k: self._entries[k][1])
+                    del self._entries[oldest]
+            else:
+                self._count(key, "errors")
+            self._flights.pop(key, None)
+        flight.event.set()
+
+    def invalidate(self, endpoint: Optional[Hashable] = None) -> None:
+        """Kayıtları siler; endpoint verilirse sadece onunkileri (süren çağrılar etkilenmez)."""
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == endpoint]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Endpoint başına sayaçlar + hit_rate (hits + stale + coalesced), toplam kayıt ve süren çağrı sayısı."""
+        with self._lock:
+            endpoints = {}
+            for endpoint, counters in self._counters.items():
+                served = counters["hits"] + counters["stale"] + counters["coalesced"]
+                total = served + counters["misses"]
+                endpoints[str(endpoint)] = {
+                    **counters,
+                    "hit_rate": round(served / total * 100, 2) if total else 0.0,
+                }
+            return {"endpoints": endpoints, "size": len(self._entries), "in_flight": len(self._flights)}
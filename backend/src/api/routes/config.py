@@ -7,10 +7,6 @@ from typing import Any, Dict
 
 from fastapi import APIRouter, HTTPException
 
-from core.config_schema import AppConfig
-from storage.config_storage import ConfigStorage
-from core.paths import get_config_path
-
 router = APIRouter()
 
 # API yanıtında api_secret maskelenir
@@ -33,6 +29,8 @@ def get_config() -> dict:
     Mevcut config'i döndürür. api_secret maskelenir.
     Config yoksa 404.
     """
+    from storage.config_storage import ConfigStorage
+
     storage = ConfigStorage()
     if not storage.exists():
         raise HTTPException(
@@ -52,6 +50,9 @@ def put_config(body: dict) -> dict:
     Config günceller. Body Pydantic şemasına uymalı.
     api_secret gönderilmezse veya maskeli (********) ise mevcut değer korunur.
     """
+    from core.config_schema import AppConfig
+    from storage.config_storage import ConfigStorage
+
     storage = ConfigStorage()
     # Mevcut config'i al; secret maskeli gelirse değiştirme
     if storage.exists():
@@ -77,6 +78,7 @@ def test_connection(body: dict) -> dict:
     Verilen config ile exchange bağlantısını dener (bakiye sorgusu).
     Body tam config veya sadece exchange/account blokları olabilir; şema doğrulanır.
     """
+    from core.config_schema import AppConfig
     from exchanges.factory import get_exchange_from_config_dict
 
     try:
@@ -99,4 +101,6 @@ def test_connection(body: dict) -> dict:
 @router.get("/config/path")
 def get_config_path_info() -> dict:
     """Config dosyasının kullanılan yolunu döndürür (GUI'de göstermek için)."""
+    from core.paths import get_config_path
+
     return {"config_path": str(get_config_path())}
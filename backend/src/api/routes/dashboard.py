@@ -1,29 +1,46 @@
 """
-Dashboard API - stats, positions, ticker, logs.
+Dashboard API - stats, positions, ticker, logs, events.
+
+/stream (Server-Sent Events): engine olayları (core.events) gerçekleştikçe push edilir; veri engine'in
+bellekteki durumundan gelir, bağlı istemci sayısı borsaya istek eklemez.
+/positions, /ticker, /balance borsa cevapları ResponseCache ile cache'lenir (TTL + istek birleştirme);
+sayaçlar /cache/stats. Bu istekler rate limiter'da en düşük öncelikte (UI) gider: engine'in emir,
+trailing ve tarama isteklerinin önüne geçmez; kuyruk / bekleme metrikleri /ratelimit/stats.
 """
 
-from datetime import date
+import asyncio
+import json
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
-from fastapi import APIRouter, HTTPException
+from ..response_cache import ResponseCache
 
 router = APIRouter()
 
-# Lazy singletons (config/exchange/state ilk istekte yüklenir)
-_exchange = None
+# Endpoint başına (ttl, stale) saniye: ttl içinde cache'ten, sonraki stale süresinde eski değer
+# dönerken arka planda yenilenir
+_CACHE_TTLS = {
+    "positions": (2.0, 10.0),
+    "ticker": (1.0, 5.0),
+    "balance": (5.0, 30.0),
+}
+_cache = ResponseCache()
+
+# Lazy singleton (state ilk istekte yüklenir)
 _state = None
 
 
 def _get_exchange():
-    global _exchange
-    if _exchange is None:
-        try:
-            from exchanges.factory import get_exchange
-            _exchange = get_exchange()
-        except Exception as e:
-            raise HTTPException(status_code=503, detail=f"Exchange init failed: {e}")
-    return _exchange
+    """Engine ile paylaşılan exchange (exchanges/registry.py): tek client, paper'da aynı defter."""
+    try:
+        from exchanges.registry import shared_exchange
+        return shared_exchange()
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Exchange init failed: {e}")
 
 
 def _get_state():
@@ -37,6 +54,18 @@ def _get_state():
     return _state
 
 
+def _cached(endpoint: str, loader, *args: Any) -> Any:
+    from exchanges.rate_limiter import Priority, request_priority
+
+    def load() -> Any:
+        # Arka plan yenilemesi ayrı thread'de çalışır: öncelik loader'ın içinde verilir
+        with request_priority(Priority.UI):
+            return loader()
+
+    ttl, stale = _CACHE_TTLS[endpoint]
+    return _cache.get((endpoint,) + args, load, ttl, stale)
+
+
 @router.get("/stats")
 def get_stats() -> dict:
     """İstatistik snapshot (get_snapshot)."""
@@ -52,8 +81,7 @@ def get_stats() -> dict:
 def get_positions(symbol: Optional[str] = None) -> List[dict]:
     """Açık pozisyonlar."""
     try:
-        ex = _get_exchange()
-        return ex.get_positions(symbol)
+        return _cached("positions", lambda: _get_exchange().get_positions(symbol), symbol)
     except HTTPException:
         raise
     except Exception as e:
@@ -64,25 +92,27 @@ def get_positions(symbol: Optional[str] = None) -> List[dict]:
 def get_ticker(symbol: str = "BTC/USDT") -> dict:
     """Son fiyat (last, bid, ask)."""
     try:
-        ex = _get_exchange()
-        return ex.get_ticker(symbol)
+        return _cached("ticker", lambda: _get_exchange().get_ticker(symbol), symbol)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_EVENT_LOGS = ("trades", "signals", "trailing")
+
+
 def _read_log_lines(log_name: str, limit: int = 100) -> List[str]:
-    """logs/{log_name}_YYYY-MM-DD.log son limit satır."""
+    """logs/{log_name}_YYYY-MM-DD.log son limit satır (dosyanın sonundan okunur)."""
     try:
+        from stats.event_log import tail_lines
         from stats.trade_logger import _log_dir
         d = _log_dir()
         today = date.today().isoformat()
         path = d / f"{log_name}_{today}.log"
         if not path.exists():
             return []
-        lines = path.read_text(encoding="utf-8").strip().split("\n")
-        return lines[-limit:] if len(lines) > limit else lines
+        return tail_lines(path, limit)
     except Exception:
         return []
 
@@ -102,21 +132,117 @@ def get_trailing_log(limit: int = 100) -> List[str]:
     return _read_log_lines("trailing", limit)
 
 
+@router.get("/events/{log_name}")
+def get_events(
+    log_name: str,
+    limit: int = Query(100, ge=1, le=1000),
+    symbol: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    days: int = Query(7, ge=1, le=366),
+) -> dict:
+    """
+    JSONL olayları (en yeniden eskiye). Sonraki sayfa için dönen next_cursor gönderilir.
+    log_name: trades | signals | trailing
+    """
+    if log_name not in _EVENT_LOGS:
+        raise HTTPException(status_code=404, detail=f"Bilinmeyen log: {log_name}")
+    try:
+        from stats.event_log import query_events
+        from stats.trade_logger import _log_dir
+        return query_events(
+            _log_dir(), log_name, limit=limit, symbol=symbol, since=since, until=until, cursor=cursor, days=days
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/last_signal")
 def get_last_signal() -> dict:
-    """Son sinyal (signals log son satırından)."""
+    """Son sinyal (signals olay log'unun son kaydından)."""
     lines = _read_log_lines("signals", limit=1)
     if not lines:
         return {"direction": None, "symbol": None, "raw": None}
-    return {"raw": lines[-1], "direction": None, "symbol": None}
+    try:
+        from stats.event_log import query_events
+        from stats.trade_logger import _log_dir
+        events = query_events(_log_dir(), "signals", limit=1, days=1)["events"]
+    except Exception:
+        events = []
+    last = events[0] if events else {}
+    return {"raw": lines[-1], "direction": last.get("direction"), "symbol": last.get("symbol")}
+
+
+_STREAM_KEEPALIVE = 15.0
+
+
+def _sse(event: Dict[str, Any]) -> str:
+    data = json.dumps(event, default=str, separators=(",", ":"))
+    return f"id: {event.get('seq', 0)}\nevent: {event['topic']}\ndata: {data}\n\n"
+
+
+@router.get("/stream")
+async def stream(request: Request, topics: Optional[str] = None) -> StreamingResponse:
+    """
+    Server-Sent Events. Bağlanınca önce güncel durum (stats.snapshot, açık pozisyonlar, son stop ve
+    fiyatlar), sonra olaylar: position.opened, position.closed, stop.moved, ticker, stats.
+    topics: virgüllü topic önekleri (örn. "position,stop"); boş = hepsi.
+    """
+    from core.events import get_event_bus
+
+    bus = get_event_bus()
+    prefixes = [t.strip() for t in topics.split(",") if t.strip()] if topics else None
+    # Önce abone ol: anlık durum gönderilirken gelen olaylar kaçmaz
+    sub = bus.subscribe(prefixes)
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            if sub.matches("stats.snapshot"):
+                try:
+                    from stats.statistics import get_snapshot
+                    snapshot = await asyncio.to_thread(get_snapshot, _get_state())
+                    yield _sse({"seq": 0, "topic": "stats.snapshot", "data": snapshot})
+                except Exception:
+                    pass
+            for event in bus.retained(prefixes):
+                yield _sse(event)
+            while not await request.is_disconnected():
+                event = await sub.get(timeout=_STREAM_KEEPALIVE)
+                yield ": keepalive\n\n" if event is None else _sse(event)
+        finally:
+            sub.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/balance")
 def get_balance() -> dict:
     try:
-        ex = _get_exchange()
-        return {"balance": ex.get_balance()}
+        return {"balance": _cached("balance", lambda: _get_exchange().get_balance())}
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/cache/stats")
+def get_cache_stats() -> dict:
+    """Dashboard response cache sayaçları (endpoint başına hits, stale, misses, coalesced, errors)."""
+    return _cache.stats()
+
+
+@router.get("/ratelimit/stats")
+def get_rate_limit_stats() -> dict:
+    """Paylaşılan rate limiter: bucket durumu, öncelik sınıfı başına kuyruk derinliği ve bekleme süreleri."""
+    try:
+        from exchanges.registry import get_registry
+        return get_registry().limiter().stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,8 +1,10 @@
 """
 Engine kontrol API - start / stop / status.
-Engine aynı process içinde background thread'de çalışır.
+Engine aynı process içinde çalışır: background thread'de (varsayılan) veya engine.async_mode
+açıksa API'nin event loop'unda asyncio task olarak.
 """
 
+import asyncio
 import threading
 from typing import Optional
 
@@ -12,6 +14,8 @@ router = APIRouter()
 
 _engine_thread: Optional[threading.Thread] = None
 _engine_stop_event: Optional[threading.Event] = None
+_engine_task: Optional[asyncio.Task] = None
+_engine_async_stop: Optional[asyncio.Event] = None
 _engine_interval: int = 60
 
 
@@ -21,35 +25,79 @@ def _run_engine_thread() -> None:
     run_engine(interval_seconds=_engine_interval, stop_event=_engine_stop_event)
 
 
-@router.post("/engine/start")
-def engine_start(interval_seconds: int = 60) -> dict:
-    """Trading engine'i arka planda başlatır. Zaten çalışıyorsa 409."""
-    global _engine_thread, _engine_stop_event, _engine_interval
+def _async_mode_from_config() -> bool:
+    try:
+        from core.config_manager import get_config
+        return bool(get_config().get("engine.async_mode"))
+    except Exception:
+        return False
+
+
+def _running_mode() -> Optional[str]:
+    """Çalışan engine'in modu: 'thread' | 'async' | None."""
     if _engine_thread is not None and _engine_thread.is_alive():
+        return "thread"
+    if _engine_task is not None and not _engine_task.done():
+        return "async"
+    return None
+
+
+@router.post("/engine/start")
+async def engine_start(interval_seconds: int = 60, async_mode: Optional[bool] = None) -> dict:
+    """
+    Trading engine'i arka planda başlatır. Zaten çalışıyorsa 409.
+    async_mode: None ise config'ten engine.async_mode.
+    """
+    global _engine_thread, _engine_stop_event, _engine_task, _engine_async_stop, _engine_interval
+    if _running_mode() is not None:
         raise HTTPException(status_code=409, detail="Engine already running")
     _engine_interval = max(30, min(300, int(interval_seconds)))
-    _engine_stop_event = threading.Event()
-    _engine_thread = threading.Thread(target=_run_engine_thread, daemon=True)
-    _engine_thread.start()
-    return {"status": "started", "interval_seconds": _engine_interval}
+    if async_mode is None:
+        async_mode = _async_mode_from_config()
+    if async_mode:
+        from engine.async_loop import run_engine_async
+        _engine_async_stop = asyncio.Event()
+        _engine_task = asyncio.get_running_loop().create_task(
+            run_engine_async(interval_seconds=_engine_interval, stop_event=_engine_async_stop)
+        )
+    else:
+        _engine_stop_event = threading.Event()
+        _engine_thread = threading.Thread(target=_run_engine_thread, daemon=True)
+        _engine_thread.start()
+    return {
+        "status": "started",
+        "interval_seconds": _engine_interval,
+        "mode": "async" if async_mode else "thread",
+    }
 
 
 @router.post("/engine/stop")
-def engine_stop() -> dict:
+async def engine_stop() -> dict:
     """Trading engine'i durdurur."""
-    global _engine_thread, _engine_stop_event
-    if _engine_stop_event is None:
+    global _engine_thread, _engine_stop_event, _engine_task, _engine_async_stop
+    if _engine_stop_event is None and _engine_async_stop is None:
         return {"status": "stopped", "message": "was not running"}
-    _engine_stop_event.set()
-    if _engine_thread is not None:
-        _engine_thread.join(timeout=15)
+    if _engine_stop_event is not None:
+        _engine_stop_event.set()
+        if _engine_thread is not None:
+            await asyncio.to_thread(_engine_thread.join, 15)
+    if _engine_async_stop is not None:
+        _engine_async_stop.set()
+        if _engine_task is not None:
+            try:
+                await asyncio.wait_for(_engine_task, timeout=15)
+            except Exception:
+                _engine_task.cancel()
     _engine_thread = None
     _engine_stop_event = None
+    _engine_task = None
+    _engine_async_stop = None
     return {"status": "stopped"}
 
 
 @router.get("/engine/status")
 def engine_status() -> dict:
     """Engine çalışıyor mu?"""
-    running = _engine_thread is not None and _engine_thread.is_alive()
-    return {"running": running, "interval_seconds": _engine_interval if running else None}
+    mode = _running_mode()
+    running = mode is not None
+    return {"running": running, "interval_seconds": _engine_interval if running else None, "mode": mode}
@@ -3,21 +3,215 @@ Config Manager - Config dosyasını yönetir ve yükler.
 Storage + Pydantic şema kullanır; yol paths modülünden gelir (AppData / proje config).
 Mevcut get/set/save/get_all API'si korunur.
 
+Okuma için get_config(): süreç genelinde paylaşılan, değişmez ConfigSnapshot. Dosya sadece
+mtime/boyut değişince yeniden okunup doğrulanır; yeni snapshot tek atama ile değiştirilir
+(eski snapshot'ı tutan kod tutarlı config görmeye devam eder). pinned_config ile bir engine
+döngüsü boyunca get_config() aynı snapshot'ı döndürür. ConfigManager (set/save) düzenleme içindir.
+subscribe_config ile yeni snapshot yüklendiğinde haber alınır (bkz. core/config_watch.py).
+
 Kullanım:
-    from core.config_manager import ConfigManager
+    from core.config_manager import ConfigManager, get_config
+
+    timeframe = get_config().get('strategy.timeframe')
+    risk = get_config().account.risk_percent      # tipli erişim (AppConfig alt modelleri)
 
     config = ConfigManager()
-    exchange_name = config.get('exchange.name')
+    config.set('exchange.testnet', False)
+    config.save()
 """
 
+import copy
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from core.paths import get_config_path
-from core.config_schema import AppConfig
+from core.config_schema import (
+    AccountConfig,
+    AppConfig,
+    EngineConfig,
+    ExchangeConfig,
+    LoggingConfig,
+    StrategyConfig,
+    SymbolsConfig,
+    TelegramConfig,
+)
 from storage.config_storage import ConfigStorage
 
 
+class ConfigSnapshot:
+    """
+    Belirli bir anda okunmuş, doğrulanmış config (değiştirilmemeli).
+    get(): ConfigManager.get ile aynı nokta notasyonu; dict/list değerler kopya döner.
+    exchange, account, ... : tipli AppConfig alt modelleri. Dosya yoksa get() default döner,
+    tipli erişim FileNotFoundError fırlatır.
+    """
+
+    __slots__ = ("path", "stamp", "model", "_data")
+
+    def __init__(self, path: Path, stamp: Optional[Tuple[int, int]], model: Optional[AppConfig]):
+        self.path = path
+        self.stamp = stamp  # (mtime_ns, size); dosya yoksa None
+        self.model = model
+        self._data: Dict[str, Any] = model.model_dump() if model is not None else {}
+
+    @property
+    def exists(self) -> bool:
+        return self.stamp is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value: Any = self._data
+        for k in key.split("."):
+            if isinstance(value, dict) and k in value:
+                value = value[k]
+            else:
+                return default
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Tüm config (derin kopya)."""
+        return copy.deepcopy(self._data)
+
+    def _require(self) -> AppConfig:
+        if self.model is None:
+            raise FileNotFoundError(f"Config dosyası bulunamadı: {self.path}")
+        return self.model
+
+    @property
+    def exchange(self) -> ExchangeConfig:
+        return self._require().exchange
+
+    @property
+    def account(self) -> AccountConfig:
+        return self._require().account
+
+    @property
+    def symbols(self) -> SymbolsConfig:
+        return self._require().symbols
+
+    @property
+    def strategy(self) -> StrategyConfig:
+        return self._require().strategy
+
+    @property
+    def engine(self) -> EngineConfig:
+        return self._require().engine
+
+    @property
+    def logging(self) -> LoggingConfig:
+        return self._require().logging
+
+    @property
+    def telegram(self) -> TelegramConfig:
+        return self._require().telegram
+
+
+_snapshots: Dict[Path, ConfigSnapshot] = {}
+_snapshots_lock = threading.Lock()
+_pinned: ContextVar[Optional[ConfigSnapshot]] = ContextVar("pinned_config", default=None)
+# (eski snapshot veya None, yeni snapshot)
+ConfigListener = Callable[[Optional[ConfigSnapshot], ConfigSnapshot], None]
+_listeners: List[ConfigListener] = []
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def get_config(config_path: Optional[str] = None) -> ConfigSnapshot:
+    """
+    Paylaşılan config snapshot'ı. Dosya sadece mtime/boyut değişince yeniden okunur.
+    Okuma/doğrulama başarısızsa (ör. dosya yazılırken) önceki snapshot kullanılır.
+    pinned_config içinde (config_path verilmezse) sabitlenen snapshot döner.
+    """
+    if config_path is None:
+        pinned = _pinned.get()
+        if pinned is not None:
+            return pinned
+    path = Path(config_path) if config_path else get_config_path()
+    stamp = _file_stamp(path)
+    snapshot = _snapshots.get(path)
+    if snapshot is not None and snapshot.stamp == stamp:
+        return snapshot
+    with _snapshots_lock:
+        snapshot = _snapshots.get(path)
+        if snapshot is not None and snapshot.stamp == stamp:
+            return snapshot
+        if stamp is None:
+            fresh = ConfigSnapshot(path, None, None)
+        else:
+            try:
+                fresh = ConfigSnapshot(path, stamp, ConfigStorage(path).load())
+            except Exception:
+                if snapshot is not None and snapshot.exists:
+                    return snapshot
+                raise
+        _snapshots[path] = fresh
+    _notify(snapshot, fresh)
+    return fresh
+
+
+def subscribe_config(listener: ConfigListener) -> Callable[[], None]:
+    """
+    Yeni snapshot yüklendiğinde listener(old, new) çağrılır (yükleyen thread'de, kilit dışında).
+    Dönen fonksiyon aboneliği iptal eder.
+    """
+    with _snapshots_lock:
+        _listeners.append(listener)
+
+    def unsubscribe() -> None:
+        with _snapshots_lock:
+            if listener in _listeners:
+                _listeners.remove(listener)
+
+    return unsubscribe
+
+
+def _notify(old: Optional[ConfigSnapshot], new: ConfigSnapshot) -> None:
+    with _snapshots_lock:
+        listeners = list(_listeners)
+    for listener in listeners:
+        try:
+            listener(old, new)
+        except Exception:
+            pass
+
+
+def invalidate_config(config_path: Optional[str] = None) -> None:
+    """Cache'lenmiş snapshot'ı eskimiş işaretler (config kaydedildikten sonra); sonraki get_config dosyayı okur."""
+    path = Path(config_path) if config_path else get_config_path()
+    with _snapshots_lock:
+        snapshot = _snapshots.get(path)
+        if snapshot is not None and snapshot.exists:
+            # Eşleşmeyen damga: okuma başarısız olursa bu snapshot yine yedek olarak kullanılır
+            snapshot.stamp = (-1, -1)
+        else:
+            _snapshots.pop(path, None)
+
+
+@contextmanager
+def pinned_config(snapshot: Optional[ConfigSnapshot] = None) -> Iterator[ConfigSnapshot]:
+    """
+    Blok boyunca get_config() aynı snapshot'ı döndürür (bir engine döngüsü tutarlı config görür).
+    contextvars ile: asyncio task'ları ve asyncio.to_thread devralır; ThreadPoolExecutor'a
+    copy_context().run ile geçirilmeli.
+    """
+    snapshot = snapshot if snapshot is not None else get_config()
+    token = _pinned.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _pinned.reset(token)
+
+
 class ConfigManager:
     """Config dosyasını yönetir (storage + şema doğrulama)."""
 
@@ -35,14 +229,18 @@ class ConfigManager:
             self.load()
 
     def load(self) -> None:
-        """Config dosyasını yükler ve şema ile doğrular."""
+        """Config dosyasını yükler ve şema ile doğrular (paylaşılan snapshot'tan; değişmediyse disk okunmaz)."""
         if not self._storage.exists():
             raise FileNotFoundError(
                 f"Config dosyası bulunamadı: {self.config_path}\n"
                 "İlk çalıştırmada Setup ekranından ayarları yapın veya config örneğini kopyalayın."
             )
-        config = self._storage.load()
-        self._config = config.model_dump()
+        snapshot = get_config(str(self.config_path))
+        if not snapshot.exists:
+            # Dosya stat ile exists arasında silindi: eski davranış (doğrudan okuma, hata fırlatır)
+            self._config = self._storage.load().model_dump()
+            return
+        self._config = snapshot.as_dict()
 
     def get(self, key: str, default: Any = None) -> Any:
         """
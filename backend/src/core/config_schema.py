@@ -14,6 +14,8 @@ class ExchangeConfig(BaseModel):
     api_secret: str = ""
     testnet: bool = True
     paper_trade: bool = True
+    # None = borsanın varsayılanı (exchanges/rate_limiter.py: binance 2400, mexc 600)
+    rate_limit_weight_per_minute: Optional[int] = Field(None, ge=60, description="Dakikalık istek ağırlığı limiti")
 
 
 class AccountConfig(BaseModel):
@@ -48,10 +50,13 @@ class TrailingConfig(BaseModel):
     atr_period: int = 14
     atr_multiplier: float = 1.0
     break_even_r: float = 1.0
+    exchange_stop: bool = Field(True, description="Stop borsada reduce-only STOP_MARKET order olarak da tutulur")
+    amend_min_ticks: int = Field(5, ge=0, description="Borsa stop'u en az bu kadar fiyat adımı ilerleyince güncellenir")
 
 
 class StrategyConfig(BaseModel):
     timeframe: str = "15m"
+    indicator_backend: str = Field("numpy", description="numpy | pandas")
     trend_filter: TrendFilterConfig = Field(default_factory=TrendFilterConfig)
     entry: EntryConfig = Field(default_factory=EntryConfig)
     stop: StopConfig = Field(default_factory=StopConfig)
@@ -63,6 +68,17 @@ class SymbolsConfig(BaseModel):
     manual_list: List[str] = Field(default_factory=lambda: ["BTC/USDT"])
 
 
+class EngineConfig(BaseModel):
+    scan_workers: int = Field(4, ge=1, le=32, description="Sinyal taramasında eşzamanlı sembol sayısı (1 = sıralı)")
+    async_mode: bool = Field(False, description="True: engine API event loop'unda asyncio task olarak çalışır")
+    bar_close_schedule: bool = Field(True, description="Sinyal mum kapanışında; False: sabit interval_seconds")
+    trailing_interval_seconds: float = Field(10.0, ge=1, le=300, description="Bar kapanışı modunda trailing aralığı")
+    bar_close_delay_seconds: float = Field(2.0, ge=0, le=60, description="Kapanıştan sonra bar'ın yayınlanması için bekleme")
+    trailing_monitor: bool = Field(True, description="Trailing stop sinyal döngüsünden ayrı, sık kontrol edilir")
+    trailing_monitor_seconds: float = Field(1.5, ge=0.5, le=30, description="Trailing monitor kontrol aralığı")
+    intrabar_check: bool = Field(True, description="Kontroller arası stop'a değen fitiller 1m mumlardan tespit edilir")
+
+
 class LoggingConfig(BaseModel):
     level: str = "INFO"
     log_dir: Optional[str] = None  # None = paths.get_log_dir() kullanılır
@@ -81,6 +97,7 @@ class AppConfig(BaseModel):
     account: AccountConfig = Field(default_factory=AccountConfig)
     symbols: SymbolsConfig = Field(default_factory=SymbolsConfig)
     strategy: StrategyConfig = Field(default_factory=StrategyConfig)
+    engine: EngineConfig = Field(default_factory=EngineConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     telegram: TelegramConfig = Field(default_factory=TelegramConfig)
 
@@ -0,0 +1,115 @@
+"""
+Config Watch - Çalışan engine'e config değişikliklerini döngü sınırında ulaştırır.
+
+ConfigWatcher subscribe_config ile yeni snapshot'lardan haberdar olur (API PUT /api/config
+kaydettikten sonra hemen, dosya elle değiştiyse sonraki get_config çağrısında). Engine her döngü
+başında poll() çağırır: uygulanan snapshot ile en yenisi arasındaki fark (ConfigChange) döner,
+engine sadece etkilenen kısımları (risk, sembol listesi, cache'ler, exchange) yeniler.
+
+Kullanım:
+    watcher = ConfigWatcher()
+    change = watcher.poll()                      # değişiklik yoksa None
+    if change is not None and change.touches("strategy.entry"):
+        ...
+    with pinned_config(watcher.snapshot):
+        ...
+    watcher.close()
+"""
+
+import threading
+from typing import Any, Dict, FrozenSet, Optional
+
+from core.config_manager import ConfigSnapshot, get_config, subscribe_config
+
+
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """İç içe dict -> {'a.b.c': değer} (liste değerler tek yaprak)."""
+    out: Dict[str, Any] = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            out.update(_flatten(value, path + "."))
+        else:
+            out[path] = value
+    return out
+
+
+class ConfigChange:
+    """İki snapshot arasındaki fark: changed = değişen yaprak anahtarlar ('strategy.entry.ema_period')."""
+
+    __slots__ = ("old", "new", "changed")
+
+    def __init__(self, old: ConfigSnapshot, new: ConfigSnapshot, changed: FrozenSet[str]):
+        self.old = old
+        self.new = new
+        self.changed = changed
+
+    def touches(self, *prefixes: str) -> bool:
+        """Verilen anahtarlardan (veya altlarından) biri değiştiyse True."""
+        for key in self.changed:
+            for prefix in prefixes:
+                if key == prefix or key.startswith(prefix + "."):
+                    return True
+        return False
+
+    def __bool__(self) -> bool:
+        return bool(self.changed)
+
+    def __repr__(self) -> str:
+        return f"ConfigChange({sorted(self.changed)})"
+
+
+def diff_config(old: ConfigSnapshot, new: ConfigSnapshot) -> ConfigChange:
+    """Yaprak bazında karşılaştırır; sadece bir tarafta olan anahtarlar da değişmiş sayılır."""
+    a = _flatten(old.as_dict())
+    b = _flatten(new.as_dict())
+    changed = frozenset(k for k in a.keys() | b.keys() if a.get(k) != b.get(k) or (k in a) != (k in b))
+    return ConfigChange(old, new, changed)
+
+
+class ConfigWatcher:
+    """Config değişikliklerini biriktirir; engine döngü sınırında poll() ile uygular."""
+
+    def __init__(self, config_path: Optional[str] = None):
+        self._config_path = config_path
+        self._lock = threading.Lock()
+        self._applied = get_config(config_path)
+        self._latest: Optional[ConfigSnapshot] = None
+        self._unsubscribe = subscribe_config(self._on_config)
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Engine'e uygulanmış son snapshot."""
+        return self._applied
+
+    @property
+    def pending(self) -> bool:
+        """Henüz uygulanmamış yeni snapshot var mı."""
+        with self._lock:
+            return self._latest is not None
+
+    def _on_config(self, old: Optional[ConfigSnapshot], new: ConfigSnapshot) -> None:
+        if new.path != self._applied.path:
+            return
+        with self._lock:
+            self._latest = new
+
+    def poll(self) -> Optional[ConfigChange]:
+        """
+        Uygulanandan farklı yeni snapshot varsa farkı döndürür ve onu uygulanmış sayar; yoksa None.
+        Dosya elle değiştiyse buradaki get_config çağrısı yeniden yükler (abonelere bildirilir).
+        """
+        try:
+            get_config(self._config_path)
+        except Exception:
+            pass
+        with self._lock:
+            latest, self._latest = self._latest, None
+        if latest is None or latest is self._applied:
+            return None
+        change = diff_config(self._applied, latest)
+        self._applied = latest
+        return change if change else None
+
+    def close(self) -> None:
+        self._unsubscribe()
@@ -0,0 +1,141 @@
+"""
+Event Bus - Engine olaylarını (pozisyon açıldı/kapandı, stop taşındı, istatistik, fiyat) API'ye iletir.
+
+Engine herhangi bir thread'den publish() çağırır; çağrı bloklamaz (abone kuyruğuna
+call_soon_threadsafe ile bırakılır). Dashboard stream endpoint'i her istemci için bir Subscription
+açar; istemci sayısı borsaya giden istek sayısını değiştirmez.
+
+key verilen olaylar (topic, key) başına saklanır (retained): yeni bağlanan istemci önce açık
+pozisyonlar, son stop'lar ve fiyatlar gibi güncel durumu alır. forget() ile silinir.
+
+Yavaş istemci: kuyruğu dolunca en eski olay atılır ve Subscription.dropped artar; engine beklemez.
+
+Topic'ler:
+    position.opened  (key=symbol)  position.closed  stop.moved (key=symbol)  ticker (key=symbol)  stats
+
+Kullanım:
+    publish("stop.moved", {"symbol": "BTC/USDT", "stop": 101.5}, key="BTC/USDT")
+
+    sub = get_event_bus().subscribe(["position", "stop"])   # event loop içinde
+    event = await sub.get(timeout=15)                       # {"seq", "ts", "topic", "data"} veya None
+    sub.close()
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+Event = Dict[str, Any]
+
+
+def _matches(topic: str, prefixes: Optional[Tuple[str, ...]]) -> bool:
+    if not prefixes:
+        return True
+    return any(topic == p or topic.startswith(p + ".") for p in prefixes)
+
+
+class Subscription:
+    """Tek istemcinin olay kuyruğu (oluşturulduğu event loop'a bağlı)."""
+
+    def __init__(self, bus: "EventBus", topics: Optional[Iterable[str]], maxsize: int):
+        self._bus = bus
+        self._loop = asyncio.get_running_loop()
+        self.topics: Optional[Tuple[str, ...]] = tuple(topics) if topics else None
+        self.queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize=max(1, int(maxsize)))
+        self.dropped = 0
+
+    def matches(self, topic: str) -> bool:
+        return _matches(topic, self.topics)
+
+    def _offer(self, event: Event) -> None:
+        """Herhangi bir thread'den çağrılır."""
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # Event loop kapanmış: istemci zaten gitti
+            self._bus._unsubscribe(self)
+
+    def _put(self, event: Event) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Event]:
+        """Sıradaki olay; timeout dolarsa None."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self._bus._unsubscribe(self)
+
+
+class EventBus:
+    """Thread-safe publish / async subscribe; key'li olayların son hali saklanır."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+        self._subscribers: List[Subscription] = []
+        self._retained: Dict[Tuple[str, str], Event] = {}
+
+    def publish(self, topic: str, data: Dict[str, Any], key: Optional[str] = None) -> Event:
+        """Olayı abonelere iletir; key verilirse (topic, key) için saklar."""
+        with self._lock:
+            event = {"seq": next(self._seq), "ts": int(time.time() * 1000), "topic": topic, "data": data}
+            if key is not None:
+                self._retained[(topic, key)] = event
+            subscribers = [s for s in self._subscribers if s.matches(topic)]
+        for sub in subscribers:
+            sub._offer(event)
+        return event
+
+    def forget(self, topic: str, key: str) -> None:
+        """Saklanan olayı siler (örn. kapanan pozisyonun position.opened'ı)."""
+        with self._lock:
+            self._retained.pop((topic, key), None)
+
+    def retained(self, topics: Optional[Iterable[str]] = None) -> List[Event]:
+        """Saklanan olaylar (seq sırasıyla); yeni istemciye ilk durum olarak gönderilir."""
+        prefixes = tuple(topics) if topics else None
+        with self._lock:
+            events = [e for (topic, _), e in self._retained.items() if _matches(topic, prefixes)]
+        return sorted(events, key=lambda e: e["seq"])
+
+    def subscribe(self, topics: Optional[Iterable[str]] = None, maxsize: int = 256) -> Subscription:
+        """Çalışan event loop'a bağlı abonelik. topics: topic önekleri ('position' -> position.*); None = hepsi."""
+        sub = Subscription(self, topics, maxsize)
+        with self._lock:
+            self._subscribers.append(sub)
+        return sub
+
+    def _unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def clear(self) -> None:
+        """Saklanan durumu siler (engine yeniden başlarken)."""
+        with self._lock:
+            self._retained.clear()
+
+
+_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Süreç genelinde paylaşılan bus (engine ve API aynı süreçte)."""
+    return _bus
+
+
+def publish(topic: str, data: Dict[str, Any], key: Optional[str] = None) -> Event:
+    return _bus.publish(topic, data, key)
@@ -67,6 +67,20 @@ def get_log_dir() -> Path:
         return log_dir
 
 
+def get_data_dir() -> Path:
+    """
+    Veri dizini (cache'ler, ledger).
+    Production: AppData/Local/winnertrade/data
+    Geliştirme: backend/data (proje içi)
+    """
+    if _is_frozen():
+        data_dir = get_app_data_root() / "data"
+    else:
+        data_dir = Path(__file__).resolve().parent.parent.parent / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
+
+
 def ensure_app_data_dir() -> Path:
     """AppData winnertrade dizinini oluşturur; config yoksa first-run için hazırlar."""
     root = get_app_data_root()
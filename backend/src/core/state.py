@@ -53,8 +53,8 @@ class AppState:
         self.day_r += r_value
         
         # Günlük limit kontrolü
-        from core.config_manager import ConfigManager
-        config = ConfigManager()
+        from core.config_manager import get_config
+        config = get_config()
         daily_limit = config.get('account.daily_r_limit', -3.0)
         
         if self.day_r <= daily_limit:
@@ -0,0 +1,32 @@
+"""
+Timeframe yardımcıları - ccxt timeframe string'ini (15m, 1h, 1d ...) milisaniyeye çevirir.
+
+Kullanım:
+    from core.timeframes import timeframe_to_ms
+
+    timeframe_to_ms("15m")  # 900000
+"""
+
+_UNIT_MS = {
+    "s": 1000,
+    "m": 60 * 1000,
+    "h": 60 * 60 * 1000,
+    "d": 24 * 60 * 60 * 1000,
+    "w": 7 * 24 * 60 * 60 * 1000,
+}
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    """
+    Timeframe süresini milisaniye olarak döndürür.
+
+    Args:
+        timeframe: 1m, 5m, 15m, 1h, 4h, 1d, 1w
+
+    Returns:
+        Bar süresi (ms). Geçersiz timeframe için ValueError.
+    """
+    tf = str(timeframe).strip()
+    if len(tf) < 2 or tf[-1] not in _UNIT_MS or not tf[:-1].isdigit():
+        raise ValueError(f"Geçersiz timeframe: {timeframe}")
+    return int(tf[:-1]) * _UNIT_MS[tf[-1]]
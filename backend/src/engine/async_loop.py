@@ -0,0 +1,609 @@
+"""
+Async Trading Engine Loop - engine/loop.py'nin asyncio karşılığı.
+
+Bir döngüde gereken tüm piyasa verisi (açık pozisyonların fiyatları, entry timeframe mumları,
+cache'te olmayan günlük trend mumları) tek seferde ve aynı anda istenir; ardından loop.py ile
+aynı strateji/risk/trailing mantığı bu veriler üzerinde çalışır. Emirler ve tracked güncellemesi
+sembol sırasıyla, tek tek gönderilir.
+
+FastAPI event loop'unda task olarak çalışır (ayrı thread gerekmez):
+    stop_event = asyncio.Event()
+    task = asyncio.get_running_loop().create_task(run_engine_async(60, stop_event))
+
+Trade kaydı (SQLite ledger, log dosyaları) ve Telegram bildirimi bloklayan I/O'dur: _record_close
+ve açılış bildirimi asyncio.to_thread ile çalışır; /health ve SSE stream'i beklemez.
+
+Test için sahte borsa (scripts/fake_exchange.py; smoke testi: python scripts/fake_exchange.py):
+    run_engine_async(exchange=AsyncExchangeAdapter(PaperTrader(1000, data_exchange=FakeExchange())))
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from core.config_manager import get_config, pinned_config
+    from core.config_watch import ConfigWatcher
+    from core.events import get_event_bus
+    from core.logger import get_logger
+    from core.state import AppState
+    from core.timeframes import timeframe_to_ms
+    from exchanges.async_base_exchange import AsyncBaseExchange
+    from exchanges.registry import shared_async_exchange
+    from exchanges.rate_limiter import Priority, request_priority, request_weight
+    from strategy import MarketSnapshot, peek_daily_trend
+    from strategy.trend_filter import drop_forming_bar
+    from risk import RiskManager, can_open_trade
+    from execution import open_position, close_position, TrailingMonitor, trailing_update
+    from execution import publish_marks, publish_stop
+    from execution import place_stop_loss, amend_stop_loss, cancel_stop_loss
+    from execution import amend_target, stop_fill_price, stop_order_open
+    from execution import close_position_at, intrabar_requests, replay_stops
+    from execution import PositionBook
+    from stats import flush_logs
+except ImportError:
+    from ..core.config_manager import get_config, pinned_config
+    from ..core.config_watch import ConfigWatcher
+    from ..core.events import get_event_bus
+    from ..core.logger import get_logger
+    from ..core.state import AppState
+    from ..core.timeframes import timeframe_to_ms
+    from ..exchanges.async_base_exchange import AsyncBaseExchange
+    from ..exchanges.registry import shared_async_exchange
+    from ..exchanges.rate_limiter import Priority, request_priority, request_weight
+    from ..strategy import MarketSnapshot, peek_daily_trend
+    from ..strategy.trend_filter import drop_forming_bar
+    from ..risk import RiskManager, can_open_trade
+    from ..execution import open_position, close_position, TrailingMonitor, trailing_update
+    from ..execution import publish_marks, publish_stop
+    from ..execution import place_stop_loss, amend_stop_loss, cancel_stop_loss
+    from ..execution import amend_target, stop_fill_price, stop_order_open
+    from ..execution import close_position_at, intrabar_requests, replay_stops
+    from ..execution import PositionBook
+    from ..stats import flush_logs
+
+from .loop import (
+    _apply_config_change,
+    _amend_min_ticks,
+    _build_scheduler,
+    _build_trailing_monitor,
+    _ccxt_connector,
+    _cycle_settings,
+    _decide_entry,
+    _intrabar_enabled,
+    _manual_symbols,
+    _notify_open,
+    _order_fill_price,
+    _position_quantity,
+    _record_close,
+    _record_open,
+    _refresh_trailing_atr,
+    _set_exchange_stop,
+    _setup_engine_logger,
+    _top_symbols_from_tickers,
+)
+from .scheduler import BarCloseScheduler
+
+logger = get_logger(__name__)
+
+# build_market_snapshot ve get_daily_trend varsayılan mum sayıları
+_ENTRY_LIMIT = 250
+_TREND_LIMIT = 300
+
+
+class _PrefetchedKlines:
+    """
+    Döngü başında async çekilen mumları sync get_klines arayüzüyle sunar; strateji fonksiyonları
+    (get_entry_signal / get_daily_trend) bu nesneyi exchange olarak okur, I/O yapılmaz.
+    """
+
+    def __init__(self, klines: Dict[Tuple[str, str], List[List[Any]]]):
+        self._klines = klines
+
+    def get_klines(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 500,
+        since: Optional[int] = None,
+    ) -> List[List[Any]]:
+        ohlcv = self._klines.get((symbol, timeframe))
+        if ohlcv is None:
+            raise KeyError(f"Mum verisi yok: {symbol} {timeframe}")
+        return ohlcv[-limit:] if limit else ohlcv
+
+
+async def _get_symbols_async(exchange: AsyncBaseExchange) -> List[str]:
+    """loop._get_symbols karşılığı; top 10 için ccxt async client'ın fetch_tickers'ı kullanılır."""
+    manual = _manual_symbols()
+    if manual:
+        return manual
+    if get_config().get("symbols.auto_detect_top_10"):
+        try:
+            connector = _ccxt_connector(exchange)
+            if connector is not None:
+                limiter = getattr(connector, "_limiter", None)
+                if limiter is not None:
+                    await limiter.acquire_async(request_weight(connector, "tickers_24h"), Priority.SCAN)
+                top = _top_symbols_from_tickers(await connector._client.fetch_tickers(), limit=10)
+                if top:
+                    return top
+        except Exception as e:
+            logger.warning("Top sembol listesi alınamadı: %s", e)
+    return ["BTC/USDT"]
+
+
+async def _sync_clock_async(scheduler: BarCloseScheduler, exchange: AsyncBaseExchange) -> None:
+    """BarCloseScheduler.sync_clock karşılığı (async get_server_time)."""
+    sent_ms = scheduler.local_ms()
+    try:
+        server_ms = await exchange.get_server_time()
+    except Exception:
+        server_ms = None
+    scheduler.apply_server_time(server_ms, sent_ms, scheduler.local_ms())
+
+
+async def _get_tickers_safe(exchange: AsyncBaseExchange, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+    if not symbols:
+        return {}
+    try:
+        return await exchange.get_tickers(symbols)
+    except Exception as e:
+        logger.warning("Fiyatlar alınamadı: %s", e)
+        return {}
+
+
+def _evaluate_candidates(
+    data: _PrefetchedKlines,
+    candidates: List[str],
+    timeframe: str,
+    snapshots: Dict[str, MarketSnapshot],
+    now_ms: Optional[int] = None,
+) -> List[Tuple[str, str, float, float]]:
+    """
+    Önceden çekilmiş mumlarla sinyal + stop (CPU işi). Sonuçlar candidates sırasıyla döner.
+    now_ms verilirse sadece kapanmış barlar kullanılır (bar kapanışı modu).
+    """
+    results = []
+    for symbol in candidates:
+        try:
+            ohlcv = data.get_klines(symbol, timeframe, _ENTRY_LIMIT)
+            if now_ms is not None:
+                ohlcv = drop_forming_bar(ohlcv, timeframe, now_ms)
+            snapshot = MarketSnapshot(symbol, timeframe, ohlcv)
+            snapshots[symbol] = snapshot
+            decision = _decide_entry(data, symbol, timeframe, snapshot)
+        except Exception as e:
+            logger.warning("Sinyal değerlendirme hatası (%s): %s", symbol, e)
+            continue
+        if decision is not None:
+            results.append((symbol,) + decision)
+    return results
+
+
+async def _run_once_async(
+    exchange: AsyncBaseExchange,
+    state: AppState,
+    risk_manager: RiskManager,
+    symbols: List[str],
+    tracked: Dict[str, Dict[str, Any]],
+    scheduler: Optional[BarCloseScheduler] = None,
+    monitor: Optional[TrailingMonitor] = None,
+) -> None:
+    """
+    loop._run_once karşılığı; scheduler ve monitor davranışı aynı. monitor verilirse trailing
+    _run_trailing_monitor task'ında yapılır; burada sadece bar kapanışında ATR güncellenir.
+    """
+    timeframe, trailing_atr_period, _ = _cycle_settings()
+    trend_timeframe = get_config().get("strategy.trend_filter.timeframe") or "1d"
+
+    # Monitor açıksa trailing bu geçişte yapılmaz; sadece ATR'si eskiyen pozisyonların mumları çekilir
+    tracked_before = list(tracked.keys())
+    open_symbols = list(tracked_before) if monitor is None else []
+    candidates = [s for s in symbols if s not in tracked] if can_open_trade(state) else []
+    now_ms = None
+    if scheduler is not None:
+        scheduler.set_timeframe(timeframe)
+        candidates = scheduler.pending(candidates)
+        now_ms = scheduler.now_ms()
+    atr_symbols: List[str] = []
+    if monitor is not None:
+        tf_ms = timeframe_to_ms(timeframe)
+        closed_ts = (now_ms if now_ms is not None else int(time.time() * 1000)) // tf_ms * tf_ms - tf_ms
+        atr_symbols = [s for s in monitor.symbols() if monitor.needs_atr(s, closed_ts)]
+
+    # Tüm piyasa verisi aynı anda: fiyatlar + entry mumları + cache'te olmayan günlük trend mumları
+    requests = [(s, timeframe, _ENTRY_LIMIT) for s in open_symbols + atr_symbols + candidates]
+    requests += [
+        (s, trend_timeframe, _TREND_LIMIT) for s in candidates if peek_daily_trend(s, trend_timeframe) is None
+    ]
+    # Intrabar 1m mumları ayrı istek listesinde (entry timeframe 1m ise anahtarlar çakışmasın)
+    intrabar: List[Tuple[str, str, int, int]] = []
+    intrabar_now = now_ms if now_ms is not None else int(time.time() * 1000)
+    if tracked and _intrabar_enabled(exchange):
+        intrabar = intrabar_requests([(s, p) for s, p in tracked.items() if not p.get("busy")], intrabar_now)
+    tickers, klines, intrabar_klines = await asyncio.gather(
+        _get_tickers_safe(exchange, open_symbols),
+        exchange.get_klines_many(requests),
+        _get_klines_many_safe(exchange, intrabar),
+    )
+    publish_marks(tickers, open_symbols)
+    data = _PrefetchedKlines(klines)
+    snapshots: Dict[str, MarketSnapshot] = {}
+    for symbol in open_symbols:
+        if (symbol, timeframe) in klines:
+            snapshots[symbol] = MarketSnapshot(symbol, timeframe, klines[(symbol, timeframe)])
+
+    # 0) Kontroller arasında stop'a değen fitiller
+    if intrabar:
+        await _reconcile_intrabar_async(exchange, state, tracked, intrabar_klines, intrabar_now)
+        open_symbols = [s for s in open_symbols if s in tracked]
+
+    # 1) Açık pozisyonlar: trailing veya kapat
+    min_ticks = _amend_min_ticks()
+    for symbol in open_symbols:
+        pos = tracked[symbol]
+        try:
+            mark = float((tickers.get(symbol) or {}).get("last") or 0)
+            if mark <= 0:
+                continue
+            snapshot = snapshots.get(symbol)
+            atr = snapshot.atr(trailing_atr_period) if snapshot is not None else 0.0
+            old_stop = pos["trailing_state"].current_stop
+            should_close, new_stop = trailing_update(pos, mark, atr)
+            if should_close:
+                await _close_tracked_async(exchange, state, symbol, pos, mark, new_stop)
+                del tracked[symbol]
+                continue
+            if new_stop != old_stop:
+                publish_stop(symbol, pos, new_stop, mark)
+            target = amend_target(pos, min_ticks)
+            if target is not None:
+                await _amend_exchange_stop_async(exchange, symbol, pos, target)
+        except Exception as e:
+            logger.warning("Trailing hatası (%s): %s", symbol, e)
+
+    # 2) Yeni sinyal
+    await _open_new_positions_async(
+        exchange, state, risk_manager, symbols, tracked, tracked_before, candidates,
+        data, klines, snapshots, timeframe, trend_timeframe, scheduler, now_ms,
+        book=monitor.book if monitor is not None else None,
+    )
+
+    # 3) Monitor'ün kullandığı ATR (yeni açılanlar dahil; mumlar bu geçişte çekildi)
+    if monitor is not None:
+        refreshed = _refresh_trailing_atr(data, monitor, snapshots, timeframe, trailing_atr_period, now_ms)
+        await _reconcile_exchange_stops_async(exchange, state, monitor, refreshed)
+
+
+async def _open_new_positions_async(
+    exchange: AsyncBaseExchange,
+    state: AppState,
+    risk_manager: RiskManager,
+    symbols: List[str],
+    tracked: Dict[str, Dict[str, Any]],
+    open_symbols: List[str],
+    candidates: List[str],
+    data: _PrefetchedKlines,
+    klines: Dict[Tuple[str, str], List[List[Any]]],
+    snapshots: Dict[str, MarketSnapshot],
+    timeframe: str,
+    trend_timeframe: str,
+    scheduler: Optional[BarCloseScheduler],
+    now_ms: Optional[int],
+    book: Optional[PositionBook] = None,
+) -> None:
+    """Sinyal + emir; indikatör hesabı event loop'u bloklamasın diye worker thread'de."""
+    if not can_open_trade(state):
+        return
+    # Bu geçişte kapanan pozisyonların sembolleri de (loop._run_once gibi) değerlendirilir
+    closed = [s for s in open_symbols if s not in tracked and s in symbols]
+    if scheduler is not None:
+        closed = scheduler.pending(closed)
+    if closed:
+        missing = [(s, trend_timeframe, _TREND_LIMIT) for s in closed if peek_daily_trend(s, trend_timeframe) is None]
+        if missing:
+            klines.update(await exchange.get_klines_many(missing))
+        wanted = set(candidates) | set(closed)
+        candidates = [s for s in symbols if s in wanted]
+    if not candidates:
+        return
+    decisions = await asyncio.to_thread(_evaluate_candidates, data, candidates, timeframe, snapshots, now_ms)
+    if scheduler is not None:
+        for symbol in candidates:
+            snapshot = snapshots.get(symbol)
+            scheduler.record(symbol, snapshot.last_timestamp if snapshot is not None else None)
+    for symbol, signal, stop_price, entry_price in decisions:
+        if symbol in tracked:
+            continue
+        try:
+            quantity = _position_quantity(risk_manager, entry_price, stop_price, await exchange.get_market(symbol))
+            if quantity <= 0:
+                continue
+            order = await open_position(exchange, symbol, signal, quantity)
+            if _record_open(
+                tracked, risk_manager, symbol, signal, order, entry_price, stop_price, book=book, notify=False
+            ):
+                pos = tracked[symbol]
+                await asyncio.to_thread(_notify_open, symbol, signal, pos["quantity"], pos["entry_price"])
+                await _attach_exchange_stop_async(exchange, symbol, pos)
+        except Exception as e:
+            logger.warning("Pozisyon açma hatası (%s %s): %s", symbol, signal, e)
+
+
+async def _get_klines_many_safe(
+    exchange: AsyncBaseExchange,
+    requests: List[Tuple[str, str, int, int]],
+) -> Dict[Tuple[str, str], List[List[Any]]]:
+    if not requests:
+        return {}
+    try:
+        # Çıkış tespiti: tarama mumlarının önünde (gather her coroutine'e ayrı context verir)
+        with request_priority(Priority.TRAILING):
+            return await exchange.get_klines_many(requests)
+    except Exception as e:
+        logger.warning("1m mumlar alınamadı: %s", e)
+        return {}
+
+
+async def _reconcile_intrabar_async(
+    exchange: AsyncBaseExchange,
+    state: AppState,
+    tracked: Dict[str, Dict[str, Any]],
+    klines: Dict[Tuple[str, str], List[List[Any]]],
+    now_ms: int,
+) -> None:
+    """loop._reconcile_intrabar karşılığı (1m mumlar döngü başında diğer verilerle birlikte çekilir)."""
+    hits = replay_stops([(s, p) for s, p in tracked.items() if not p.get("busy")], klines, now_ms)
+    for hit in hits:
+        tracked[hit.symbol]["busy"] = True
+    for hit in hits:
+        pos = tracked[hit.symbol]
+        try:
+            await _close_tracked_async(
+                exchange, state, hit.symbol, pos, hit.price, pos["trailing_state"].current_stop,
+                simulate_fill=True,
+            )
+        except Exception as e:
+            logger.warning("Intrabar stop kapatma hatası (%s): %s", hit.symbol, e)
+            pos.pop("busy", None)
+            continue
+        tracked.pop(hit.symbol, None)
+
+
+async def _fetch_order_safe(exchange: AsyncBaseExchange, order_id: str, symbol: str) -> Optional[Dict[str, Any]]:
+    try:
+        return await exchange.fetch_order(order_id, symbol)
+    except Exception:
+        return None
+
+
+async def _close_tracked_async(
+    exchange: AsyncBaseExchange,
+    state: AppState,
+    symbol: str,
+    pos: Dict[str, Any],
+    exit_price: float,
+    new_stop: float,
+    simulate_fill: bool = False,
+) -> None:
+    """loop._close_tracked karşılığı."""
+    order_id = pos.get("stop_order_id")
+    if order_id:
+        fill = stop_fill_price(await _fetch_order_safe(exchange, order_id, symbol))
+        if fill is not None:
+            await asyncio.to_thread(_record_close, state, symbol, pos, fill, new_stop)
+            return
+        await cancel_stop_loss(exchange, order_id, symbol)
+    try:
+        # open/close_position exchange.place_order'ı döndürür; async exchange'de coroutine
+        if simulate_fill and hasattr(exchange, "place_order_at"):
+            order = await close_position_at(exchange, symbol, pos["side"], pos["quantity"], exit_price)
+        else:
+            order = await close_position(exchange, symbol, pos["side"], pos["quantity"])
+    except Exception:
+        if order_id and not await exchange.get_positions(symbol):
+            stop_exit = pos.get("exchange_stop") or new_stop
+            await asyncio.to_thread(_record_close, state, symbol, pos, stop_exit, new_stop)
+            return
+        raise
+    await asyncio.to_thread(_record_close, state, symbol, pos, _order_fill_price(order, exit_price), new_stop)
+
+
+async def _attach_exchange_stop_async(exchange: AsyncBaseExchange, symbol: str, pos: Dict[str, Any]) -> None:
+    """
+    loop._attach_exchange_stop karşılığı. İstek sürerken pozisyon busy işaretlenir; monitor task'ı
+    stop order'ı henüz olmayan pozisyonu kapatmaz.
+    """
+    if get_config().get("strategy.trailing.exchange_stop") is False:
+        return
+    stop_price = pos["trailing_state"].current_stop
+    pos["busy"] = True
+    try:
+        pos["price_tick"] = await exchange.get_price_tick(symbol)
+        order = await place_stop_loss(exchange, symbol, pos["side"], pos["quantity"], stop_price)
+    except NotImplementedError:
+        return
+    except Exception as e:
+        logger.warning("Borsa stop order gönderilemedi (%s): %s", symbol, e)
+        return
+    finally:
+        pos.pop("busy", None)
+    _set_exchange_stop(pos, order, stop_price)
+
+
+async def _amend_exchange_stop_async(
+    exchange: AsyncBaseExchange,
+    symbol: str,
+    pos: Dict[str, Any],
+    new_stop: float,
+) -> None:
+    """loop._amend_exchange_stop karşılığı."""
+    order_id = pos.get("stop_order_id")
+    try:
+        if order_id:
+            order = await amend_stop_loss(exchange, order_id, symbol, pos["side"], pos["quantity"], new_stop)
+        else:
+            order = await place_stop_loss(exchange, symbol, pos["side"], pos["quantity"], new_stop)
+    except Exception as e:
+        logger.warning("Borsa stop güncellenemedi (%s): %s", symbol, e)
+        if order_id:
+            current = await _fetch_order_safe(exchange, order_id, symbol)
+            if stop_fill_price(current) is None and not stop_order_open(current):
+                pos["stop_order_id"] = None
+        return
+    _set_exchange_stop(pos, order, new_stop)
+
+
+async def _reconcile_exchange_stops_async(
+    exchange: AsyncBaseExchange,
+    state: AppState,
+    monitor: TrailingMonitor,
+    symbols: List[str],
+) -> None:
+    """loop._reconcile_exchange_stops karşılığı."""
+    for symbol in symbols:
+        pos = monitor.tracked.get(symbol)
+        if pos is None or pos.get("busy") or not pos.get("stop_order_id"):
+            continue
+        pos["busy"] = True
+        fill = stop_fill_price(await _fetch_order_safe(exchange, pos["stop_order_id"], symbol))
+        if fill is None:
+            monitor.release(symbol)
+            continue
+        try:
+            await asyncio.to_thread(_record_close, state, symbol, pos, fill, pos["exchange_stop"])
+        finally:
+            monitor.remove(symbol)
+
+
+async def _wait_stop(stop_event: Optional[asyncio.Event], seconds: float) -> bool:
+    """seconds kadar bekler; stop_event set edilirse erken döner. Returns: durduruldu mu"""
+    if stop_event is None:
+        await asyncio.sleep(seconds)
+        return False
+    try:
+        await asyncio.wait_for(stop_event.wait(), timeout=seconds)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+async def _run_trailing_monitor(
+    exchange: AsyncBaseExchange,
+    state: AppState,
+    monitor: TrailingMonitor,
+    stop_event: Optional[asyncio.Event] = None,
+) -> None:
+    """TrailingMonitor.run_once'ın async karşılığı; engine döngüsünden bağımsız task olarak çalışır."""
+    while stop_event is None or not stop_event.is_set():
+        symbols = monitor.symbols()
+        if symbols:
+            tickers = await _get_tickers_safe(exchange, symbols)
+            for symbol, pos, mark, new_stop in monitor.evaluate(tickers):
+                try:
+                    await _close_tracked_async(exchange, state, symbol, pos, mark, new_stop)
+                except Exception as e:
+                    logger.warning("Trailing kapatma hatası (%s): %s", symbol, e)
+                    monitor.release(symbol)
+                    continue
+                monitor.remove(symbol)
+            for symbol, pos, new_stop in monitor.stop_amends():
+                await _amend_exchange_stop_async(exchange, symbol, pos, new_stop)
+        if await _wait_stop(stop_event, monitor.interval):
+            break
+
+
+async def _cancel_task(task: asyncio.Task) -> None:
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def run_engine_async(
+    interval_seconds: int = 60,
+    stop_event: Optional[asyncio.Event] = None,
+    exchange: Optional[AsyncBaseExchange] = None,
+) -> None:
+    """
+    Async engine döngüsü.
+    interval_seconds: sinyal ve trailing kontrol aralığı (saniye); engine.bar_close_schedule
+        açıksa kullanılmaz (run_engine ile aynı).
+    stop_event: asyncio.Event; set edilirse döngü biter. None ise sonsuz döngü.
+    exchange: None ise config'ten shared_async_exchange() (paper defteri dashboard ile ortak);
+        verilirse kapatılmaz (çağıranındır).
+    Config değişiklikleri run_engine ile aynı şekilde döngü başında uygulanır; dışarıdan verilen
+    exchange config değişince yeniden kurulmaz.
+    """
+    _setup_engine_logger(__name__)
+    get_event_bus().clear()
+    watcher = ConfigWatcher()
+    own_exchange = exchange is None
+    if exchange is None:
+        exchange = shared_async_exchange()
+    state = AppState()
+    risk_manager = RiskManager()
+    tracked: Dict[str, Dict[str, Any]] = {}
+    scheduler = _build_scheduler()
+    monitor = _build_trailing_monitor(tracked)
+    monitor_task = None
+    exchange_stale = False
+    try:
+        symbols = await _get_symbols_async(exchange)
+        if monitor is not None:
+            monitor_task = asyncio.get_running_loop().create_task(
+                _run_trailing_monitor(exchange, state, monitor, stop_event)
+            )
+        while stop_event is None or not stop_event.is_set():
+            try:
+                change = watcher.poll()
+                with pinned_config(watcher.snapshot):
+                    if change is not None:
+                        risk_manager, scheduler = _apply_config_change(
+                            change, risk_manager, scheduler, monitor, (__name__,)
+                        )
+                        exchange_stale = exchange_stale or (own_exchange and change.touches("exchange"))
+                        if change.touches("symbols") and not exchange_stale:
+                            symbols = await _get_symbols_async(exchange)
+                    if exchange_stale and not tracked:
+                        new_exchange = shared_async_exchange()
+                        if monitor_task is not None:
+                            await _cancel_task(monitor_task)
+                            monitor_task = None
+                        await exchange.close()
+                        exchange = new_exchange
+                        exchange_stale = False
+                        symbols = await _get_symbols_async(exchange)
+                        if scheduler is not None:
+                            await _sync_clock_async(scheduler, exchange)
+                        if monitor is not None:
+                            monitor_task = asyncio.get_running_loop().create_task(
+                                _run_trailing_monitor(exchange, state, monitor, stop_event)
+                            )
+                        logger.info("Exchange config değişikliğiyle yeniden kuruldu")
+                    elif exchange_stale and change is not None:
+                        logger.warning("Exchange değişikliği açık pozisyonlar kapanınca uygulanacak")
+            except Exception as e:
+                # Başarısız adım (ör. exchange kurulamadı) sonraki döngüde tekrar denenir
+                logger.exception("Config uygulama hatası: %s", e)
+            if scheduler is not None and scheduler.needs_clock_sync():
+                await _sync_clock_async(scheduler, exchange)
+            try:
+                with pinned_config(watcher.snapshot):
+                    await _run_once_async(
+                        exchange, state, risk_manager, symbols, tracked, scheduler=scheduler, monitor=monitor
+                    )
+            except Exception as e:
+                logger.exception("Engine döngü hatası: %s", e)
+            wait = scheduler.seconds_until_next_wake() if scheduler is not None else interval_seconds
+            if await _wait_stop(stop_event, wait):
+                break
+    finally:
+        watcher.close()
+        if monitor_task is not None:
+            await _cancel_task(monitor_task)
+        if own_exchange:
+            await exchange.close()
+        await asyncio.to_thread(flush_logs)
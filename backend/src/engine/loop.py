@@ -5,197 +5,888 @@ Tek process olarak çalıştırılır (örn. python -m engine veya scripts/run_e
 GUI (API) ayrı process'tir; engine bakiye/pozisyonu exchange üzerinden günceller, API aynı config ile okuyabilir.
 """
 
+import contextvars
 import time
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
-    from core.config_manager import ConfigManager
+    from core.config_manager import get_config, pinned_config
+    from core.config_watch import ConfigChange, ConfigWatcher
+    from core.events import get_event_bus, publish
+    from core.logger import get_logger, setup_logger
     from core.state import AppState
-    from exchanges.factory import get_exchange
-    from strategy import get_daily_trend, get_entry_signal, get_atr_and_stop_price
-    from strategy.indicators import ohlcv_to_dataframe, compute_atr
+    from core.timeframes import timeframe_to_ms
+    from exchanges.registry import shared_exchange
+    from exchanges.market_cache import MarketInfo
+    from exchanges.rate_limiter import Priority, request_priority, request_weight
+    from strategy import get_entry_signal, get_atr_and_stop_price
+    from strategy import MarketSnapshot, build_market_snapshot
+    from strategy.indicators import INDICATOR_BACKENDS, set_indicator_backend
+    from strategy import clear_trend_cache
+    from strategy.trend_filter import drop_forming_bar
     from risk import RiskManager, can_open_trade, stop_distance_price
     from execution import open_position, close_position, create_trailing_state
-    from stats import record_trade, log_trade_event, log_signal, log_trailing
+    from execution import TrailingMonitor, trailing_update, publish_marks, publish_stop
+    from execution import place_stop_loss, amend_stop_loss, cancel_stop_loss
+    from execution import amend_target, stop_fill_price, stop_order_open
+    from execution import close_position_at, intrabar_requests, replay_stops
+    from execution import PositionBook
+    from stats import record_trade, log_trade_event, log_signal, log_trailing, flush_logs
+    from stats.trade_logger import _log_dir
     from utils.telegram import notify_trade_opened, notify_trade_closed, notify_daily_limit
 except ImportError:
-    from ..core.config_manager import ConfigManager
+    from ..core.config_manager import get_config, pinned_config
+    from ..core.config_watch import ConfigChange, ConfigWatcher
+    from ..core.events import get_event_bus, publish
+    from ..core.logger import get_logger, setup_logger
     from ..core.state import AppState
-    from ..exchanges.factory import get_exchange
-    from ..strategy import get_daily_trend, get_entry_signal, get_atr_and_stop_price
-    from ..strategy.indicators import ohlcv_to_dataframe, compute_atr
+    from ..core.timeframes import timeframe_to_ms
+    from ..exchanges.registry import shared_exchange
+    from ..exchanges.market_cache import MarketInfo
+    from ..exchanges.rate_limiter import Priority, request_priority, request_weight
+    from ..strategy import get_entry_signal, get_atr_and_stop_price
+    from ..strategy import MarketSnapshot, build_market_snapshot
+    from ..strategy.indicators import INDICATOR_BACKENDS, set_indicator_backend
+    from ..strategy import clear_trend_cache
+    from ..strategy.trend_filter import drop_forming_bar
     from ..risk import RiskManager, can_open_trade, stop_distance_price
     from ..execution import open_position, close_position, create_trailing_state
-    from ..stats import record_trade, log_trade_event, log_signal, log_trailing
+    from ..execution import TrailingMonitor, trailing_update, publish_marks, publish_stop
+    from ..execution import place_stop_loss, amend_stop_loss, cancel_stop_loss
+    from ..execution import amend_target, stop_fill_price, stop_order_open
+    from ..execution import close_position_at, intrabar_requests, replay_stops
+    from ..execution import PositionBook
+    from ..stats import record_trade, log_trade_event, log_signal, log_trailing, flush_logs
+    from ..stats.trade_logger import _log_dir
     from ..utils.telegram import notify_trade_opened, notify_trade_closed, notify_daily_limit
 
+from .scheduler import BarCloseScheduler
+
+logger = get_logger(__name__)
+
+
+def _ccxt_connector(exchange):
+    """ccxt client'ı tutan connector (PaperTrader / CachedExchange sarmalayıcıları içinden); yoksa None."""
+    for _ in range(4):
+        if exchange is None:
+            return None
+        if getattr(exchange, "_client", None) is not None:
+            return exchange
+        exchange = getattr(exchange, "_data", None) or getattr(exchange, "_inner", None)
+    return None
+
 
 def _get_top_symbols_from_exchange(exchange, limit: int = 10) -> List[str]:
     """Exchange'den hacme göre en yüksek USDT perpetual sembollerini döndürür. ccxt _client gerekir."""
     try:
-        client = getattr(exchange, "_client", None) or getattr(exchange, "_data", None)
-        if client is None:
+        connector = _ccxt_connector(exchange)
+        if connector is None:
             return []
-        tickers = client.fetch_tickers()
-        out = []
-        for sym, t in tickers.items():
-            if "/USDT" not in str(sym) and "USDT" not in str(sym).upper():
-                continue
-            if "USDT:USDT" in str(sym) or ":USDT" not in str(sym):
-                if str(sym).endswith("USDT") or "/USDT" in str(sym):
-                    pass
-                else:
-                    continue
-            quote_vol = float(t.get("quoteVolume") or t.get("info", {}).get("quoteVolume") or 0)
-            if quote_vol <= 0:
-                continue
-            out.append((sym, quote_vol))
-        out.sort(key=lambda x: -x[1])
-        return [s for s, _ in out[:limit]]
+        # Doğrudan client isteği: connector metodu değil, rate limiter'dan izin burada alınır
+        limiter = getattr(connector, "_limiter", None)
+        if limiter is not None:
+            limiter.acquire(request_weight(connector, "tickers_24h"), Priority.SCAN)
+        return _top_symbols_from_tickers(connector._client.fetch_tickers(), limit)
     except Exception:
         return []
 
 
+def _top_symbols_from_tickers(tickers: Dict[str, Any], limit: int = 10) -> List[str]:
+    """ccxt fetch_tickers cevabından quote hacmine göre en yüksek USDT sembolleri."""
+    out = []
+    for sym, t in tickers.items():
+        if "/USDT" not in str(sym) and "USDT" not in str(sym).upper():
+            continue
+        if "USDT:USDT" in str(sym) or ":USDT" not in str(sym):
+            if str(sym).endswith("USDT") or "/USDT" in str(sym):
+                pass
+            else:
+                continue
+        quote_vol = float(t.get("quoteVolume") or t.get("info", {}).get("quoteVolume") or 0)
+        if quote_vol <= 0:
+            continue
+        out.append((sym, quote_vol))
+    out.sort(key=lambda x: -x[1])
+    return [s for s, _ in out[:limit]]
+
+
 def _get_symbols(exchange=None) -> List[str]:
-    config = ConfigManager()
-    manual = config.get("symbols.manual_list") or []
-    if isinstance(manual, list) and len(manual) > 0:
-        return [str(s) for s in manual]
-    if config.get("symbols.auto_detect_top_10") and exchange is not None:
+    manual = _manual_symbols()
+    if manual:
+        return manual
+    if get_config().get("symbols.auto_detect_top_10") and exchange is not None:
         top = _get_top_symbols_from_exchange(exchange, limit=10)
         if top:
             return top
     return ["BTC/USDT"]
 
 
-def _get_current_atr(exchange, symbol: str, timeframe: str = "15m", period: int = 14) -> float:
-    """Son kapanan mumun ATR değeri."""
+def _manual_symbols() -> List[str]:
+    manual = get_config().get("symbols.manual_list") or []
+    if isinstance(manual, list) and len(manual) > 0:
+        return [str(s) for s in manual]
+    return []
+
+
+def _get_snapshot(
+    snapshots: Dict[str, MarketSnapshot],
+    exchange,
+    symbol: str,
+    timeframe: str,
+) -> MarketSnapshot:
+    """Döngü içinde sembol başına tek MarketSnapshot (mumlar bir kez çekilir)."""
+    snapshot = snapshots.get(symbol)
+    if snapshot is None:
+        snapshot = build_market_snapshot(symbol, exchange, timeframe)
+        snapshots[symbol] = snapshot
+    return snapshot
+
+
+def _get_current_atr(
+    exchange,
+    symbol: str,
+    timeframe: str = "15m",
+    period: int = 14,
+    snapshot: Optional[MarketSnapshot] = None,
+) -> float:
+    """Son kapanan mumun ATR değeri. snapshot verilirse onun mumları kullanılır."""
     try:
-        ohlcv = exchange.get_klines(symbol, timeframe, limit=period + 20)
-        if not ohlcv or len(ohlcv) < period:
-            return 0.0
-        df = ohlcv_to_dataframe(ohlcv)
-        atr_series = compute_atr(df["high"], df["low"], df["close"], period)
-        last = atr_series.iloc[-1]
-        return float(last) if last and last == last else 0.0  # NaN check
+        if snapshot is None:
+            snapshot = MarketSnapshot(symbol, timeframe, exchange.get_klines(symbol, timeframe, limit=period + 20))
+        return snapshot.atr(period)
     except Exception:
         return 0.0
 
 
+def _cycle_settings() -> Tuple[str, int, int]:
+    """Döngü başı config: (timeframe, trailing_atr_period, scan_workers); indikatör backend'ini ayarlar."""
+    config = get_config()
+    timeframe = config.get("strategy.timeframe") or "15m"
+    trailing_atr_period = int(config.get("strategy.trailing.atr_period") or 14)
+    scan_workers = int(config.get("engine.scan_workers") or 1)
+    backend = str(config.get("strategy.indicator_backend") or "numpy").lower()
+    set_indicator_backend(backend if backend in INDICATOR_BACKENDS else "numpy")
+    return timeframe, trailing_atr_period, scan_workers
+
+
+def _decide_entry(
+    exchange,
+    symbol: str,
+    timeframe: str,
+    snapshot: MarketSnapshot,
+) -> Optional[Tuple[str, float, float]]:
+    """
+    Snapshot üzerinden sinyal + stop (emir ve tracked değişikliği yok).
+    exchange sadece günlük trend mumları için okunur (trend cache'te yoksa).
+    Returns: (signal, stop_price, entry_price) veya None
+    """
+    signal = get_entry_signal(symbol, exchange, timeframe=timeframe, snapshot=snapshot)
+    if not signal:
+        return None
+    atr_val, stop_price, entry_price = get_atr_and_stop_price(
+        symbol, exchange, signal, timeframe=timeframe, snapshot=snapshot
+    )
+    if not stop_price or not entry_price or stop_price <= 0 or entry_price <= 0:
+        return None
+    return signal, stop_price, entry_price
+
+
+def _evaluate_symbol(
+    exchange,
+    symbol: str,
+    timeframe: str,
+    now_ms: Optional[int] = None,
+) -> Tuple[MarketSnapshot, Optional[Tuple[str, float, float]]]:
+    """
+    Tek sembol için mumları çekip sinyal + stop hesaplar (sadece okuma).
+    now_ms verilirse sadece bu zamana göre kapanmış barlar kullanılır (bar kapanışı modu).
+    Returns: (snapshot, (signal, stop_price, entry_price)) veya sinyal yoksa (snapshot, None)
+    """
+    snapshot = build_market_snapshot(
+        symbol, exchange, timeframe, closed_only=now_ms is not None, now_ms=now_ms
+    )
+    return snapshot, _decide_entry(exchange, symbol, timeframe, snapshot)
+
+
+def _scan_symbols(
+    exchange,
+    symbols: List[str],
+    timeframe: str,
+    snapshots: Dict[str, MarketSnapshot],
+    workers: int = 1,
+    now_ms: Optional[int] = None,
+) -> List[Tuple[str, str, float, float]]:
+    """
+    Sembolleri en fazla `workers` thread ile eşzamanlı değerlendirir.
+    Sonuçlar `symbols` sırasıyla döner: [(symbol, signal, stop_price, entry_price), ...].
+    Hata veren semboller loglanır ve atlanır; snapshots yalnızca çağıran thread'de güncellenir.
+    now_ms: _evaluate_symbol'e iletilir (kapanmış barlarla değerlendirme).
+    """
+    if not symbols:
+        return []
+    workers = max(1, min(int(workers or 1), len(symbols)))
+    if workers == 1:
+        outcomes = []
+        for symbol in symbols:
+            try:
+                outcomes.append(_evaluate_symbol(exchange, symbol, timeframe, now_ms))
+            except Exception as e:
+                outcomes.append(e)
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as pool:
+            # Worker'lar döngünün sabitlenmiş config snapshot'ını (pinned_config) görsün
+            futures = [
+                pool.submit(contextvars.copy_context().run, _evaluate_symbol, exchange, symbol, timeframe, now_ms)
+                for symbol in symbols
+            ]
+            outcomes = []
+            for future in futures:
+                try:
+                    outcomes.append(future.result())
+                except Exception as e:
+                    outcomes.append(e)
+
+    results = []
+    for symbol, outcome in zip(symbols, outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning("Sinyal değerlendirme hatası (%s): %s", symbol, outcome)
+            continue
+        snapshot, decision = outcome
+        snapshots[symbol] = snapshot
+        if decision is not None:
+            results.append((symbol,) + decision)
+    return results
+
+
 def _run_once(
     exchange,
     state: AppState,
     risk_manager: RiskManager,
     symbols: List[str],
     tracked: Dict[str, Dict[str, Any]],
+    scheduler: Optional[BarCloseScheduler] = None,
+    monitor: Optional[TrailingMonitor] = None,
 ) -> None:
-    config = ConfigManager()
-    timeframe = config.get("strategy.timeframe") or "15m"
+    """
+    Tek engine geçişi: trailing + yeni sinyal.
+    scheduler verilirse sinyal sadece son kapanmış bar'ı henüz değerlendirilmemiş semboller için,
+    kapanmış barlarla hesaplanır; diğer uyanmalarda sadece trailing çalışır.
+    monitor verilirse trailing burada yapılmaz (TrailingMonitor kendi aralığında kontrol eder);
+    bu geçiş sadece açık pozisyonların ATR'sini bar kapanışında günceller.
+    """
+    timeframe, trailing_atr_period, scan_workers = _cycle_settings()
+    # Bu döngüde sembol başına ortak mum/indikatör verisi (sinyal, stop ve trailing aynı mumları okur)
+    snapshots: Dict[str, MarketSnapshot] = {}
+    lock = monitor.lock if monitor is not None else None
+
+    # 0) Kontroller arasında stop'a değen fitiller: son kontrolden beri kapanmış 1m mumlar
+    if tracked and _intrabar_enabled(exchange):
+        now_ms = scheduler.now_ms() if scheduler is not None else int(time.time() * 1000)
+        _reconcile_intrabar(exchange, state, tracked, now_ms, lock=lock)
 
     # 1) Açık pozisyonları kontrol et: trailing veya kapat
+    if monitor is None:
+        _check_trailing(exchange, state, tracked, snapshots, timeframe, trailing_atr_period)
+
+    # 2) Yeni sinyal: açık pozisyon yoksa ve limit yoksa sinyal ara ve aç
+    _open_new_positions(
+        exchange, state, risk_manager, symbols, tracked, snapshots, timeframe, scan_workers,
+        scheduler=scheduler, lock=lock, book=monitor.book if monitor is not None else None,
+    )
+
+    # 3) Monitor'ün kullandığı ATR: son kapanmış bar'a göre (yeni açılanlar dahil)
+    # Bar başına bir kez: borsa stop'u monitor'ün görmediği bir fiyatla dolduysa pozisyon kapatılır
+    if monitor is not None:
+        now_ms = scheduler.now_ms() if scheduler is not None else None
+        refreshed = _refresh_trailing_atr(exchange, monitor, snapshots, timeframe, trailing_atr_period, now_ms)
+        _reconcile_exchange_stops(exchange, state, monitor, refreshed)
+
+
+def _check_trailing(
+    exchange,
+    state: AppState,
+    tracked: Dict[str, Dict[str, Any]],
+    snapshots: Dict[str, MarketSnapshot],
+    timeframe: str,
+    trailing_atr_period: int,
+) -> None:
+    """Döngü içi trailing (monitor kapalıyken): fiyat + ATR ile stop güncelle, stop'a gelen pozisyonu kapat."""
+    min_ticks = _amend_min_ticks()
+    # Tüm açık pozisyonların fiyatı tek toplu istekle
+    try:
+        tickers = exchange.get_tickers(list(tracked.keys())) if tracked else {}
+    except Exception:
+        tickers = {}
+    publish_marks(tickers, list(tracked.keys()))
     for symbol in list(tracked.keys()):
         pos = tracked[symbol]
         try:
-            ticker = exchange.get_ticker(symbol)
+            ticker = tickers.get(symbol) or {}
             mark = float(ticker.get("last") or 0)
             if mark <= 0:
                 continue
-            atr = _get_current_atr(exchange, symbol, timeframe)
-            if atr <= 0:
-                atr = abs(pos["entry_price"] - pos["stop_price"])  # fallback
-            should_close, new_stop = pos["trailing_state"].update(mark, atr)
+            snapshot = _get_snapshot(snapshots, exchange, symbol, timeframe)
+            atr = _get_current_atr(exchange, symbol, timeframe, trailing_atr_period, snapshot=snapshot)
+            old_stop = pos["trailing_state"].current_stop
+            should_close, new_stop = trailing_update(pos, mark, atr)
             if should_close:
-                close_position(exchange, symbol, pos["side"], pos["quantity"])
-                exit_price = mark
-                if pos["side"] == "long":
-                    pnl = (exit_price - pos["entry_price"]) * pos["quantity"]
-                else:
-                    pnl = (pos["entry_price"] - exit_price) * pos["quantity"]
-                r = RiskManager.pnl_to_r(pnl, pos["risk_amount"])
-                state.add_day_r(r)
-                record_trade(pnl, r, 0.0)
-                log_trade_event(
-                    symbol, pos["side"], pos["entry_price"], exit_price,
-                    pos["quantity"], pnl, r, 0.0,
-                )
-                log_trailing(symbol, pos["side"], mark, new_stop, "close")
-                try:
-                    notify_trade_closed(symbol, pos["side"], pnl, r)
-                    if state.trading_disabled_today:
-                        notify_daily_limit(state.get_day_r())
-                except Exception:
-                    pass
+                _close_tracked(exchange, state, symbol, pos, mark, new_stop)
                 del tracked[symbol]
+                continue
+            if new_stop != old_stop:
+                publish_stop(symbol, pos, new_stop, mark)
+            target = amend_target(pos, min_ticks)
+            if target is not None:
+                _amend_exchange_stop(exchange, symbol, pos, target)
         except Exception as e:
-            # Log and keep position
-            pass
+            # Pozisyon korunur, sonraki döngüde tekrar denenir
+            logger.warning("Trailing hatası (%s): %s", symbol, e)
 
-    # 2) Yeni sinyal: açık pozisyon yoksa ve limit yoksa sinyal ara ve aç
+
+def _open_new_positions(
+    exchange,
+    state: AppState,
+    risk_manager: RiskManager,
+    symbols: List[str],
+    tracked: Dict[str, Dict[str, Any]],
+    snapshots: Dict[str, MarketSnapshot],
+    timeframe: str,
+    scan_workers: int,
+    scheduler: Optional[BarCloseScheduler] = None,
+    lock=None,
+    book: Optional[PositionBook] = None,
+) -> None:
+    """
+    Sinyal tarama + emir. lock: tracked monitor thread'iyle paylaşılıyorsa onun kilidi
+    (sadece tracked okuma/yazma sırasında tutulur; tarama ve emir kilitsiz). book: monitor.book.
+    """
     if not can_open_trade(state):
         return
-    for symbol in symbols:
-        if symbol in tracked:
-            continue
+    guard = lock if lock is not None else nullcontext()
+    # Tarama (I/O ağırlıklı) eşzamanlı; emirler ve tracked güncellemesi sembol sırasıyla tek thread'de
+    with guard:
+        candidates = [s for s in symbols if s not in tracked]
+    now_ms = None
+    if scheduler is not None:
+        scheduler.set_timeframe(timeframe)
+        candidates = scheduler.pending(candidates)
+        if not candidates:
+            return
+        now_ms = scheduler.now_ms()
+    # Tarama istekleri SCAN önceliğinde (scan worker'ları context'i kopyalar); emirler her zaman ORDER
+    with request_priority(Priority.SCAN):
+        results = _scan_symbols(exchange, candidates, timeframe, snapshots, workers=scan_workers, now_ms=now_ms)
+    if scheduler is not None:
+        for symbol in candidates:
+            snapshot = snapshots.get(symbol)
+            scheduler.record(symbol, snapshot.last_timestamp if snapshot is not None else None)
+    for symbol, signal, stop_price, entry_price in results:
         try:
-            signal = get_entry_signal(symbol, exchange)
-            if not signal:
-                continue
-            atr_val, stop_price, entry_price = get_atr_and_stop_price(symbol, exchange, signal)
-            if not stop_price or not entry_price or stop_price <= 0 or entry_price <= 0:
-                continue
-            stop_dist = stop_distance_price(entry_price, stop_price)
-            quantity = risk_manager.get_position_size(stop_dist)
+            quantity = _position_quantity(risk_manager, entry_price, stop_price, exchange.get_market(symbol))
             if quantity <= 0:
                 continue
-            quantity = round(quantity, 6)
             order = open_position(exchange, symbol, signal, quantity)
-            filled = float(order.get("filled") or 0)
-            avg_price = order.get("avg_price")
-            if filled <= 0:
-                continue
-            avg_price = float(avg_price) if avg_price is not None else entry_price
-            risk_amount = risk_manager.get_risk_amount()
-            trailing_state = create_trailing_state(
-                symbol, signal, avg_price, stop_price, filled
+            # Borsa stop'u kilit altında: monitor stop order'ı olmayan pozisyonu yarıda kapatmasın
+            with guard:
+                if _record_open(tracked, risk_manager, symbol, signal, order, entry_price, stop_price, book=book):
+                    _attach_exchange_stop(exchange, symbol, tracked[symbol])
+        except Exception as e:
+            logger.warning("Pozisyon açma hatası (%s %s): %s", symbol, signal, e)
+
+
+def _refresh_trailing_atr(
+    exchange,
+    monitor: TrailingMonitor,
+    snapshots: Dict[str, MarketSnapshot],
+    timeframe: str,
+    period: int,
+    now_ms: Optional[int] = None,
+) -> List[str]:
+    """
+    ATR'si son kapanmış bar'dan eski pozisyonlar için kapanmış barlarla ATR hesaplayıp monitor'e yazar.
+    Bar başına bir kez mum çekilir (bu döngünün snapshot'ı varsa o kullanılır). Borsa kapanan bar'ı
+    henüz yayınlamadıysa sonraki geçişte tekrar denenir. Returns: ATR'si güncellenen semboller
+    """
+    tf_ms = timeframe_to_ms(timeframe)
+    if now_ms is None:
+        now_ms = int(time.time() * 1000)
+    closed_ts = now_ms // tf_ms * tf_ms - tf_ms
+    refreshed = []
+    for symbol in monitor.symbols():
+        if not monitor.needs_atr(symbol, closed_ts):
+            continue
+        try:
+            snapshot = snapshots.get(symbol)
+            ohlcv = snapshot.ohlcv if snapshot is not None else exchange.get_klines(symbol, timeframe, limit=period + 20)
+            closed = MarketSnapshot(symbol, timeframe, drop_forming_bar(ohlcv, timeframe, now_ms))
+            monitor.set_atr(symbol, closed.atr(period), closed.last_timestamp)
+            refreshed.append(symbol)
+        except Exception as e:
+            logger.warning("Trailing ATR güncellenemedi (%s): %s", symbol, e)
+    return refreshed
+
+
+def _close_tracked(
+    exchange,
+    state: AppState,
+    symbol: str,
+    pos: Dict[str, Any],
+    exit_price: float,
+    new_stop: float,
+    simulate_fill: bool = False,
+) -> None:
+    """
+    Trailing kapatma kararını uygular (tracked'den çıkarmaz). Borsa stop'u dolduysa onun fiyatıyla
+    kaydedilir; değilse stop iptal edilip reduce-only market order gönderilir.
+    simulate_fill: Simülasyon borsasında (paper) order exit_price'tan doldurulur (intrabar tespit).
+    """
+    order_id = pos.get("stop_order_id")
+    if order_id:
+        fill = stop_fill_price(_fetch_order_safe(exchange, order_id, symbol))
+        if fill is not None:
+            _record_close(state, symbol, pos, fill, new_stop)
+            return
+        cancel_stop_loss(exchange, order_id, symbol)
+    try:
+        if simulate_fill and hasattr(exchange, "place_order_at"):
+            order = close_position_at(exchange, symbol, pos["side"], pos["quantity"], exit_price)
+        else:
+            order = close_position(exchange, symbol, pos["side"], pos["quantity"])
+    except Exception:
+        # Stop tetiklenmiş ama order durumu okunamadıysa pozisyon borsada zaten kapalıdır
+        if order_id and not exchange.get_positions(symbol):
+            _record_close(state, symbol, pos, pos.get("exchange_stop") or new_stop, new_stop)
+            return
+        raise
+    _record_close(state, symbol, pos, _order_fill_price(order, exit_price), new_stop)
+
+
+def _order_fill_price(order: Optional[Dict[str, Any]], fallback: float) -> float:
+    """Kapatma order'ının gerçekleşen ortalama fiyatı; borsa döndürmediyse karar fiyatı."""
+    avg_price = (order or {}).get("avg_price")
+    return float(avg_price) if avg_price else fallback
+
+
+def _intrabar_enabled(exchange) -> bool:
+    """
+    Intrabar kontrol sadece simülasyon borsasında (place_order_at, paper) çalışır. Canlı borsada
+    stop borsadadır (mark price ile tetiklenir); geçmiş 1m last-price fitili pozisyonu kapatmamalı.
+    """
+    return hasattr(exchange, "place_order_at") and get_config().get("engine.intrabar_check") is not False
+
+
+def _reconcile_intrabar(
+    exchange,
+    state: AppState,
+    tracked: Dict[str, Dict[str, Any]],
+    now_ms: int,
+    lock=None,
+) -> None:
+    """
+    Son kontrolden beri kapanmış 1m mumlar (tüm pozisyonlar için tek get_klines_many) üzerinde
+    stop'u oynatır; stop'a değen pozisyonları tespit edilen fiyattan kapatır.
+    """
+    guard = lock if lock is not None else nullcontext()
+    with guard:
+        requests = intrabar_requests([(s, p) for s, p in tracked.items() if not p.get("busy")], now_ms)
+    if not requests:
+        return
+    try:
+        # Çıkış tespiti: tarama mumlarının önünde
+        with request_priority(Priority.TRAILING):
+            klines = exchange.get_klines_many(requests)
+    except Exception as e:
+        logger.warning("1m mumlar alınamadı: %s", e)
+        return
+    with guard:
+        hits = replay_stops([(s, p) for s, p in tracked.items() if not p.get("busy")], klines, now_ms)
+        for hit in hits:
+            tracked[hit.symbol]["busy"] = True
+    for hit in hits:
+        pos = tracked[hit.symbol]
+        try:
+            _close_tracked(
+                exchange, state, hit.symbol, pos, hit.price, pos["trailing_state"].current_stop,
+                simulate_fill=True,
             )
-            tracked[symbol] = {
-                "side": signal,
-                "quantity": filled,
-                "entry_price": avg_price,
-                "stop_price": stop_price,
-                "risk_amount": risk_amount,
-                "trailing_state": trailing_state,
-            }
-            log_signal(symbol, signal, "opened")
-            try:
-                notify_trade_opened(symbol, signal, filled, avg_price)
-            except Exception:
-                pass
         except Exception as e:
-            pass
+            logger.warning("Intrabar stop kapatma hatası (%s): %s", hit.symbol, e)
+            with guard:
+                pos.pop("busy", None)
+            continue
+        with guard:
+            tracked.pop(hit.symbol, None)
+
+
+def _fetch_order_safe(exchange, order_id: str, symbol: str) -> Optional[Dict[str, Any]]:
+    try:
+        return exchange.fetch_order(order_id, symbol)
+    except Exception:
+        return None
+
+
+def _amend_min_ticks() -> int:
+    return int(get_config().get("strategy.trailing.amend_min_ticks") or 0)
+
+
+def _set_exchange_stop(pos: Dict[str, Any], order: Dict[str, Any], stop_price: float) -> None:
+    pos["stop_order_id"] = order.get("order_id")
+    pos["exchange_stop"] = float(order.get("stop_price") or stop_price)
+
+
+def _attach_exchange_stop(exchange, symbol: str, pos: Dict[str, Any]) -> None:
+    """strategy.trailing.exchange_stop açıksa pozisyonun stop'unu borsaya reduce-only STOP_MARKET olarak koyar."""
+    if get_config().get("strategy.trailing.exchange_stop") is False:
+        return
+    stop_price = pos["trailing_state"].current_stop
+    try:
+        pos["price_tick"] = exchange.get_price_tick(symbol)
+        order = place_stop_loss(exchange, symbol, pos["side"], pos["quantity"], stop_price)
+    except NotImplementedError:
+        return  # Borsa desteklemiyor: stop engine tarafında kalır
+    except Exception as e:
+        logger.warning("Borsa stop order gönderilemedi (%s): %s", symbol, e)
+        return
+    _set_exchange_stop(pos, order, stop_price)
+
+
+def _amend_exchange_stop(exchange, symbol: str, pos: Dict[str, Any], new_stop: float) -> None:
+    """
+    Borsadaki stop order'ı new_stop'a taşır (order yoksa yenisini gönderir). Başarısızsa ve eski
+    order ne açık ne dolmuşsa id bırakılır; sonraki amend yeni order gönderir.
+    """
+    order_id = pos.get("stop_order_id")
+    try:
+        if order_id:
+            order = amend_stop_loss(exchange, order_id, symbol, pos["side"], pos["quantity"], new_stop)
+        else:
+            order = place_stop_loss(exchange, symbol, pos["side"], pos["quantity"], new_stop)
+    except Exception as e:
+        logger.warning("Borsa stop güncellenemedi (%s): %s", symbol, e)
+        if order_id:
+            current = _fetch_order_safe(exchange, order_id, symbol)
+            if stop_fill_price(current) is None and not stop_order_open(current):
+                pos["stop_order_id"] = None
+        return
+    _set_exchange_stop(pos, order, new_stop)
+
+
+def _reconcile_exchange_stops(
+    exchange,
+    state: AppState,
+    monitor: TrailingMonitor,
+    symbols: List[str],
+) -> None:
+    """Borsa stop'u dolmuş pozisyonları kaydedip tracked'den çıkarır (monitor'ün görmediği fiyat iğneleri)."""
+    for symbol in symbols:
+        with monitor.lock:
+            pos = monitor.tracked.get(symbol)
+            if pos is None or pos.get("busy") or not pos.get("stop_order_id"):
+                continue
+            pos["busy"] = True
+        fill = stop_fill_price(_fetch_order_safe(exchange, pos["stop_order_id"], symbol))
+        if fill is None:
+            monitor.release(symbol)
+            continue
+        try:
+            _record_close(state, symbol, pos, fill, pos["exchange_stop"])
+        finally:
+            monitor.remove(symbol)
+
+
+def _record_close(
+    state: AppState,
+    symbol: str,
+    pos: Dict[str, Any],
+    exit_price: float,
+    new_stop: float,
+) -> None:
+    """Kapanan pozisyon için PnL/R, günlük R, istatistik, log, dashboard olayları ve bildirim."""
+    if pos["side"] == "long":
+        pnl = (exit_price - pos["entry_price"]) * pos["quantity"]
+    else:
+        pnl = (pos["entry_price"] - exit_price) * pos["quantity"]
+    r = RiskManager.pnl_to_r(pnl, pos["risk_amount"])
+    state.add_day_r(r)
+    record_trade(
+        pnl, r, 0.0,
+        symbol=symbol, side=pos["side"], entry_price=pos["entry_price"], exit_price=exit_price,
+        quantity=pos["quantity"],
+    )
+    log_trade_event(
+        symbol, pos["side"], pos["entry_price"], exit_price,
+        pos["quantity"], pnl, r, 0.0,
+    )
+    log_trailing(symbol, pos["side"], exit_price, new_stop, "close")
+    _publish_close(state, symbol, pos, exit_price, pnl, r)
+    try:
+        notify_trade_closed(symbol, pos["side"], pnl, r)
+        if state.trading_disabled_today:
+            notify_daily_limit(state.get_day_r())
+    except Exception:
+        pass
+
+
+def _publish_close(state: AppState, symbol: str, pos: Dict[str, Any], exit_price: float, pnl: float, r: float) -> None:
+    """position.closed + stats (bu trade'in katkısı); pozisyonun saklanan olayları silinir."""
+    bus = get_event_bus()
+    for topic in ("position.opened", "stop.moved", "ticker"):
+        bus.forget(topic, symbol)
+    publish("position.closed", {
+        "symbol": symbol,
+        "side": pos["side"],
+        "quantity": pos["quantity"],
+        "entry_price": pos["entry_price"],
+        "exit_price": exit_price,
+        "pnl": pnl,
+        "r": r,
+    })
+    publish("stats", {
+        "symbol": symbol,
+        "pnl": pnl,
+        "r": r,
+        "fees": 0.0,
+        "day_r": state.get_day_r(),
+        "trading_disabled_today": state.trading_disabled_today,
+    })
+
+
+def _position_quantity(
+    risk_manager: RiskManager,
+    entry_price: float,
+    stop_price: float,
+    market: Optional[MarketInfo] = None,
+) -> float:
+    """
+    Risk tutarı / stop mesafesi; açılamıyorsa 0.
+    market (exchange.get_market) verilirse lot adımına aşağı yuvarlanır, min miktarın altı 0 olur;
+    bilinmiyorsa 6 basamak.
+    """
+    stop_dist = stop_distance_price(entry_price, stop_price)
+    quantity = risk_manager.get_position_size(stop_dist)
+    if quantity <= 0:
+        return 0.0
+    if market is not None:
+        return market.round_amount(quantity)
+    return round(quantity, 6)
+
+
+def _record_open(
+    tracked: Dict[str, Dict[str, Any]],
+    risk_manager: RiskManager,
+    symbol: str,
+    signal: str,
+    order: Dict[str, Any],
+    entry_price: float,
+    stop_price: float,
+    book: Optional[PositionBook] = None,
+    notify: bool = True,
+) -> bool:
+    """
+    Dolan order'ı tracked'e ekler, loglar ve bildirir. Dolmadıysa False.
+    book verilirse (monitor.book) trailing state PositionBook'ta tutulur.
+    notify=False: bildirim çağırana kalır (async engine: _notify_open thread'de).
+    """
+    filled = float(order.get("filled") or 0)
+    avg_price = order.get("avg_price")
+    if filled <= 0:
+        return False
+    avg_price = float(avg_price) if avg_price is not None else entry_price
+    risk_amount = risk_manager.get_risk_amount()
+    if book is not None:
+        trailing_state = book.add(symbol, signal, avg_price, stop_price, filled)
+    else:
+        trailing_state = create_trailing_state(
+            symbol, signal, avg_price, stop_price, filled
+        )
+    tracked[symbol] = {
+        "side": signal,
+        "quantity": filled,
+        "entry_price": avg_price,
+        "stop_price": stop_price,
+        "risk_amount": risk_amount,
+        "trailing_state": trailing_state,
+    }
+    publish("position.opened", {
+        "symbol": symbol,
+        "side": signal,
+        "quantity": filled,
+        "entry_price": avg_price,
+        "stop": stop_price,
+    }, key=symbol)
+    log_signal(symbol, signal, "opened")
+    if notify:
+        _notify_open(symbol, signal, filled, avg_price)
+    return True
+
+
+def _notify_open(symbol: str, signal: str, quantity: float, entry_price: float) -> None:
+    """Açılış bildirimi (Telegram isteği bloklar; hata trade'i etkilemez)."""
+    try:
+        notify_trade_opened(symbol, signal, quantity, entry_price)
+    except Exception:
+        pass
+
+
+def _setup_engine_logger(name: str = __name__) -> None:
+    """Engine logger'ına console + dosya handler'ı ekler (trade log'larıyla aynı klasör, logging.level config'ten)."""
+    level = str(get_config().get("logging.level") or "INFO")
+    setup_logger(name, log_dir=str(_log_dir()), level=level)
+
+
+def _build_scheduler() -> Optional[BarCloseScheduler]:
+    """engine.bar_close_schedule açıksa config'e göre BarCloseScheduler; kapalıysa None."""
+    config = get_config()
+    if config.get("engine.bar_close_schedule") is False:
+        return None
+    return BarCloseScheduler(
+        config.get("strategy.timeframe") or "15m",
+        trailing_interval=float(config.get("engine.trailing_interval_seconds") or 10),
+        close_delay=float(config.get("engine.bar_close_delay_seconds") or 0),
+    )
+
+
+def _build_trailing_monitor(tracked: Dict[str, Dict[str, Any]]) -> Optional[TrailingMonitor]:
+    """engine.trailing_monitor açıksa tracked üzerinde TrailingMonitor; kapalıysa None."""
+    config = get_config()
+    if config.get("engine.trailing_monitor") is False:
+        return None
+    return TrailingMonitor(
+        tracked,
+        interval=float(config.get("engine.trailing_monitor_seconds") or 1.5),
+        amend_ticks=int(config.get("strategy.trailing.amend_min_ticks") or 0),
+    )
+
+
+def _apply_config_change(
+    change: ConfigChange,
+    risk_manager: RiskManager,
+    scheduler: Optional[BarCloseScheduler],
+    monitor: Optional[TrailingMonitor],
+    loggers: Tuple[str, ...] = (__name__,),
+) -> Tuple[RiskManager, Optional[BarCloseScheduler]]:
+    """
+    Yeni config'in (pinned_config(change.new) içinde çağrılır) exchange ve sembol listesi dışındaki
+    etkileri; sadece değişen kısımlar yenilenir. Döngü başında okunan ayarlar (timeframe, scan_workers,
+    indikatör backend'i, intrabar, exchange_stop) zaten her döngüde config'ten gelir. Trailing
+    çarpanı / break-even değişikliği yeni açılan pozisyonlara uygulanır.
+    Returns: (risk_manager, scheduler)
+    """
+    logger.info("Config değişti: %s", ", ".join(sorted(change.changed)))
+    if change.touches("logging.level"):
+        for name in loggers:
+            _setup_engine_logger(name)
+    if change.touches("account"):
+        risk_manager = RiskManager()
+    if change.touches("engine.bar_close_schedule"):
+        scheduler = _build_scheduler()
+    elif scheduler is not None and change.touches("engine.trailing_interval_seconds", "engine.bar_close_delay_seconds"):
+        config = change.new
+        scheduler.configure(
+            float(config.get("engine.trailing_interval_seconds") or 10),
+            float(config.get("engine.bar_close_delay_seconds") or 0),
+        )
+    # Sinyal parametreleri değişti: son kapanmış bar yeni parametrelerle tekrar değerlendirilir
+    if scheduler is not None and change.touches("strategy.entry", "strategy.stop", "strategy.trend_filter"):
+        scheduler.reset()
+    if change.touches("strategy.trend_filter"):
+        clear_trend_cache()
+    if monitor is not None:
+        if change.touches("strategy.timeframe", "strategy.trailing.atr_period"):
+            monitor.reset_atr()
+        if change.touches("engine.trailing_monitor_seconds", "strategy.trailing.amend_min_ticks"):
+            monitor.configure(
+                float(change.new.get("engine.trailing_monitor_seconds") or 1.5),
+                int(change.new.get("strategy.trailing.amend_min_ticks") or 0),
+            )
+    if change.touches("engine.trailing_monitor", "engine.async_mode"):
+        logger.warning("engine.trailing_monitor / engine.async_mode engine yeniden başlatılınca uygulanır")
+    return risk_manager, scheduler
 
 
 def run_engine(interval_seconds: int = 60, stop_event=None) -> None:
     """
     Engine döngüsünü başlatır.
-    interval_seconds: sinyal ve trailing kontrol aralığı (saniye).
+    interval_seconds: sinyal ve trailing kontrol aralığı (saniye). engine.bar_close_schedule
+        açıksa kullanılmaz: sinyal mum kapanışında, trailing engine.trailing_interval_seconds'ta.
+        engine.trailing_monitor açıksa trailing ayrı thread'de engine.trailing_monitor_seconds'ta.
     stop_event: threading.Event; set edilirse döngü biter. None ise sonsuz döngü.
+    Config değişiklikleri (PUT /api/config veya dosya) döngü başında uygulanır (_apply_config_change);
+    exchange sadece exchange.* değişince ve açık pozisyon yokken yeniden kurulur.
     """
-    exchange = get_exchange()
+    _setup_engine_logger()
+    get_event_bus().clear()
+    watcher = ConfigWatcher()
+    exchange = shared_exchange()
     state = AppState()
     risk_manager = RiskManager()
     symbols = _get_symbols(exchange)
     tracked: Dict[str, Dict[str, Any]] = {}
+    scheduler = _build_scheduler()
+    monitor = _build_trailing_monitor(tracked)
+    loggers: Tuple[str, ...] = (__name__,)
 
-    while True:
-        if stop_event is not None and stop_event.is_set():
-            break
-        try:
-            _run_once(exchange, state, risk_manager, symbols, tracked)
-        except Exception as e:
-            pass
-        if stop_event is not None:
-            if stop_event.wait(timeout=interval_seconds):
+    def start_monitor() -> None:
+        # Callback'ler exchange değişkenini okur: exchange yeniden kurulunca monitor yeniden başlatılır
+        monitor.start(
+            exchange,
+            on_close=lambda symbol, pos, mark, new_stop: _close_tracked(exchange, state, symbol, pos, mark, new_stop),
+            on_amend=lambda symbol, pos, new_stop: _amend_exchange_stop(exchange, symbol, pos, new_stop),
+        )
+
+    if monitor is not None:
+        loggers += (TrailingMonitor.__module__,)
+        _setup_engine_logger(TrailingMonitor.__module__)
+        start_monitor()
+
+    exchange_stale = False
+    try:
+        while True:
+            if stop_event is not None and stop_event.is_set():
                 break
-        else:
-            time.sleep(interval_seconds)
+            try:
+                change = watcher.poll()
+                with pinned_config(watcher.snapshot):
+                    if change is not None:
+                        risk_manager, scheduler = _apply_config_change(change, risk_manager, scheduler, monitor, loggers)
+                        exchange_stale = exchange_stale or change.touches("exchange")
+                        if change.touches("symbols") and not exchange_stale:
+                            symbols = _get_symbols(exchange)
+                    if exchange_stale and not tracked:
+                        new_exchange = shared_exchange()
+                        if monitor is not None:
+                            monitor.stop()
+                        exchange = new_exchange
+                        exchange_stale = False
+                        symbols = _get_symbols(exchange)
+                        if scheduler is not None:
+                            scheduler.sync_clock(exchange)
+                        if monitor is not None:
+                            start_monitor()
+                        logger.info("Exchange config değişikliğiyle yeniden kuruldu")
+                    elif exchange_stale and change is not None:
+                        logger.warning("Exchange değişikliği açık pozisyonlar kapanınca uygulanacak")
+            except Exception as e:
+                # Başarısız adım (ör. exchange kurulamadı) sonraki döngüde tekrar denenir
+                logger.exception("Config uygulama hatası: %s", e)
+            if scheduler is not None and scheduler.needs_clock_sync():
+                scheduler.sync_clock(exchange)
+            try:
+                # Döngü boyunca tek config snapshot'ı (dosya döngü ortasında değişse de)
+                with pinned_config(watcher.snapshot):
+                    _run_once(exchange, state, risk_manager, symbols, tracked, scheduler=scheduler, monitor=monitor)
+            except Exception as e:
+                logger.exception("Engine döngü hatası: %s", e)
+            wait = scheduler.seconds_until_next_wake() if scheduler is not None else interval_seconds
+            if stop_event is not None:
+                if stop_event.wait(timeout=wait):
+                    break
+            else:
+                time.sleep(wait)
+    finally:
+        watcher.close()
+        if monitor is not None:
+            monitor.stop()
+        flush_logs()
@@ -0,0 +1,168 @@
+"""
+Bar-close Scheduler - Engine uyanma zamanlarını mum kapanışına hizalar.
+
+Sabit aralıklı uyku (interval_seconds) yerine:
+  - Entry değerlendirmesi: entry timeframe mumu kapandıktan hemen sonra (close_delay kadar sonra)
+  - Trailing kontrolü: kendi kısa aralığında (trailing_interval)
+Saat, borsa sunucu zamanı ile hizalanır (offset); yerel saat kayması kapanış zamanını kaydırmaz.
+
+Her sembol için son değerlendirilen kapanmış bar tutulur; yeni bar kapanmamış semboller tekrar
+değerlendirilmez. Borsa kapanan bar'ı henüz yayınlamadıysa sembol birkaç uyanmada tekrar denenir.
+
+Kullanım:
+    scheduler = BarCloseScheduler("15m", trailing_interval=10, close_delay=2)
+    scheduler.sync_clock(exchange)
+    pending = scheduler.pending(symbols)        # yeni kapanmış bar'ı değerlendirilmemiş semboller
+    scheduler.record(symbol, snapshot.last_timestamp)
+    time.sleep(scheduler.seconds_until_next_wake())
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from core.timeframes import timeframe_to_ms
+except ImportError:
+    from ..core.timeframes import timeframe_to_ms
+
+
+class BarCloseScheduler:
+    """Mum kapanışına hizalı uyanma zamanları + sembol başına son değerlendirilen bar."""
+
+    def __init__(
+        self,
+        timeframe: str,
+        trailing_interval: float = 10.0,
+        close_delay: float = 2.0,
+        max_attempts: int = 3,
+        resync_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            timeframe: Entry timeframe (örn. 15m)
+            trailing_interval: Trailing kontrolleri arası saniye
+            close_delay: Kapanıştan sonra borsanın bar'ı yayınlaması için beklenen saniye
+            max_attempts: Kapanan bar'ı henüz dönmeyen sembol için bar başına deneme sayısı
+            resync_seconds: Sunucu saati offset'inin yeniden ölçülme aralığı
+            clock: Yerel saat (saniye); test için değiştirilebilir
+        """
+        self.trailing_interval = 0.0
+        self.close_delay_ms = 0
+        self.configure(trailing_interval, close_delay)
+        self.max_attempts = max(1, int(max_attempts))
+        self.resync_seconds = float(resync_seconds)
+        self.offset_ms = 0
+        self._clock = clock
+        self._last_sync: Optional[float] = None
+        # symbol -> değerlendirilen son kapanmış bar (açılış ms)
+        self._evaluated: Dict[str, int] = {}
+        # symbol -> (beklenen bar, deneme sayısı)
+        self._attempts: Dict[str, Tuple[int, int]] = {}
+        self.timeframe = ""
+        self.tf_ms = 0
+        self.set_timeframe(timeframe)
+
+    def configure(self, trailing_interval: float, close_delay: float) -> None:
+        """Trailing aralığı ve kapanış gecikmesi (config değişince; sembol durumları korunur)."""
+        self.trailing_interval = max(0.5, float(trailing_interval))
+        self.close_delay_ms = int(max(0.0, float(close_delay)) * 1000)
+
+    def reset(self) -> None:
+        """Sembol durumlarını sıfırlar: son kapanmış bar tekrar değerlendirilir (ör. sinyal parametreleri değişti)."""
+        self._evaluated.clear()
+        self._attempts.clear()
+
+    def set_timeframe(self, timeframe: str) -> None:
+        """Timeframe değişirse sembol durumları sıfırlanır. Geçersiz timeframe ValueError."""
+        if timeframe == self.timeframe:
+            return
+        self.tf_ms = timeframe_to_ms(timeframe)
+        self.timeframe = timeframe
+        self.reset()
+
+    # --- Saat ---
+
+    def local_ms(self) -> int:
+        """Yerel saat (ms)."""
+        return int(self._clock() * 1000)
+
+    def now_ms(self) -> int:
+        """Sunucu saatine göre şu an (ms)."""
+        return self.local_ms() + self.offset_ms
+
+    def apply_server_time(self, server_ms: Optional[int], sent_ms: int, received_ms: int) -> bool:
+        """
+        Sunucu zamanı ölçümünden offset: istek gidiş-dönüşünün ortası sunucu zamanına eşitlenir.
+        server_ms None ise offset değişmez (sonraki senkron resync_seconds sonra). Returns: güncellendi mi
+        """
+        self._last_sync = self._clock()
+        if not server_ms:
+            return False
+        self.offset_ms = int(server_ms) - (int(sent_ms) + int(received_ms)) // 2
+        return True
+
+    def sync_clock(self, exchange) -> bool:
+        """exchange.get_server_time() ile offset'i günceller. Borsa desteklemiyorsa veya hata olursa False."""
+        sent_ms = self.local_ms()
+        try:
+            server_ms = exchange.get_server_time()
+        except Exception:
+            server_ms = None
+        return self.apply_server_time(server_ms, sent_ms, self.local_ms())
+
+    def needs_clock_sync(self) -> bool:
+        return self._last_sync is None or self._clock() - self._last_sync >= self.resync_seconds
+
+    # --- Bar zamanları ---
+
+    def last_closed_ts(self, now_ms: Optional[int] = None) -> int:
+        """Son kapanmış bar'ın açılış zamanı (ms)."""
+        now = self.now_ms() if now_ms is None else now_ms
+        return now // self.tf_ms * self.tf_ms - self.tf_ms
+
+    def next_close_ms(self, now_ms: Optional[int] = None) -> int:
+        """Oluşmakta olan bar'ın kapanış zamanı (ms)."""
+        now = self.now_ms() if now_ms is None else now_ms
+        return (now // self.tf_ms + 1) * self.tf_ms
+
+    def seconds_until_next_wake(self) -> float:
+        """Sonraki uyanmaya kalan süre: bar kapanışı (+ close_delay) veya trailing aralığı, hangisi önce."""
+        now = self.now_ms()
+        # Son kapanış + close_delay henüz gelmediyse (gecikme penceresindeyiz) önce o
+        target = now // self.tf_ms * self.tf_ms + self.close_delay_ms
+        if target <= now:
+            target = self.next_close_ms(now) + self.close_delay_ms
+        return max(0.0, min(self.trailing_interval, (target - now) / 1000.0))
+
+    # --- Sembol durumu ---
+
+    def _due_ts(self) -> int:
+        """Değerlendirilmesi beklenen bar: close_delay geçmemişse bir önceki bar."""
+        return self.last_closed_ts(self.now_ms() - self.close_delay_ms)
+
+    def pending(self, symbols: List[str]) -> List[str]:
+        """Son kapanmış bar'ı henüz değerlendirilmemiş semboller (sıra korunur)."""
+        due = self._due_ts()
+        out = []
+        for symbol in symbols:
+            if self._evaluated.get(symbol, -1) >= due:
+                continue
+            expected, attempts = self._attempts.get(symbol, (due, 0))
+            if expected == due and attempts >= self.max_attempts:
+                continue
+            out.append(symbol)
+        return out
+
+    def record(self, symbol: str, last_bar_ts: Optional[int]) -> None:
+        """
+        Değerlendirme sonucu: last_bar_ts değerlendirilen son kapanmış bar (None = veri yok / hata).
+        Beklenen bar'dan eskiyse deneme sayılır; max_attempts sonrası bu bar için bırakılır.
+        """
+        due = self._due_ts()
+        if last_bar_ts is not None and last_bar_ts >= due:
+            self._evaluated[symbol] = int(last_bar_ts)
+            self._attempts.pop(symbol, None)
+            return
+        expected, attempts = self._attempts.get(symbol, (due, 0))
+        self._attempts[symbol] = (due, attempts + 1 if expected == due else 1)
@@ -1,15 +1,39 @@
 # Exchange connectors
 
+from .async_base_exchange import AsyncBaseExchange, AsyncExchangeAdapter
+from .async_futures import AsyncBinanceFuturesExchange, AsyncMEXCFuturesExchange
+from .async_paper_trader import AsyncPaperTrader
 from .base_exchange import BaseExchange
 from .binance_futures import BinanceFuturesExchange
+from .cached_exchange import CachedExchange
 from .mexc_futures import MEXCFuturesExchange
 from .paper_trader import PaperTrader
-from .factory import get_exchange
+from .rate_limiter import Priority, RateLimiter, request_priority
+from .factory import get_async_exchange, get_exchange
+from .market_cache import MarketCache, MarketIndex, MarketInfo
+from .registry import ExchangeRegistry, get_registry, shared_async_exchange, shared_exchange
 
 __all__ = [
+    "AsyncBaseExchange",
+    "AsyncBinanceFuturesExchange",
+    "AsyncExchangeAdapter",
+    "AsyncMEXCFuturesExchange",
+    "AsyncPaperTrader",
     "BaseExchange",
     "BinanceFuturesExchange",
+    "CachedExchange",
+    "ExchangeRegistry",
     "MEXCFuturesExchange",
+    "MarketCache",
+    "MarketIndex",
+    "MarketInfo",
     "PaperTrader",
+    "Priority",
+    "RateLimiter",
+    "get_async_exchange",
     "get_exchange",
+    "get_registry",
+    "request_priority",
+    "shared_async_exchange",
+    "shared_exchange",
 ]
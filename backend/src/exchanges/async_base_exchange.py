@@ -0,0 +1,241 @@
+"""
+Async Base Exchange - BaseExchange'in asyncio karşılığı.
+
+Async engine (engine/async_loop.py) bir döngüdeki tüm piyasa verisi isteklerini aynı anda
+gönderir; bu yüzden connector metotları coroutine'dir. Metot adları, argümanlar ve dönüş
+formatları BaseExchange ile aynıdır.
+
+Kullanım:
+    exchange = get_async_exchange()
+    klines = await exchange.get_klines_many([("BTC/USDT", "15m", 250), ("ETH/USDT", "15m", 250)])
+    await exchange.close()
+
+Sync bir BaseExchange (örn. test için sahte borsa) AsyncExchangeAdapter ile sarılabilir.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base_exchange import BaseExchange, KlineRequest
+from .market_cache import MarketInfo
+
+
+class AsyncBaseExchange(ABC):
+    """Async exchange connector için abstract base class."""
+
+    @abstractmethod
+    async def get_balance(self) -> float:
+        """USDT cinsinden kullanılabilir bakiye."""
+        pass
+
+    @abstractmethod
+    async def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Açık pozisyonlar (BaseExchange.get_positions formatı)."""
+        pass
+
+    @abstractmethod
+    async def get_klines(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 500,
+        since: Optional[int] = None,
+    ) -> List[List[Any]]:
+        """Mum (OHLCV) verisi: [[ts, o, h, l, c, v], ...]."""
+        pass
+
+    @abstractmethod
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        order_type: str = "market",
+        stop_price: Optional[float] = None,
+        reduce_only: bool = False,
+    ) -> Dict[str, Any]:
+        """Order gönderir. Returns: { 'order_id', 'filled', 'avg_price', ... }"""
+        pass
+
+    @abstractmethod
+    async def cancel_order(self, order_id: str, symbol: str) -> bool:
+        """Order iptal eder."""
+        pass
+
+    async def get_ticker(self, symbol: str) -> Dict[str, float]:
+        """Son fiyat: { 'last', 'bid', 'ask' }."""
+        raise NotImplementedError("get_ticker must be implemented")
+
+    async def get_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Çok sembol için son fiyat. Varsayılan: sembol başına get_ticker, hepsi aynı anda.
+        Fiyatı alınamayan semboller sonuçta yer almaz.
+        """
+        results = await asyncio.gather(*(self.get_ticker(s) for s in symbols), return_exceptions=True)
+        return {
+            symbol: result
+            for symbol, result in zip(symbols, results)
+            if not isinstance(result, BaseException)
+        }
+
+    async def get_klines_many(
+        self,
+        requests: List[KlineRequest],
+    ) -> Dict[Tuple[str, str], List[List[Any]]]:
+        """
+        Çok (symbol, timeframe) için mum verisi; istekler aynı anda gönderilir.
+        requests: [(symbol, timeframe, limit), ...]; 4. eleman olarak since (ms) verilebilir.
+        Hata alan istekler sonuçta yer almaz.
+        """
+        coros = [
+            self.get_klines(req[0], req[1], int(req[2]), since=req[3] if len(req) > 3 else None)
+            for req in requests
+        ]
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        out: Dict[Tuple[str, str], List[List[Any]]] = {}
+        for req, result in zip(requests, results):
+            if isinstance(result, BaseException):
+                continue
+            out[(req[0], req[1])] = result
+        return out
+
+    async def fetch_order(self, order_id: str, symbol: str) -> Optional[Dict[str, Any]]:
+        """Order durumunu getirir. İsteğe bağlı."""
+        return None
+
+    async def get_server_time(self) -> Optional[int]:
+        """Borsa sunucu zamanı (ms). Desteklenmiyorsa None."""
+        return None
+
+    async def get_price_tick(self, symbol: str) -> Optional[float]:
+        """Sembolün fiyat adımı (tick size). Bilinmiyorsa None."""
+        return None
+
+    async def get_market(self, symbol: str) -> Optional[MarketInfo]:
+        """Sembolün precision / lot adımı / min miktar bilgisi. Bilinmiyorsa None."""
+        return None
+
+    async def place_stop_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        """Reduce-only STOP_MARKET (BaseExchange.place_stop_order). Desteklenmiyorsa NotImplementedError."""
+        raise NotImplementedError("place_stop_order is not supported")
+
+    async def amend_stop_order(
+        self,
+        order_id: str,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        """Varsayılan: iptal + yeniden gönder; iptal edilemezse RuntimeError (BaseExchange ile aynı)."""
+        if not await self.cancel_stop_order(order_id, symbol):
+            raise RuntimeError(f"Stop order iptal edilemedi: {order_id}")
+        return await self.place_stop_order(symbol, side, quantity, stop_price)
+
+    async def cancel_stop_order(self, order_id: str, symbol: str) -> bool:
+        """Stop order iptal eder. Varsayılan: cancel_order."""
+        return await self.cancel_order(order_id, symbol)
+
+    async def close(self) -> None:
+        """Bağlantıları kapatır (ccxt async session). Varsayılan: bir şey yapmaz."""
+        return None
+
+
+class AsyncExchangeAdapter(AsyncBaseExchange):
+    """
+    Sync BaseExchange'i AsyncBaseExchange olarak sunar; her çağrı asyncio.to_thread ile
+    worker thread'de çalışır. Yerel sahte borsa veya CachedExchange ile async engine'i
+    çalıştırmak için.
+    """
+
+    def __init__(self, exchange: BaseExchange):
+        self._inner = exchange
+
+    @property
+    def inner(self) -> BaseExchange:
+        """Sarılan sync exchange."""
+        return self._inner
+
+    async def get_balance(self) -> float:
+        return await asyncio.to_thread(self._inner.get_balance)
+
+    async def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._inner.get_positions, symbol)
+
+    async def get_klines(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 500,
+        since: Optional[int] = None,
+    ) -> List[List[Any]]:
+        return await asyncio.to_thread(self._inner.get_klines, symbol, timeframe, limit, since=since)
+
+    async def get_ticker(self, symbol: str) -> Dict[str, float]:
+        return await asyncio.to_thread(self._inner.get_ticker, symbol)
+
+    async def get_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        return await asyncio.to_thread(self._inner.get_tickers, symbols)
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        order_type: str = "market",
+        stop_price: Optional[float] = None,
+        reduce_only: bool = False,
+    ) -> Dict[str, Any]:
+        return await asyncio.to_thread(
+            self._inner.place_order,
+            symbol,
+            side,
+            quantity,
+            order_type=order_type,
+            stop_price=stop_price,
+            reduce_only=reduce_only,
+        )
+
+    async def cancel_order(self, order_id: str, symbol: str) -> bool:
+        return await asyncio.to_thread(self._inner.cancel_order, order_id, symbol)
+
+    async def fetch_order(self, order_id: str, symbol: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._inner.fetch_order, order_id, symbol)
+
+    async def get_server_time(self) -> Optional[int]:
+        return await asyncio.to_thread(self._inner.get_server_time)
+
+    async def get_price_tick(self, symbol: str) -> Optional[float]:
+        return await asyncio.to_thread(self._inner.get_price_tick, symbol)
+
+    async def get_market(self, symbol: str) -> Optional[MarketInfo]:
+        return await asyncio.to_thread(self._inner.get_market, symbol)
+
+    async def place_stop_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._inner.place_stop_order, symbol, side, quantity, stop_price)
+
+    async def amend_stop_order(
+        self,
+        order_id: str,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._inner.amend_stop_order, order_id, symbol, side, quantity, stop_price)
+
+    async def cancel_stop_order(self, order_id: str, symbol: str) -> bool:
+        return await asyncio.to_thread(self._inner.cancel_stop_order, order_id, symbol)
@@ -0,0 +1,276 @@
+"""
+Async Futures Connector'ları - ccxt.async_support ile Binance USDT-M ve MEXC swap.
+
+Sync karşılıkları: binance_futures.py, mexc_futures.py (aynı config ve dönüş formatları).
+ccxt async client'ı aiohttp session'ı tutar; iş bitince close() çağrılmalıdır.
+"""
+
+import functools
+from typing import Any, Dict, List, Optional, Tuple
+
+from .async_base_exchange import AsyncBaseExchange
+from .ccxt_tickers import AsyncCcxtTickersMixin, ticker_prices
+from .market_cache import MarketCache, MarketInfo, MarketMetadata
+from .rate_limiter import BINANCE_WEIGHTS, Priority, RateLimiter, acquire_for_async, limited
+
+
+class _AsyncCcxtFuturesExchange(AsyncCcxtTickersMixin, AsyncBaseExchange):
+    """ccxt async client üzerinden ortak futures implementasyonu. Alt sınıflar _load_client yazar."""
+
+    _venue = "binance"  # market cache dosya adı
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        testnet: bool = True,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self._api_key = api_key
+        self._api_secret = api_secret
+        self._testnet = testnet
+        self._limiter = limiter
+        self._client = None
+        self._load_client()
+        # Market'ler diskten; eksik / eski ise ilk market isteğinde (load_async) yüklenir / yenilenir
+        self._metadata = MarketMetadata(
+            self._client,
+            MarketCache.for_exchange(self._venue, self._testnet),
+            before_fetch=functools.partial(acquire_for_async, self, "load_markets", Priority.SCAN),
+        )
+        self._metadata.warm(refresh=False)
+
+    def _load_client(self) -> None:
+        raise NotImplementedError
+
+    def _stop_order_request(self, stop_price: float) -> Tuple[str, Dict[str, Any]]:
+        """Reduce-only tetikli market order için (ccxt order type, params). Varsayılan: unified triggerPrice."""
+        return "market", {"triggerPrice": stop_price, "reduceOnly": True}
+
+    def _stop_cancel_params(self) -> Dict[str, Any]:
+        """Stop order iptali için ek ccxt params."""
+        return {}
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+
+    @limited("balance", Priority.UI)
+    async def get_balance(self) -> float:
+        """USDT cinsinden kullanılabilir bakiye."""
+        balance = await self._client.fetch_balance()
+        if "USDT" in balance.get("total", {}):
+            return float(balance["total"].get("USDT") or 0)
+        return 0.0
+
+    @limited("positions", Priority.TRAILING)
+    async def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Açık pozisyonlar. ccxt: contracts + veya - ile yön verir."""
+        positions = await self._client.fetch_positions()
+        out = []
+        for p in positions:
+            contracts = p.get("contracts")
+            if contracts is None:
+                continue
+            try:
+                size = abs(float(contracts))
+            except (TypeError, ValueError):
+                continue
+            if size == 0:
+                continue
+            sym = p.get("symbol", "")
+            if symbol and sym != symbol:
+                continue
+            side = "long" if float(contracts) > 0 else "short"
+            out.append({
+                "symbol": sym,
+                "side": side,
+                "size": size,
+                "entry_price": float(p.get("entryPrice") or 0),
+                "mark_price": float(p.get("markPrice") or p.get("lastPrice") or 0),
+                "unrealized_pnl": float(p.get("unrealizedPnl") or 0),
+                "leverage": float(p.get("leverage") or 1),
+            })
+        return out
+
+    @limited("klines", Priority.SCAN)
+    async def get_klines(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 500,
+        since: Optional[int] = None,
+    ) -> List[List[Any]]:
+        """OHLCV. ccxt: [timestamp, open, high, low, close, volume]."""
+        return await self._client.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
+
+    @limited("ticker", Priority.TRAILING)
+    async def get_ticker(self, symbol: str) -> Dict[str, float]:
+        t = await self._client.fetch_ticker(symbol)
+        return ticker_prices(t)
+
+    @limited("order", Priority.ORDER, fixed=True)
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        order_type: str = "market",
+        stop_price: Optional[float] = None,
+        reduce_only: bool = False,
+    ) -> Dict[str, Any]:
+        """Market veya limit order. reduce_only için params kullanılır."""
+        params = {}
+        if reduce_only:
+            params["reduceOnly"] = True
+
+        if order_type == "market":
+            order = await self._client.create_order(
+                symbol=symbol,
+                type="market",
+                side=side,
+                amount=quantity,
+                params=params,
+            )
+        else:
+            order = await self._client.create_order(
+                symbol=symbol,
+                type="limit",
+                side=side,
+                amount=quantity,
+                price=stop_price or 0,
+                params=params,
+            )
+
+        filled = float(order.get("filled") or 0)
+        avg = order.get("average")
+        return {
+            "order_id": order.get("id"),
+            "symbol": order.get("symbol"),
+            "side": order.get("side"),
+            "filled": filled,
+            "avg_price": float(avg) if avg is not None else None,
+            "raw": order,
+        }
+
+    @limited("order", Priority.ORDER, fixed=True)
+    async def cancel_order(self, order_id: str, symbol: str) -> bool:
+        try:
+            await self._client.cancel_order(order_id, symbol)
+            return True
+        except Exception:
+            return False
+
+    @limited("order", Priority.ORDER)
+    async def fetch_order(self, order_id: str, symbol: str) -> Optional[Dict[str, Any]]:
+        try:
+            return await self._client.fetch_order(order_id, symbol)
+        except Exception:
+            return None
+
+    @limited("time", Priority.SCAN)
+    async def get_server_time(self) -> Optional[int]:
+        return int(await self._client.fetch_time())
+
+    async def get_price_tick(self, symbol: str) -> Optional[float]:
+        """ccxt market precision'ından fiyat adımı (market index'i)."""
+        market = await self.get_market(symbol)
+        return market.price_tick if market is not None else None
+
+    async def get_market(self, symbol: str) -> Optional[MarketInfo]:
+        """Precision / lot / min miktar; market'ler diskten (market_cache.py) veya ilk çağrıda ağdan."""
+        try:
+            await self._metadata.load_async()
+        except Exception:
+            return None
+        return self._metadata.market(symbol)
+
+    @limited("order", Priority.ORDER, fixed=True)
+    async def place_stop_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        order_type, params = self._stop_order_request(stop_price)
+        order = await self._client.create_order(
+            symbol=symbol,
+            type=order_type,
+            side=side,
+            amount=quantity,
+            params=params,
+        )
+        avg = order.get("average")
+        return {
+            "order_id": order.get("id"),
+            "symbol": order.get("symbol"),
+            "side": order.get("side"),
+            "filled": float(order.get("filled") or 0),
+            "avg_price": float(avg) if avg is not None else None,
+            "stop_price": float(stop_price),
+            "raw": order,
+        }
+
+    @limited("order", Priority.ORDER, fixed=True)
+    async def cancel_stop_order(self, order_id: str, symbol: str) -> bool:
+        try:
+            await self._client.cancel_order(order_id, symbol, params=self._stop_cancel_params())
+            return True
+        except Exception:
+            return False
+
+
+class AsyncBinanceFuturesExchange(_AsyncCcxtFuturesExchange):
+    """Binance USDT-M Perpetual Futures (async)."""
+
+    _weights = BINANCE_WEIGHTS
+    _tickers_method = "fetch_last_prices"  # /fapi/v1/ticker/price (ccxt_tickers.py)
+
+    def _stop_order_request(self, stop_price: float) -> Tuple[str, Dict[str, Any]]:
+        return "STOP_MARKET", {"stopPrice": stop_price, "reduceOnly": True, "workingType": "MARK_PRICE"}
+
+    def _load_client(self) -> None:
+        import ccxt.async_support as ccxt_async
+
+        self._client = ccxt_async.binance({
+            "apiKey": self._api_key,
+            "secret": self._api_secret,
+            "enableRateLimit": self._limiter is None,
+            "options": {"defaultType": "future"},
+        })
+        if self._testnet:
+            self._client.set_sandbox_mode(True)
+
+
+class AsyncMEXCFuturesExchange(_AsyncCcxtFuturesExchange):
+    """MEXC USDT-M Perpetual Swap (async)."""
+
+    _venue = "mexc"
+
+    def _stop_cancel_params(self) -> Dict[str, Any]:
+        return {"trigger": True}  # Plan order'lar ayrı endpoint'ten iptal edilir
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        testnet: bool = False,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        super().__init__(api_key, api_secret, testnet, limiter)
+
+    def _load_client(self) -> None:
+        import ccxt.async_support as ccxt_async
+
+        self._client = ccxt_async.mexc({
+            "apiKey": self._api_key,
+            "secret": self._api_secret,
+            "enableRateLimit": self._limiter is None,
+            "options": {"defaultType": "swap"},
+        })
+        if self._testnet:
+            try:
+                self._client.set_sandbox_mode(True)
+            except Exception:
+                pass  # MEXC sandbox desteklemiyorsa devam et
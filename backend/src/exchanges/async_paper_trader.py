@@ -0,0 +1,125 @@
+"""
+Async Paper Trader - PaperTrader'ın asyncio karşılığı.
+
+Piyasa verisi bir AsyncBaseExchange'den alınır; bakiye/pozisyon/dolum mantığı PaperTrader ile
+aynıdır (PaperBook).
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .async_base_exchange import AsyncBaseExchange
+from .base_exchange import KlineRequest
+from .market_cache import MarketInfo
+from .paper_trader import PaperBook, ticker_price
+from .rate_limiter import Priority, request_priority
+
+
+class AsyncPaperTrader(AsyncBaseExchange):
+    """
+    Paper trade (async): Order'lar gerçek gönderilmez, anlık fiyattan doldurulmuş kabul edilir.
+    data_exchange: Sadece piyasa verisi (klines, ticker) için kullanılır.
+    book: Verilirse bu defter kullanılır (sync PaperTrader ile aynı paper state'i paylaşmak için).
+    """
+
+    def __init__(
+        self,
+        initial_balance: float,
+        data_exchange: AsyncBaseExchange,
+        book: Optional[PaperBook] = None,
+    ):
+        self._book = book if book is not None else PaperBook(initial_balance)
+        self._data = data_exchange
+
+    @property
+    def book(self) -> PaperBook:
+        return self._book
+
+    async def close(self) -> None:
+        await self._data.close()
+
+    async def get_balance(self) -> float:
+        return self._book.balance
+
+    async def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        symbols = self._book.symbols(symbol)
+        try:
+            tickers = await self._data.get_tickers(symbols) if symbols else {}
+        except Exception:
+            tickers = {}
+        return self._book.position_rows(tickers, symbol)
+
+    async def get_klines(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 500,
+        since: Optional[int] = None,
+    ) -> List[List[Any]]:
+        return await self._data.get_klines(symbol, timeframe, limit, since=since)
+
+    async def get_ticker(self, symbol: str) -> Dict[str, float]:
+        ticker = await self._data.get_ticker(symbol)
+        self._book.trigger_stops({symbol: ticker_price(ticker)})
+        return ticker
+
+    async def get_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        tickers = await self._data.get_tickers(symbols)
+        self._book.trigger_stops({s: ticker_price(t) for s, t in tickers.items()})
+        return tickers
+
+    async def get_klines_many(self, requests: List[KlineRequest]) -> Dict[Tuple[str, str], List[List[Any]]]:
+        return await self._data.get_klines_many(requests)
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        order_type: str = "market",
+        stop_price: Optional[float] = None,
+        reduce_only: bool = False,
+    ) -> Dict[str, Any]:
+        """Simüle: Anlık fiyattan doldurulmuş kabul edilir (fiyat isteği emir önceliğinde)."""
+        with request_priority(Priority.ORDER):
+            price = ticker_price(await self._data.get_ticker(symbol))
+        self._book.trigger_stops({symbol: price})
+        return self._book.fill(symbol, side, quantity, price, reduce_only)
+
+    async def place_order_at(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: float,
+        reduce_only: bool = False,
+    ) -> Dict[str, Any]:
+        """Simüle: Order'ı verilen fiyattan doldurur (PaperTrader.place_order_at)."""
+        return self._book.fill(symbol, side, quantity, price, reduce_only)
+
+    async def cancel_order(self, order_id: str, symbol: str) -> bool:
+        return True  # Paper'da bekleyen order yok
+
+    async def fetch_order(self, order_id: str, symbol: str) -> Optional[Dict[str, Any]]:
+        return self._book.stop_order(order_id)
+
+    async def get_server_time(self) -> Optional[int]:
+        return await self._data.get_server_time()
+
+    async def get_price_tick(self, symbol: str) -> Optional[float]:
+        return await self._data.get_price_tick(symbol)
+
+    async def get_market(self, symbol: str) -> Optional[MarketInfo]:
+        return await self._data.get_market(symbol)
+
+    async def place_stop_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        """Simüle: fiyat stop'a gelince (get_ticker/get_tickers) doldurulur."""
+        return self._book.add_stop(symbol, side, quantity, stop_price)
+
+    async def cancel_stop_order(self, order_id: str, symbol: str) -> bool:
+        return self._book.cancel_stop(order_id)
@@ -10,7 +10,12 @@ Kullanım:
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .market_cache import MarketInfo
+
+# get_klines_many isteği: (symbol, timeframe, limit) veya (symbol, timeframe, limit, since)
+KlineRequest = Sequence[Any]
 
 
 class BaseExchange(ABC):
@@ -53,6 +58,7 @@ class BaseExchange(ABC):
         symbol: str,
         timeframe: str,
         limit: int = 500,
+        since: Optional[int] = None,
     ) -> List[List[Any]]:
         """
         Mum (OHLCV) verisi. ccxt format: [timestamp, open, high, low, close, volume].
@@ -61,6 +67,7 @@ class BaseExchange(ABC):
             symbol: Örn. BTCUSDT
             timeframe: 1m, 5m, 15m, 1h, 4h, 1d
             limit: Mum sayısı
+            since: Başlangıç zamanı (ms). None ise en son limit mum döner.
 
         Returns:
             [[ts, o, h, l, c, v], ...]
@@ -107,6 +114,105 @@ class BaseExchange(ABC):
         """
         raise NotImplementedError("get_ticker must be implemented")
 
+    def get_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Çok sembol için son fiyat. Varsayılan: sembol başına get_ticker (fan-out).
+        Native toplu endpoint'i olan borsalar override eder (tek istek).
+
+        Returns:
+            { symbol: { 'last': float, 'bid': float, 'ask': float } }
+            Fiyatı alınamayan semboller sonuçta yer almaz.
+        """
+        out: Dict[str, Dict[str, float]] = {}
+        for symbol in symbols:
+            try:
+                out[symbol] = self.get_ticker(symbol)
+            except Exception:
+                continue
+        return out
+
+    def get_klines_many(
+        self,
+        requests: List[KlineRequest],
+    ) -> Dict[Tuple[str, str], List[List[Any]]]:
+        """
+        Çok (symbol, timeframe) için mum verisi. Varsayılan: istek başına get_klines (fan-out).
+
+        Args:
+            requests: [(symbol, timeframe, limit), ...]; 4. eleman olarak since (ms) verilebilir.
+
+        Returns:
+            { (symbol, timeframe): [[ts, o, h, l, c, v], ...] }
+            Hata alan istekler sonuçta yer almaz.
+        """
+        out: Dict[Tuple[str, str], List[List[Any]]] = {}
+        for req in requests:
+            symbol, timeframe, limit = req[0], req[1], int(req[2])
+            since = req[3] if len(req) > 3 else None
+            try:
+                out[(symbol, timeframe)] = self.get_klines(symbol, timeframe, limit, since=since)
+            except Exception:
+                continue
+        return out
+
     def fetch_order(self, order_id: str, symbol: str) -> Optional[Dict[str, Any]]:
         """Order durumunu getirir. İsteğe bağlı."""
         return None
+
+    def get_server_time(self) -> Optional[int]:
+        """Borsa sunucu zamanı (ms). Desteklenmiyorsa None (yerel saat kullanılır)."""
+        return None
+
+    def get_price_tick(self, symbol: str) -> Optional[float]:
+        """Sembolün fiyat adımı (tick size). Bilinmiyorsa None."""
+        return None
+
+    def get_market(self, symbol: str) -> Optional[MarketInfo]:
+        """Sembolün precision / lot adımı / min miktar bilgisi (miktar yuvarlama için). Bilinmiyorsa None."""
+        return None
+
+    def place_stop_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        """
+        Reduce-only STOP_MARKET order: fiyat stop_price'a gelince pozisyon borsa tarafında kapanır.
+
+        Args:
+            symbol: BTCUSDT
+            side: 'buy' | 'sell' (kapatma yönü; long pozisyon için sell)
+            quantity: Miktar
+            stop_price: Tetik fiyatı
+
+        Returns:
+            { 'order_id': str, 'stop_price': float, ... }
+        Desteklemeyen borsalar NotImplementedError verir (stop sadece engine tarafında kalır).
+        """
+        raise NotImplementedError("place_stop_order is not supported")
+
+    def amend_stop_order(
+        self,
+        order_id: str,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        """
+        Stop order'ın tetik fiyatını değiştirir. Varsayılan: iptal + yeniden gönder (Binance/MEXC
+        STOP_MARKET order'ında fiyat düzenleme yok). İptal edilemezse (order tetiklenmiş veya
+        kapanmış olabilir) yeni order gönderilmez, RuntimeError.
+
+        Returns:
+            Yeni stop order (place_stop_order formatı)
+        """
+        if not self.cancel_stop_order(order_id, symbol):
+            raise RuntimeError(f"Stop order iptal edilemedi: {order_id}")
+        return self.place_stop_order(symbol, side, quantity, stop_price)
+
+    def cancel_stop_order(self, order_id: str, symbol: str) -> bool:
+        """Stop order iptal eder. Varsayılan: cancel_order."""
+        return self.cancel_order(order_id, symbol)
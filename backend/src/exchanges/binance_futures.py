@@ -4,23 +4,32 @@ Binance Futures Connector - ccxt ile Binance USDT-M Futures API.
 Config'ten okur: exchange.name, exchange.api_key, exchange.api_secret, exchange.testnet
 """
 
+import functools
 from typing import Any, Dict, List, Optional
 
 from .base_exchange import BaseExchange
+from .ccxt_tickers import CcxtTickersMixin, ticker_prices
+from .market_cache import MarketCache, MarketInfo, MarketMetadata
+from .rate_limiter import BINANCE_WEIGHTS, Priority, RateLimiter, acquire_for, limited
 
 
-class BinanceFuturesExchange(BaseExchange):
+class BinanceFuturesExchange(CcxtTickersMixin, BaseExchange):
     """Binance USDT-M Perpetual Futures."""
 
+    _weights = BINANCE_WEIGHTS
+    _tickers_method = "fetch_last_prices"  # /fapi/v1/ticker/price (ccxt_tickers.py)
+
     def __init__(
         self,
         api_key: str,
         api_secret: str,
         testnet: bool = True,
+        limiter: Optional[RateLimiter] = None,
     ):
         self._api_key = api_key
         self._api_secret = api_secret
         self._testnet = testnet
+        self._limiter = limiter
         self._client = None
         self._load_client()
 
@@ -30,12 +39,19 @@ class BinanceFuturesExchange(BaseExchange):
         self._client = ccxt.binance({
             "apiKey": self._api_key,
             "secret": self._api_secret,
-            "enableRateLimit": True,
+            "enableRateLimit": self._limiter is None,  # limiter varsa bekleme orada (rate_limiter.py)
             "options": {"defaultType": "future"},
         })
         if self._testnet:
             self._client.set_sandbox_mode(True)
-
+        self._metadata = MarketMetadata(
+            self._client,
+            MarketCache.for_exchange("binance", self._testnet),
+            before_fetch=functools.partial(acquire_for, self, "load_markets", Priority.SCAN),
+        )
+        self._metadata.warm()
+
+    @limited("balance", Priority.UI)
     def get_balance(self) -> float:
         """USDT cinsinden kullanılabilir bakiye (futures wallet)."""
         balance = self._client.fetch_balance()
@@ -44,6 +60,7 @@ class BinanceFuturesExchange(BaseExchange):
             return float(balance["total"].get("USDT") or 0)
         return 0.0
 
+    @limited("positions", Priority.TRAILING)
     def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """Açık pozisyonlar. symbol None ise tümü. ccxt: contracts + veya - ile yön verir."""
         positions = self._client.fetch_positions()
@@ -73,25 +90,25 @@ class BinanceFuturesExchange(BaseExchange):
             })
         return out
 
+    @limited("klines", Priority.SCAN)
     def get_klines(
         self,
         symbol: str,
         timeframe: str,
         limit: int = 500,
+        since: Optional[int] = None,
     ) -> List[List[Any]]:
         """OHLCV. ccxt: [timestamp, open, high, low, close, volume]."""
-        ohlcv = self._client.fetch_ohlcv(symbol, timeframe, limit=limit)
+        ohlcv = self._client.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
         return ohlcv
 
+    @limited("ticker", Priority.TRAILING)
     def get_ticker(self, symbol: str) -> Dict[str, float]:
         """Son fiyat."""
         t = self._client.fetch_ticker(symbol)
-        return {
-            "last": float(t.get("last") or 0),
-            "bid": float(t.get("bid") or 0),
-            "ask": float(t.get("ask") or 0),
-        }
+        return ticker_prices(t)
 
+    @limited("order", Priority.ORDER, fixed=True)
     def place_order(
         self,
         symbol: str,
@@ -142,6 +159,7 @@ class BinanceFuturesExchange(BaseExchange):
             "raw": order,
         }
 
+    @limited("order", Priority.ORDER, fixed=True)
     def cancel_order(self, order_id: str, symbol: str) -> bool:
         try:
             self._client.cancel_order(order_id, symbol)
@@ -149,8 +167,46 @@ class BinanceFuturesExchange(BaseExchange):
         except Exception:
             return False
 
+    @limited("order", Priority.ORDER)
     def fetch_order(self, order_id: str, symbol: str) -> Optional[Dict[str, Any]]:
         try:
             return self._client.fetch_order(order_id, symbol)
         except Exception:
             return None
+
+    @limited("time", Priority.SCAN)
+    def get_server_time(self) -> Optional[int]:
+        return int(self._client.fetch_time())
+
+    def get_price_tick(self, symbol: str) -> Optional[float]:
+        """ccxt market precision'ından fiyat adımı (market index'i)."""
+        market = self.get_market(symbol)
+        return market.price_tick if market is not None else None
+
+    def get_market(self, symbol: str) -> Optional[MarketInfo]:
+        """Precision / lot / min miktar; market'ler diskten (market_cache.py) veya ilk çağrıda ağdan."""
+        try:
+            self._metadata.load()
+        except Exception:
+            return None
+        return self._metadata.market(symbol)
+
+    @limited("order", Priority.ORDER, fixed=True)
+    def place_stop_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        """Reduce-only STOP_MARKET (mark price ile tetiklenir)."""
+        order = self._client.create_order(
+            symbol=symbol,
+            type="STOP_MARKET",
+            side=side,
+            amount=quantity,
+            params={"stopPrice": stop_price, "reduceOnly": True, "workingType": "MARK_PRICE"},
+        )
+        out = self._normalize_order_response(order, quantity)
+        out["stop_price"] = float(stop_price)
+        return out
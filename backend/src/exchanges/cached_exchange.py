@@ -0,0 +1,213 @@
+"""
+Cached Exchange - get_klines önünde (symbol, timeframe) başına artımlı mum cache'i.
+
+Her engine döngüsünde aynı semboller için yüzlerce mum tekrar indiriliyordu; oysa iki döngü
+arasında en fazla bir yeni bar oluşur. Bu wrapper her (symbol, timeframe) için sınırlı bir
+ring buffer tutar ve sonraki çağrılarda sadece son cache'lenmiş bar'dan itibaren çeker.
+Son bar (henüz kapanmamış, oluşmakta olan bar) her çağrıda yeniden çekilip üzerine yazılır.
+
+Binance, MEXC ve PaperTrader ile kullanılabilir; diğer tüm metodlar sarılan exchange'e devredilir.
+
+Kullanım:
+    exchange = CachedExchange(BinanceFuturesExchange(...))
+    exchange.get_klines("BTC/USDT", "15m", limit=250)  # ilk çağrı: 250 mum
+    exchange.get_klines("BTC/USDT", "15m", limit=250)  # sonraki: sadece son 1-2 mum çekilir
+"""
+
+import threading
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .base_exchange import BaseExchange
+from .market_cache import MarketInfo
+
+try:
+    from ..core.timeframes import timeframe_to_ms
+except ImportError:
+    from core.timeframes import timeframe_to_ms
+
+
+class _KlineBuffer:
+    """Tek (symbol, timeframe) için cache'lenmiş mumlar."""
+
+    def __init__(self, max_bars: int):
+        self.bars: Deque[List[Any]] = deque(maxlen=max_bars)
+        # Borsa istenenden az mum döndürdüyse geçmiş bitmiştir; daha derin çekmeye gerek yok
+        self.exhausted = False
+        self.lock = threading.Lock()
+
+
+class CachedExchange(BaseExchange):
+    """
+    BaseExchange wrapper: get_klines sonuçlarını artımlı olarak cache'ler.
+    max_bars: (symbol, timeframe) başına tutulacak en fazla mum (ring buffer boyu).
+    """
+
+    def __init__(self, exchange: BaseExchange, max_bars: int = 1000):
+        self._inner = exchange
+        self._max_bars = int(max_bars)
+        self._buffers: Dict[Tuple[str, str], _KlineBuffer] = {}
+        self._buffers_lock = threading.Lock()
+
+    @property
+    def inner(self) -> BaseExchange:
+        """Sarılan exchange."""
+        return self._inner
+
+    def __getattr__(self, name: str) -> Any:
+        # _client gibi connector'a özel alanlar sarılan exchange'den okunur
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+    def _buffer(self, symbol: str, timeframe: str) -> _KlineBuffer:
+        key = (symbol, timeframe)
+        with self._buffers_lock:
+            buf = self._buffers.get(key)
+            if buf is None:
+                buf = _KlineBuffer(self._max_bars)
+                self._buffers[key] = buf
+            return buf
+
+    def get_klines(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 500,
+        since: Optional[int] = None,
+    ) -> List[List[Any]]:
+        """
+        Cache'ten mum döndürür; eksik/yeni bar'ları sarılan exchange'den tamamlar.
+        get_klines_many (BaseExchange fan-out) da bu metodu kullandığı için cache'ten geçer.
+        since verilirse veya limit buffer boyunu aşarsa cache atlanır.
+        """
+        if since is not None or limit > self._max_bars:
+            return self._inner.get_klines(symbol, timeframe, limit, since=since)
+        try:
+            tf_ms = timeframe_to_ms(timeframe)
+        except ValueError:
+            return self._inner.get_klines(symbol, timeframe, limit)
+
+        buf = self._buffer(symbol, timeframe)
+        with buf.lock:
+            if not buf.bars or (len(buf.bars) < limit and not buf.exhausted):
+                self._full_fetch(buf, symbol, timeframe, limit)
+            else:
+                self._incremental_fetch(buf, symbol, timeframe, limit, tf_ms)
+            n = len(buf.bars)
+            return list(islice(buf.bars, max(0, n - limit), n))
+
+    def _full_fetch(self, buf: _KlineBuffer, symbol: str, timeframe: str, limit: int) -> None:
+        rows = self._inner.get_klines(symbol, timeframe, limit) or []
+        buf.bars.clear()
+        buf.bars.extend(rows)
+        buf.exhausted = len(rows) < limit
+
+    def _incremental_fetch(
+        self,
+        buf: _KlineBuffer,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        tf_ms: int,
+    ) -> None:
+        last_ts = int(buf.bars[-1][0])
+        now_ms = int(time.time() * 1000)
+        # Son cache'lenmiş bar (dahil) + o zamandan beri açılan bar'lar; saat farkı için +1 pay
+        missing = max(0, (now_ms - last_ts) // tf_ms) + 2
+        if missing >= limit:
+            # Boşluk çok büyük (engine uzun süre durmuş): baştan çek
+            self._full_fetch(buf, symbol, timeframe, limit)
+            return
+        rows = self._inner.get_klines(symbol, timeframe, missing, since=last_ts) or []
+        if not rows:
+            return
+        if int(rows[0][0]) > last_ts:
+            # Beklenmeyen boşluk: cache'e güvenme
+            self._full_fetch(buf, symbol, timeframe, limit)
+            return
+        first_ts = int(rows[0][0])
+        while buf.bars and int(buf.bars[-1][0]) >= first_ts:
+            buf.bars.pop()
+        buf.bars.extend(rows)
+
+    def clear(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> None:
+        """Cache'i temizler. symbol/timeframe verilirse sadece eşleşen buffer'lar silinir."""
+        with self._buffers_lock:
+            for key in list(self._buffers.keys()):
+                if symbol is not None and key[0] != symbol:
+                    continue
+                if timeframe is not None and key[1] != timeframe:
+                    continue
+                del self._buffers[key]
+
+    # --- Devredilen metodlar ---
+
+    def get_balance(self) -> float:
+        return self._inner.get_balance()
+
+    def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self._inner.get_positions(symbol)
+
+    def get_ticker(self, symbol: str) -> Dict[str, float]:
+        return self._inner.get_ticker(symbol)
+
+    def get_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        return self._inner.get_tickers(symbols)
+
+    def place_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        order_type: str = "market",
+        stop_price: Optional[float] = None,
+        reduce_only: bool = False,
+    ) -> Dict[str, Any]:
+        return self._inner.place_order(
+            symbol,
+            side,
+            quantity,
+            order_type=order_type,
+            stop_price=stop_price,
+            reduce_only=reduce_only,
+        )
+
+    def cancel_order(self, order_id: str, symbol: str) -> bool:
+        return self._inner.cancel_order(order_id, symbol)
+
+    def fetch_order(self, order_id: str, symbol: str) -> Optional[Dict[str, Any]]:
+        return self._inner.fetch_order(order_id, symbol)
+
+    def get_server_time(self) -> Optional[int]:
+        return self._inner.get_server_time()
+
+    def get_price_tick(self, symbol: str) -> Optional[float]:
+        return self._inner.get_price_tick(symbol)
+
+    def get_market(self, symbol: str) -> Optional[MarketInfo]:
+        return self._inner.get_market(symbol)
+
+    def place_stop_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        return self._inner.place_stop_order(symbol, side, quantity, stop_price)
+
+    def amend_stop_order(
+        self,
+        order_id: str,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        return self._inner.amend_stop_order(order_id, symbol, side, quantity, stop_price)
+
+    def cancel_stop_order(self, order_id: str, symbol: str) -> bool:
+        return self._inner.cancel_stop_order(order_id, symbol)
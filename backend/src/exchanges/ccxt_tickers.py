@@ -0,0 +1,83 @@
+"""
+ccxt connector'ları için ortak toplu fiyat (get_tickers).
+
+İstenen sembol (BTC/USDT) -> ccxt market sembolü (BTC/USDT:USDT) eşlemesi ve {last, bid, ask}
+dönüşümü burada; connector sadece toplu fiyat metodunu (_tickers_method) seçer.
+
+Trailing monitor bu isteği 1–2 sn'de bir atar: endpoint ucuz olmalı. Binance USDT-M'de ccxt
+fetch_tickers sembol listesinden bağımsız /fapi/v1/ticker/24hr (ağırlık 40) çağırır; Binance
+connector'ları fetch_last_prices (/fapi/v1/ticker/price, ağırlık 2) kullanır (bid/ask 0 döner).
+
+Kullanım:
+    class BinanceFuturesExchange(CcxtTickersMixin, BaseExchange): ...
+    class _AsyncCcxtFuturesExchange(AsyncCcxtTickersMixin, AsyncBaseExchange): ...
+"""
+
+from typing import Any, Callable, Dict, List
+
+from .rate_limiter import Priority, limited
+
+
+def ticker_prices(ticker: Dict[str, Any]) -> Dict[str, float]:
+    """ccxt ticker'ından (veya fetch_last_prices kaydından: price) {last, bid, ask}; eksik alan 0."""
+    return {
+        "last": float(ticker.get("last") or ticker.get("price") or 0),
+        "bid": float(ticker.get("bid") or 0),
+        "ask": float(ticker.get("ask") or 0),
+    }
+
+
+def _market_symbols(metadata, symbols: List[str]) -> Dict[str, str]:
+    """ccxt market sembolü -> istenen sembol (market bilinmiyorsa sembol aynen)."""
+    wanted: Dict[str, str] = {}
+    for symbol in symbols:
+        market = metadata.market(symbol)
+        wanted[market.symbol if market is not None else symbol] = symbol
+    return wanted
+
+
+def _collect(tickers: Dict[str, Dict[str, Any]], wanted: Dict[str, str]) -> Dict[str, Dict[str, float]]:
+    return {wanted[s]: ticker_prices(t) for s, t in tickers.items() if s in wanted}
+
+
+def _fetch_method(connector) -> Callable[..., Any]:
+    """Connector'ın toplu fiyat metodu; eski ccxt'de yoksa fetch_tickers."""
+    return getattr(connector._client, connector._tickers_method, None) or connector._client.fetch_tickers
+
+
+class CcxtTickersMixin:
+    """Sync connector'lar (self._client, self._metadata gerekir)."""
+
+    # ccxt toplu fiyat metodu (sembol listesi alır, market sembolü -> kayıt döndürür)
+    _tickers_method = "fetch_tickers"
+
+    def _fetch_tickers(self, market_symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Ham istek: ccxt market sembolü -> ccxt ticker."""
+        return _fetch_method(self)(market_symbols)
+
+    @limited("tickers", Priority.TRAILING)
+    def get_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        """Çok sembol için son fiyat; tek toplu istek."""
+        if not symbols:
+            return {}
+        self._metadata.load()
+        wanted = _market_symbols(self._metadata, symbols)
+        return _collect(self._fetch_tickers(list(wanted.keys())), wanted)
+
+
+class AsyncCcxtTickersMixin:
+    """CcxtTickersMixin'in ccxt.async_support karşılığı."""
+
+    _tickers_method = "fetch_tickers"
+
+    async def _fetch_tickers(self, market_symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        return await _fetch_method(self)(market_symbols)
+
+    @limited("tickers", Priority.TRAILING)
+    async def get_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        """Çok sembol için son fiyat; tek toplu istek."""
+        if not symbols:
+            return {}
+        await self._metadata.load_async()
+        wanted = _market_symbols(self._metadata, symbols)
+        return _collect(await self._fetch_tickers(list(wanted.keys())), wanted)
@@ -12,10 +12,15 @@ Kullanım:
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .async_base_exchange import AsyncBaseExchange
+from .async_futures import AsyncBinanceFuturesExchange, AsyncMEXCFuturesExchange
+from .async_paper_trader import AsyncPaperTrader
 from .base_exchange import BaseExchange
 from .binance_futures import BinanceFuturesExchange
+from .cached_exchange import CachedExchange
 from .mexc_futures import MEXCFuturesExchange
-from .paper_trader import PaperTrader
+from .paper_trader import PaperBook, PaperTrader
+from .rate_limiter import RateLimiter, limiter_from_config
 
 
 def _get(key: str, data: Dict[str, Any], default: Any = None) -> Any:
@@ -30,9 +35,17 @@ def _get(key: str, data: Dict[str, Any], default: Any = None) -> Any:
     return value
 
 
-def get_exchange_from_config_dict(cfg: Dict[str, Any]) -> BaseExchange:
+def get_exchange_from_config_dict(
+    cfg: Dict[str, Any],
+    kline_cache: bool = True,
+    paper_book: Optional[PaperBook] = None,
+    limiter: Optional[RateLimiter] = None,
+) -> BaseExchange:
     """
     Config dict'ine göre exchange döndürür (dosyaya yazmadan test için).
+    kline_cache: True ise piyasa verisi CachedExchange ile sarılır (artımlı get_klines).
+    paper_book: Paper trade'de kullanılacak ortak defter (exchanges/registry.py); None ise yeni defter.
+    limiter: Borsa isteklerinin öncelikli rate limiter'ı (rate_limiter.py); None ise config'ten yenisi.
     """
     name = (str(_get("exchange.name", cfg) or "binance")).lower().strip()
     api_key = str(_get("exchange.api_key", cfg) or "")
@@ -40,34 +53,86 @@ def get_exchange_from_config_dict(cfg: Dict[str, Any]) -> BaseExchange:
     testnet = bool(_get("exchange.testnet", cfg, True))
     paper_trade = bool(_get("exchange.paper_trade", cfg, True))
     fixed_balance = float(_get("account.fixed_balance", cfg) or 1000)
+    if limiter is None:
+        limiter = limiter_from_config(cfg)
 
     if name == "binance":
         real_exchange = BinanceFuturesExchange(
             api_key=api_key,
             api_secret=api_secret,
             testnet=testnet,
+            limiter=limiter,
         )
     elif name == "mexc":
         real_exchange = MEXCFuturesExchange(
             api_key=api_key,
             api_secret=api_secret,
             testnet=testnet,
+            limiter=limiter,
         )
     else:
         real_exchange = BinanceFuturesExchange(
             api_key=api_key,
             api_secret=api_secret,
             testnet=testnet,
+            limiter=limiter,
         )
 
+    if kline_cache:
+        real_exchange = CachedExchange(real_exchange)
+
     if paper_trade:
         return PaperTrader(
             initial_balance=fixed_balance,
             data_exchange=real_exchange,
+            book=paper_book,
         )
     return real_exchange
 
 
+def get_async_exchange_from_config_dict(
+    cfg: Dict[str, Any],
+    paper_book: Optional[PaperBook] = None,
+    limiter: Optional[RateLimiter] = None,
+) -> AsyncBaseExchange:
+    """
+    get_exchange_from_config_dict'in async karşılığı (ccxt.async_support connector'ları).
+    limiter sync exchange'inkiyle aynı verilirse ikisi tek istek bütçesini paylaşır.
+    """
+    name = (str(_get("exchange.name", cfg) or "binance")).lower().strip()
+    api_key = str(_get("exchange.api_key", cfg) or "")
+    api_secret = str(_get("exchange.api_secret", cfg) or "")
+    testnet = bool(_get("exchange.testnet", cfg, True))
+    paper_trade = bool(_get("exchange.paper_trade", cfg, True))
+    fixed_balance = float(_get("account.fixed_balance", cfg) or 1000)
+    if limiter is None:
+        limiter = limiter_from_config(cfg)
+
+    if name == "mexc":
+        real_exchange = AsyncMEXCFuturesExchange(
+            api_key=api_key, api_secret=api_secret, testnet=testnet, limiter=limiter
+        )
+    else:
+        real_exchange = AsyncBinanceFuturesExchange(
+            api_key=api_key, api_secret=api_secret, testnet=testnet, limiter=limiter
+        )
+
+    if paper_trade:
+        return AsyncPaperTrader(initial_balance=fixed_balance, data_exchange=real_exchange, book=paper_book)
+    return real_exchange
+
+
+def get_async_exchange(config_path: Optional[str] = None) -> AsyncBaseExchange:
+    """Config dosyasına göre async exchange döndürür (seçim kuralları get_exchange ile aynı)."""
+    try:
+        from ..core.config_manager import get_config
+    except ImportError:
+        from core.config_manager import get_config
+
+    config = get_config(config_path)
+    return get_async_exchange_from_config_dict(config.as_dict())
+
+
 def get_exchange(config_path: Optional[str] = None) -> BaseExchange:
     """
     Config dosyasına göre exchange döndürür.
@@ -80,9 +145,9 @@ def get_exchange(config_path: Optional[str] = None) -> BaseExchange:
         BaseExchange instance
     """
     try:
-        from ..core.config_manager import ConfigManager
+        from ..core.config_manager import get_config
     except ImportError:
-        from core.config_manager import ConfigManager
+        from core.config_manager import get_config
 
-    config = ConfigManager(config_path)
-    return get_exchange_from_config_dict(config.get_all())
+    config = get_config(config_path)
+    return get_exchange_from_config_dict(config.as_dict())
@@ -0,0 +1,284 @@
+"""
+Market Cache - ccxt piyasa bilgisinin (market'ler, precision, lot, kontrat) diskte cache'i ve sembol index'i.
+
+Her yeni connector ilk kullanımda load_markets ile birkaç saniye (birden çok istek) bekliyordu:
+engine başlarken, dashboard'un ilk isteğinde, her /config/test-connection'da. MarketMetadata:
+  - kurulurken market'leri diskten yükler (client.set_markets): ccxt'nin load_markets'ı ağa gitmez
+  - cache yoksa veya ttl geçmişse market'leri arka planda yeniler ve diske yazar
+  - market(symbol): precision / lot / min miktar için O(1) index (BTC/USDT, BTC/USDT:USDT, BTCUSDT)
+
+Dosya: data/markets/{borsa}[-testnet].json  ({"saved_at", "precision_mode", "markets"}; ham ccxt market'leri).
+Yazma atomiktir (geçici dosya + replace); bozuk dosya yok sayılır ve yeniden indirilir.
+
+Kullanım (connector içinde):
+    self._metadata = MarketMetadata(self._client, MarketCache.for_exchange("binance", testnet))
+    self._metadata.warm()
+    market = self._metadata.market("BTC/USDT")     # MarketInfo | None
+    market.round_amount(0.0123456)                 # lot adımına aşağı yuvarlar
+"""
+
+import asyncio
+import json
+import math
+import os
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+MARKETS_TTL_SECONDS = 6 * 3600
+
+# ccxt precisionMode sabitleri (ccxt import etmeden)
+DECIMAL_PLACES = 2
+SIGNIFICANT_DIGITS = 3
+TICK_SIZE = 4
+
+
+def _step(precision: Any, precision_mode: int) -> Optional[float]:
+    """ccxt precision değerinden adım: TICK_SIZE'da doğrudan, DECIMAL_PLACES'te 10^-n."""
+    if precision is None:
+        return None
+    try:
+        if precision_mode == TICK_SIZE:
+            return float(precision) or None
+        return 10 ** -int(precision)
+    except (TypeError, ValueError):
+        return None
+
+
+class MarketInfo:
+    """Tek market'in emir için gereken bilgisi."""
+
+    __slots__ = ("symbol", "id", "price_tick", "amount_step", "min_amount", "contract_size")
+
+    def __init__(self, market: Dict[str, Any], precision_mode: int):
+        precision = market.get("precision") or {}
+        limits = (market.get("limits") or {}).get("amount") or {}
+        self.symbol: str = market.get("symbol", "")
+        self.id: str = market.get("id", "")
+        self.price_tick = _step(precision.get("price"), precision_mode)
+        self.amount_step = _step(precision.get("amount"), precision_mode)
+        self.min_amount = float(limits["min"]) if limits.get("min") is not None else None
+        self.contract_size = float(market.get("contractSize") or 1)
+
+    def round_amount(self, amount: float) -> float:
+        """
+        Base varlık miktarını lot adımına aşağı yuvarlar (risk aşılmaz); min miktarın altındaysa 0.
+        Kontrat market'lerinde (MEXC swap: contractSize 0.0001 gibi) precision ve min kontrat
+        cinsindendir: miktar kontrata çevrilip yuvarlanır, sonuç yine base cinsinden döner.
+        """
+        size = Decimal(str(self.contract_size)) if self.contract_size > 0 else Decimal(1)
+        contracts = Decimal(str(amount)) / size
+        step = self.amount_step
+        if step:
+            units = math.floor(float(contracts) / step + 1e-9)
+            contracts = Decimal(units) * Decimal(str(step))
+        if self.min_amount and contracts < Decimal(str(self.min_amount)):
+            return 0.0
+        return float(contracts * size)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class MarketIndex:
+    """Sembol (ccxt sembolü, BASE/QUOTE kısaltması, borsa id'si) -> MarketInfo."""
+
+    def __init__(self, markets: Dict[str, Dict[str, Any]], precision_mode: int):
+        self.source = markets
+        self._by_key: Dict[str, MarketInfo] = {}
+        swaps = []
+        for symbol, market in markets.items():
+            info = MarketInfo(market, precision_mode)
+            self._by_key[symbol] = info
+            if market.get("swap"):
+                swaps.append((market, info))
+        # Kısa yazım (BTC/USDT) ve borsa id'si (BTCUSDT) swap market'ini gösterir: bot futures işlem
+        # yapar; aynı adlı spot market'i varsa onun yerine geçer
+        for market, info in swaps:
+            if market.get("base") and market.get("quote"):
+                self._by_key[f"{market['base']}/{market['quote']}"] = info
+            if market.get("id"):
+                self._by_key[str(market["id"])] = info
+
+    def get(self, symbol: str) -> Optional[MarketInfo]:
+        return self._by_key.get(symbol)
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+
+class MarketCache:
+    """Tek borsa / mod için disk dosyası."""
+
+    def __init__(self, path: Path, ttl: float = MARKETS_TTL_SECONDS):
+        self.path = Path(path)
+        self.ttl = float(ttl)
+
+    @classmethod
+    def for_exchange(cls, name: str, testnet: bool, ttl: float = MARKETS_TTL_SECONDS) -> "MarketCache":
+        return cls(_cache_dir() / f"{name}{'-testnet' if testnet else ''}.json", ttl)
+
+    def load(self) -> Optional[Tuple[Dict[str, Any], int, float]]:
+        """(markets, precision_mode, saved_at); dosya yoksa veya okunamıyorsa None."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data["markets"], int(data["precision_mode"]), float(data["saved_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, markets: Dict[str, Any], precision_mode: int) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {"saved_at": time.time(), "precision_mode": precision_mode, "markets": markets},
+                f, default=str, separators=(",", ":"),
+            )
+        os.replace(tmp, self.path)
+
+    def is_fresh(self, saved_at: float) -> bool:
+        return time.time() - saved_at < self.ttl
+
+
+def _cache_dir() -> Path:
+    try:
+        from ..core.paths import get_data_dir
+    except ImportError:
+        from core.paths import get_data_dir
+    return get_data_dir() / "markets"
+
+
+class MarketMetadata:
+    """Connector'ın ccxt client'ı için disk cache + arka plan yenileme + sembol index'i (thread-safe)."""
+
+    def __init__(
+        self,
+        client: Any,
+        cache: Optional[MarketCache],
+        before_fetch: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Args:
+            client: ccxt client (sync; async client için load_async)
+            cache: Disk cache; None ise sadece index (her süreçte yeniden indirilir)
+            before_fetch: Ağdan yüklemeden önce çağrılır (örn. rate limiter'dan izin); async client'ta
+                coroutine fonksiyonu
+        """
+        self._client = client
+        self._cache = cache
+        self._before_fetch = before_fetch
+        self._lock = threading.Lock()
+        self._async_lock: Optional[asyncio.Lock] = None
+        self._index: Optional[MarketIndex] = None
+        self._stale = True
+        self._refreshing = False
+
+    @property
+    def precision_mode(self) -> int:
+        return int(getattr(self._client, "precisionMode", DECIMAL_PLACES))
+
+    def warm(self, refresh: bool = True) -> bool:
+        """
+        Diskteki market'leri client'a yükler. Cache yoksa veya eskiyse refresh=True ile arka planda
+        yeniler (sync client; async client'ta refresh=False, yenileme load_async'te).
+        Returns: diskten yüklendiyse True.
+        """
+        loaded = self._cache.load() if self._cache is not None else None
+        if loaded is not None:
+            markets, _, saved_at = loaded
+            try:
+                self._client.set_markets(markets)
+                self._stale = not self._cache.is_fresh(saved_at)
+            except Exception:
+                loaded = None
+        if refresh and self._stale:
+            self.refresh_in_background()
+        return loaded is not None
+
+    def _fetched(self) -> None:
+        """Ağdan yükleme sonrası: diske yaz (hata loglanmaz; cache sadece hızlandırır)."""
+        self._stale = False
+        if self._cache is None or not self._client.markets:
+            return
+        try:
+            self._cache.save(self._client.markets, self.precision_mode)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def load(self) -> None:
+        """Market'ler client'ta yoksa ağdan yükler (bloklar) ve diske yazar."""
+        if self._client.markets:
+            return
+        with self._lock:
+            if self._client.markets:
+                return
+            if self._before_fetch is not None:
+                self._before_fetch()
+            self._client.load_markets()
+            self._fetched()
+
+    def refresh(self) -> None:
+        """Market'leri ağdan yeniden yükler ve diske yazar."""
+        with self._lock:
+            if self._before_fetch is not None:
+                self._before_fetch()
+            self._client.load_markets(reload=True)
+            self._fetched()
+
+    def refresh_in_background(self) -> None:
+        if self._refreshing:
+            return
+        self._refreshing = True
+
+        def run() -> None:
+            try:
+                self.refresh()
+            except Exception:
+                pass  # Eski market'ler kullanılmaya devam eder; sonraki warm/refresh yeniden dener
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="market-refresh", daemon=True).start()
+
+    async def _fetch_async(self, reload: bool) -> None:
+        if self._before_fetch is not None:
+            await self._before_fetch()
+        await self._client.load_markets(reload=reload)
+        await asyncio.to_thread(self._fetched)
+
+    async def _refresh_async(self) -> None:
+        try:
+            await self._fetch_async(reload=True)
+        except Exception:
+            pass  # Eski market'ler kullanılmaya devam eder
+        finally:
+            self._refreshing = False
+
+    async def load_async(self) -> None:
+        """
+        load'un async client karşılığı: market'ler yoksa yükler (eşzamanlı çağıranlar aynı yüklemeyi
+        bekler); diskten gelen market'ler eskiyse arka planda (task) yeniler.
+        """
+        if self._client.markets:
+            if self._stale and not self._refreshing:
+                self._refreshing = True
+                asyncio.get_running_loop().create_task(self._refresh_async())
+            return
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            if not self._client.markets:
+                await self._fetch_async(reload=False)
+
+    def market(self, symbol: str) -> Optional[MarketInfo]:
+        """Yüklü market'lerden O(1) arama; client market'leri değiştikçe index yeniden kurulur."""
+        markets = self._client.markets
+        if not markets:
+            return None
+        index = self._index
+        if index is None or index.source is not markets:
+            index = self._index = MarketIndex(markets, self.precision_mode)
+        return index.get(symbol)
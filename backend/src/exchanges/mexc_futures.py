@@ -5,12 +5,16 @@ Config: exchange.name, exchange.api_key, exchange.api_secret, exchange.testnet
 MEXC'de perpetual için defaultType: 'swap' kullanılır.
 """
 
+import functools
 from typing import Any, Dict, List, Optional
 
 from .base_exchange import BaseExchange
+from .ccxt_tickers import CcxtTickersMixin, ticker_prices
+from .market_cache import MarketCache, MarketInfo, MarketMetadata
+from .rate_limiter import Priority, RateLimiter, acquire_for, limited
 
 
-class MEXCFuturesExchange(BaseExchange):
+class MEXCFuturesExchange(CcxtTickersMixin, BaseExchange):
     """MEXC USDT-M Perpetual Swap."""
 
     def __init__(
@@ -18,10 +22,12 @@ class MEXCFuturesExchange(BaseExchange):
         api_key: str,
         api_secret: str,
         testnet: bool = False,
+        limiter: Optional[RateLimiter] = None,
     ):
         self._api_key = api_key
         self._api_secret = api_secret
         self._testnet = testnet
+        self._limiter = limiter
         self._client = None
         self._load_client()
 
@@ -32,7 +38,7 @@ class MEXCFuturesExchange(BaseExchange):
         self._client = ccxt.mexc({
             "apiKey": self._api_key,
             "secret": self._api_secret,
-            "enableRateLimit": True,
+            "enableRateLimit": self._limiter is None,  # limiter varsa bekleme orada (rate_limiter.py)
             "options": options,
         })
         if self._testnet:
@@ -40,7 +46,14 @@ class MEXCFuturesExchange(BaseExchange):
                 self._client.set_sandbox_mode(True)
             except Exception:
                 pass  # MEXC sandbox desteklemiyorsa devam et
-
+        self._metadata = MarketMetadata(
+            self._client,
+            MarketCache.for_exchange("mexc", self._testnet),
+            before_fetch=functools.partial(acquire_for, self, "load_markets", Priority.SCAN),
+        )
+        self._metadata.warm()
+
+    @limited("balance", Priority.UI)
     def get_balance(self) -> float:
         """USDT cinsinden kullanılabilir bakiye."""
         balance = self._client.fetch_balance()
@@ -48,6 +61,7 @@ class MEXCFuturesExchange(BaseExchange):
             return float(balance["total"].get("USDT") or 0)
         return 0.0
 
+    @limited("positions", Priority.TRAILING)
     def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """Açık pozisyonlar."""
         positions = self._client.fetch_positions()
@@ -77,23 +91,23 @@ class MEXCFuturesExchange(BaseExchange):
             })
         return out
 
+    @limited("klines", Priority.SCAN)
     def get_klines(
         self,
         symbol: str,
         timeframe: str,
         limit: int = 500,
+        since: Optional[int] = None,
     ) -> List[List[Any]]:
         """OHLCV."""
-        return self._client.fetch_ohlcv(symbol, timeframe, limit=limit)
+        return self._client.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
 
+    @limited("ticker", Priority.TRAILING)
     def get_ticker(self, symbol: str) -> Dict[str, float]:
         t = self._client.fetch_ticker(symbol)
-        return {
-            "last": float(t.get("last") or 0),
-            "bid": float(t.get("bid") or 0),
-            "ask": float(t.get("ask") or 0),
-        }
+        return ticker_prices(t)
 
+    @limited("order", Priority.ORDER, fixed=True)
     def place_order(
         self,
         symbol: str,
@@ -139,6 +153,7 @@ class MEXCFuturesExchange(BaseExchange):
             "raw": order,
         }
 
+    @limited("order", Priority.ORDER, fixed=True)
     def cancel_order(self, order_id: str, symbol: str) -> bool:
         try:
             self._client.cancel_order(order_id, symbol)
@@ -146,8 +161,55 @@ class MEXCFuturesExchange(BaseExchange):
         except Exception:
             return False
 
+    @limited("order", Priority.ORDER)
     def fetch_order(self, order_id: str, symbol: str) -> Optional[Dict[str, Any]]:
         try:
             return self._client.fetch_order(order_id, symbol)
         except Exception:
             return None
+
+    @limited("time", Priority.SCAN)
+    def get_server_time(self) -> Optional[int]:
+        return int(self._client.fetch_time())
+
+    def get_price_tick(self, symbol: str) -> Optional[float]:
+        """ccxt market precision'ından fiyat adımı (market index'i)."""
+        market = self.get_market(symbol)
+        return market.price_tick if market is not None else None
+
+    def get_market(self, symbol: str) -> Optional[MarketInfo]:
+        """Precision / lot / min miktar; market'ler diskten (market_cache.py) veya ilk çağrıda ağdan."""
+        try:
+            self._metadata.load()
+        except Exception:
+            return None
+        return self._metadata.market(symbol)
+
+    @limited("order", Priority.ORDER, fixed=True)
+    def place_stop_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        """Reduce-only tetikli market order (MEXC plan order)."""
+        order = self._client.create_order(
+            symbol=symbol,
+            type="market",
+            side=side,
+            amount=quantity,
+            params={"triggerPrice": stop_price, "reduceOnly": True},
+        )
+        out = self._normalize_order_response(order, quantity)
+        out["stop_price"] = float(stop_price)
+        return out
+
+    @limited("order", Priority.ORDER, fixed=True)
+    def cancel_stop_order(self, order_id: str, symbol: str) -> bool:
+        """Plan order'lar ayrı endpoint'ten iptal edilir (ccxt: trigger=True)."""
+        try:
+            self._client.cancel_order(order_id, symbol, params={"trigger": True})
+            return True
+        except Exception:
+            return False
@@ -3,45 +3,66 @@ Paper Trader - Gerçek para kullanmadan trade simülasyonu.
 
 Piyasa verisi (klines, ticker) bir BaseExchange'den alınır.
 Bakiye ve pozisyonlar bellekte tutulur; order'lar anlık fiyattan doldurulmuş kabul edilir.
+Stop order'lar (place_stop_order) simüle edilir: trader'ın gördüğü fiyat (get_ticker/get_tickers)
+stop'a gelince o fiyattan reduce-only doldurulur.
 """
 
-from typing import Any, Dict, List, Optional
+import functools
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
-from .base_exchange import BaseExchange
+from .base_exchange import BaseExchange, KlineRequest
+from .market_cache import MarketInfo
+from .rate_limiter import Priority, request_priority
 
 
-class PaperTrader(BaseExchange):
+def _locked(method):
+    """PaperBook metodunu defterin kilidi altında çalıştırır."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class PaperBook:
     """
-    Paper trade: Order'lar gerçek gönderilmez, anlık fiyattan doldurulmuş kabul edilir.
-    data_exchange: Sadece get_klines ve get_ticker için kullanılır (piyasa verisi).
+    Paper trade bakiye ve pozisyon defteri (I/O yok).
+    PaperTrader ve AsyncPaperTrader aynı dolum/PnL mantığını bu sınıf üzerinden kullanır.
+    Thread-safe: engine, trailing monitor ve API aynı defteri paylaşabilir (exchanges/registry.py).
     """
 
-    def __init__(
-        self,
-        initial_balance: float,
-        data_exchange: BaseExchange,
-    ):
-        self._balance = float(initial_balance)
-        self._data = data_exchange
+    def __init__(self, initial_balance: float):
+        self.balance = float(initial_balance)
         # symbol -> { side, size, entry_price }
-        self._positions: Dict[str, Dict[str, Any]] = {}
+        self.positions: Dict[str, Dict[str, Any]] = {}
+        # order_id -> ccxt formatında stop order (status: open | closed | expired). amend = iptal + yeni
+        # order: iptal edilen order hemen silinir. Tetiklenen / düşen order engine dolumu okuyup
+        # kaydedene kadar (birden çok fetch_order) kalır; aynı sembolün sonraki stop'unda silinir
+        self.stop_orders: Dict[str, Dict[str, Any]] = {}
+        # symbol -> {order_id -> açık stop order}; trigger_stops sadece bunları gezer
+        self._open_stops: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._stop_seq = 0
+        self.lock = threading.RLock()
 
-    def get_balance(self) -> float:
-        return self._balance
+    @_locked
+    def symbols(self, symbol: Optional[str] = None) -> List[str]:
+        """Açık pozisyonu olan semboller (symbol verilirse sadece o)."""
+        return [sym for sym in list(self.positions.keys()) if not symbol or sym == symbol]
 
-    def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
-        ticker = self._data.get_ticker if hasattr(self._data, "get_ticker") else None
+    @_locked
+    def position_rows(
+        self,
+        tickers: Dict[str, Dict[str, float]],
+        symbol: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """get_positions formatında pozisyonlar; mark fiyatı tickers'tan (yoksa entry)."""
         out = []
-        for sym, pos in list(self._positions.items()):
-            if symbol and sym != symbol:
+        for sym in self.symbols(symbol):
+            pos = self.positions.get(sym)
+            if pos is None:
                 continue
-            mark = pos.get("entry_price")
-            if ticker and sym:
-                try:
-                    t = ticker(sym)
-                    mark = t.get("last") or mark
-                except Exception:
-                    pass
+            mark = (tickers.get(sym) or {}).get("last") or pos.get("entry_price")
             size = pos["size"]
             entry = pos["entry_price"]
             side = pos["side"]
@@ -60,38 +81,24 @@ class PaperTrader(BaseExchange):
             })
         return out
 
-    def get_klines(
-        self,
-        symbol: str,
-        timeframe: str,
-        limit: int = 500,
-    ) -> List[List[Any]]:
-        return self._data.get_klines(symbol, timeframe, limit)
-
-    def get_ticker(self, symbol: str) -> Dict[str, float]:
-        return self._data.get_ticker(symbol)
-
-    def place_order(
+    @_locked
+    def fill(
         self,
         symbol: str,
         side: str,
         quantity: float,
-        order_type: str = "market",
-        stop_price: Optional[float] = None,
+        price: float,
         reduce_only: bool = False,
     ) -> Dict[str, Any]:
-        """Simüle: Anlık fiyattan doldurulmuş kabul edilir."""
-        ticker = self._data.get_ticker(symbol)
-        price = float(ticker.get("last") or ticker.get("bid") or ticker.get("ask") or 0)
+        """Order'ı verilen fiyattan doldurulmuş kabul eder; bakiye ve pozisyonları günceller."""
         if price <= 0:
             return {"order_id": None, "filled": 0, "avg_price": None, "error": "no price"}
 
         filled = quantity
-        cost = quantity * price
 
         if reduce_only:
             # Pozisyon kapatma
-            pos = self._positions.get(symbol)
+            pos = self.positions.get(symbol)
             if not pos:
                 return {"order_id": "paper-close", "filled": 0, "avg_price": price, "raw": {}}
             close_side = "sell" if pos["side"] == "long" else "buy"
@@ -102,10 +109,10 @@ class PaperTrader(BaseExchange):
                 pnl = (price - pos["entry_price"]) * close_size
             else:
                 pnl = (pos["entry_price"] - price) * close_size
-            self._balance += pnl
+            self.balance += pnl
             pos["size"] -= close_size
             if pos["size"] <= 0:
-                del self._positions[symbol]
+                del self.positions[symbol]
             return {
                 "order_id": "paper-reduce",
                 "symbol": symbol,
@@ -116,8 +123,8 @@ class PaperTrader(BaseExchange):
             }
 
         # Yeni pozisyon veya ekleme
-        if symbol in self._positions:
-            pos = self._positions[symbol]
+        if symbol in self.positions:
+            pos = self.positions[symbol]
             if pos["side"] == ("long" if side == "buy" else "short"):
                 # Aynı yönde ekleme: ortalama fiyat
                 old_size = pos["size"]
@@ -132,13 +139,13 @@ class PaperTrader(BaseExchange):
                     pnl = (price - pos["entry_price"]) * close_size
                 else:
                     pnl = (pos["entry_price"] - price) * close_size
-                self._balance += pnl
+                self.balance += pnl
                 pos["size"] -= close_size
                 if pos["size"] <= 0:
-                    del self._positions[symbol]
+                    del self.positions[symbol]
                 filled = close_size
         else:
-            self._positions[symbol] = {
+            self.positions[symbol] = {
                 "side": "long" if side == "buy" else "short",
                 "size": quantity,
                 "entry_price": price,
@@ -152,8 +159,196 @@ class PaperTrader(BaseExchange):
             "raw": {},
         }
 
+    @_locked
+    def add_stop(self, symbol: str, side: str, quantity: float, stop_price: float) -> Dict[str, Any]:
+        """Simüle reduce-only stop order; place_stop_order formatında döner."""
+        # Sembolün önceki (tetiklenmiş / düşmüş) stop'ları: yeni pozisyonun stop'u geldiyse okunmuştur
+        for old_id in [i for i, o in self.stop_orders.items() if o["symbol"] == symbol and o["status"] != "open"]:
+            del self.stop_orders[old_id]
+        self._stop_seq += 1
+        order_id = f"paper-stop-{self._stop_seq}"
+        order = self.stop_orders[order_id] = {
+            "id": order_id,
+            "symbol": symbol,
+            "side": side,
+            "type": "stop_market",
+            "amount": quantity,
+            "stopPrice": float(stop_price),
+            "status": "open",
+            "filled": 0.0,
+            "average": None,
+        }
+        self._open_stops.setdefault(symbol, {})[order_id] = order
+        return {
+            "order_id": order_id,
+            "symbol": symbol,
+            "side": side,
+            "filled": 0.0,
+            "avg_price": None,
+            "stop_price": float(stop_price),
+            "raw": dict(order),
+        }
+
+    @_locked
+    def cancel_stop(self, order_id: str) -> bool:
+        """Açık stop order'ı iptal eder; tetiklenmiş veya bilinmeyen order için False."""
+        order = self.stop_orders.get(order_id)
+        if order is None or order["status"] != "open":
+            return False
+        order["status"] = "canceled"
+        self._close_stop(order)
+        del self.stop_orders[order_id]
+        return True
+
+    @_locked
+    def stop_order(self, order_id: str) -> Optional[Dict[str, Any]]:
+        order = self.stop_orders.get(order_id)
+        return dict(order) if order is not None else None
+
+    def _close_stop(self, order: Dict[str, Any]) -> None:
+        """Order'ı açık stop index'inden çıkarır (kilit çağıranda)."""
+        open_stops = self._open_stops.get(order["symbol"])
+        if open_stops is None:
+            return
+        open_stops.pop(order["id"], None)
+        if not open_stops:
+            del self._open_stops[order["symbol"]]
+
+    @_locked
+    def trigger_stops(self, prices: Dict[str, float]) -> None:
+        """Fiyatı stop'a gelen açık stop order'ları o fiyattan reduce-only doldurur."""
+        for symbol, price in prices.items():
+            if not price or price <= 0 or symbol not in self._open_stops:
+                continue
+            for order in list(self._open_stops[symbol].values()):
+                self._trigger_stop(order, price)
+
+    def _trigger_stop(self, order: Dict[str, Any], price: float) -> None:
+        """Fiyat stop'a geldiyse order'ı doldurur (kilit çağıranda)."""
+        if order["side"] == "sell":
+            triggered = price <= order["stopPrice"]
+        else:
+            triggered = price >= order["stopPrice"]
+        if not triggered:
+            return
+        result = self.fill(order["symbol"], order["side"], order["amount"], price, reduce_only=True)
+        filled = float(result.get("filled") or 0)
+        # Pozisyon yoksa reduce-only order düşer
+        order["status"] = "closed" if filled > 0 else "expired"
+        order["filled"] = filled
+        order["average"] = price if filled > 0 else None
+        self._close_stop(order)
+
+
+def ticker_price(ticker: Dict[str, float]) -> float:
+    """Paper dolum fiyatı: last, yoksa bid/ask."""
+    return float(ticker.get("last") or ticker.get("bid") or ticker.get("ask") or 0)
+
+
+class PaperTrader(BaseExchange):
+    """
+    Paper trade: Order'lar gerçek gönderilmez, anlık fiyattan doldurulmuş kabul edilir.
+    data_exchange: Sadece get_klines ve get_ticker için kullanılır (piyasa verisi).
+    book: Verilirse bu defter kullanılır (AsyncPaperTrader ile aynı paper state'i paylaşmak için).
+    """
+
+    def __init__(
+        self,
+        initial_balance: float,
+        data_exchange: BaseExchange,
+        book: Optional[PaperBook] = None,
+    ):
+        self._book = book if book is not None else PaperBook(initial_balance)
+        self._data = data_exchange
+
+    @property
+    def book(self) -> PaperBook:
+        return self._book
+
+    def get_balance(self) -> float:
+        return self._book.balance
+
+    def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        symbols = self._book.symbols(symbol)
+        # Tüm pozisyonların mark fiyatı tek toplu istekle
+        try:
+            tickers = self._data.get_tickers(symbols) if symbols else {}
+        except Exception:
+            tickers = {}
+        return self._book.position_rows(tickers, symbol)
+
+    def get_klines(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 500,
+        since: Optional[int] = None,
+    ) -> List[List[Any]]:
+        return self._data.get_klines(symbol, timeframe, limit, since=since)
+
+    def get_ticker(self, symbol: str) -> Dict[str, float]:
+        ticker = self._data.get_ticker(symbol)
+        self._book.trigger_stops({symbol: ticker_price(ticker)})
+        return ticker
+
+    def get_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        tickers = self._data.get_tickers(symbols)
+        self._book.trigger_stops({s: ticker_price(t) for s, t in tickers.items()})
+        return tickers
+
+    def get_klines_many(self, requests: List[KlineRequest]) -> Dict[Tuple[str, str], List[List[Any]]]:
+        return self._data.get_klines_many(requests)
+
+    def place_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        order_type: str = "market",
+        stop_price: Optional[float] = None,
+        reduce_only: bool = False,
+    ) -> Dict[str, Any]:
+        """Simüle: Anlık fiyattan doldurulmuş kabul edilir (fiyat isteği emir önceliğinde)."""
+        with request_priority(Priority.ORDER):
+            price = ticker_price(self._data.get_ticker(symbol))
+        self._book.trigger_stops({symbol: price})
+        return self._book.fill(symbol, side, quantity, price, reduce_only)
+
+    def place_order_at(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: float,
+        reduce_only: bool = False,
+    ) -> Dict[str, Any]:
+        """Simüle: Order'ı verilen fiyattan doldurur (örn. 1m mumda tespit edilen stop dolumu)."""
+        return self._book.fill(symbol, side, quantity, price, reduce_only)
+
     def cancel_order(self, order_id: str, symbol: str) -> bool:
         return True  # Paper'da bekleyen order yok
 
     def fetch_order(self, order_id: str, symbol: str) -> Optional[Dict[str, Any]]:
-        return None
+        return self._book.stop_order(order_id)
+
+    def get_server_time(self) -> Optional[int]:
+        return self._data.get_server_time()
+
+    def get_price_tick(self, symbol: str) -> Optional[float]:
+        return self._data.get_price_tick(symbol)
+
+    def get_market(self, symbol: str) -> Optional[MarketInfo]:
+        return self._data.get_market(symbol)
+
+    def place_stop_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+    ) -> Dict[str, Any]:
+        """Simüle: fiyat stop'a gelince (get_ticker/get_tickers) doldurulur."""
+        return self._book.add_stop(symbol, side, quantity, stop_price)
+
+    def cancel_stop_order(self, order_id: str, symbol: str) -> bool:
+        return self._book.cancel_stop(order_id)
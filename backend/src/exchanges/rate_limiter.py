@@ -0,0 +1,325 @@
+"""
+Rate Limiter - Borsa istek ağırlığı için öncelikli token bucket (süreç geneli, sync + async).
+
+ccxt'nin client başına enableRateLimit'i öncelik bilmiyordu: bir emir veya stop kapatma, toplu mum
+taramasının ya da dashboard isteğinin arkasında bekleyebiliyordu. RateLimiter borsanın dakikalık
+ağırlık limitini token bucket ile izler ve istekleri öncelik sırasıyla geçirir:
+
+    ORDER (emir, kapatma, stop) > TRAILING (açık pozisyon fiyatları) > SCAN (sinyal taraması) > UI
+
+  - Bekleyenler arasında her zaman en yüksek öncelikli (aynı öncelikte ilk gelen) önce geçer
+  - SCAN ve UI bucket'ı tamamen boşaltamaz (reserve): kapasitenin bir kısmı emir/trailing için kalır;
+    yük altında tarama yavaşlar, çıkışlar yavaşlamaz
+  - Kapasite C ve dolum hızı r, herhangi 60 sn'de C + 60r <= dakikalık limit olacak şekilde seçilir
+
+Öncelik çağıran tarafından request_priority() ile verilir (contextvar; thread'e / task'a özel);
+verilmezse connector metodunun varsayılanı kullanılır. Emir metotları her zaman ORDER'dır.
+Metrikler: stats() (sınıf başına kuyruk derinliği, geçen istek, toplam / en uzun bekleme).
+
+Kullanım:
+    limiter = RateLimiter(weight_per_minute=2400)
+    with request_priority(Priority.SCAN):
+        exchange.get_klines("BTC/USDT", "15m", 250)     # connector metodu @limited ile sarılı
+"""
+
+import asyncio
+import contextvars
+import functools
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+
+class Priority(IntEnum):
+    ORDER = 0
+    TRAILING = 1
+    SCAN = 2
+    UI = 3
+
+
+# Sınıf başına bucket'ta kalması gereken pay (kapasitenin oranı)
+_RESERVE = {Priority.ORDER: 0.0, Priority.TRAILING: 0.0, Priority.SCAN: 0.25, Priority.UI: 0.5}
+
+# Borsa başına varsayılan dakikalık ağırlık limiti (config: exchange.rate_limit_weight_per_minute)
+VENUE_WEIGHT_PER_MINUTE = {"binance": 2400, "mexc": 600}
+
+_priority: contextvars.ContextVar[Optional[Priority]] = contextvars.ContextVar("request_priority", default=None)
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Bu blokta (aynı thread / task) yapılan borsa isteklerinin önceliği."""
+    token = _priority.set(Priority(priority))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority(default: Priority) -> Priority:
+    priority = _priority.get()
+    return default if priority is None else priority
+
+
+class RateLimitTimeout(Exception):
+    """acquire timeout süresinde izin alamadı."""
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "weight", "enqueued", "granted", "cancelled", "event", "future", "loop")
+
+    def __init__(self, priority: Priority, seq: int, weight: float):
+        self.priority = priority
+        self.seq = seq
+        self.weight = weight
+        self.enqueued = time.monotonic()
+        self.granted = False
+        self.cancelled = False
+        self.event: Optional[threading.Event] = None
+        self.future: Optional[asyncio.Future] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class RateLimiter:
+    """Öncelikli token bucket; acquire (thread) ve acquire_async (asyncio) aynı bütçeyi kullanır."""
+
+    def __init__(self, weight_per_minute: float = 2400, burst_fraction: float = 0.25):
+        """
+        Args:
+            weight_per_minute: Borsanın dakikalık ağırlık limiti
+            burst_fraction: Kapasitenin limite oranı; dolum hızı (limit - kapasite) / 60
+        """
+        self.weight_per_minute = float(weight_per_minute)
+        self.capacity = max(1.0, self.weight_per_minute * float(burst_fraction))
+        self.rate = max(0.01, (self.weight_per_minute - self.capacity) / 60.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._heap: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._metrics = {p: {"queued": 0, "granted": 0, "wait_total": 0.0, "wait_max": 0.0, "timeouts": 0} for p in Priority}
+
+    # --- Bucket (çağıran self._lock'u tutar) ---
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self, priority: Priority) -> float:
+        return self.capacity * _RESERVE[priority]
+
+    def _dispatch(self) -> None:
+        """Sıradaki bekleyenlere (öncelik sırasıyla) token yetiyorsa izin verir."""
+        self._refill()
+        while self._heap:
+            head = self._heap[0]
+            if head.cancelled:
+                heapq.heappop(self._heap)
+                continue
+            if self._tokens - head.weight < self._reserve(head.priority):
+                break
+            heapq.heappop(self._heap)
+            self._tokens -= head.weight
+            self._grant(head)
+
+    def _grant(self, waiter: _Waiter) -> None:
+        waiter.granted = True
+        wait = time.monotonic() - waiter.enqueued
+        m = self._metrics[waiter.priority]
+        m["queued"] -= 1
+        m["granted"] += 1
+        m["wait_total"] += wait
+        m["wait_max"] = max(m["wait_max"], wait)
+        if waiter.event is not None:
+            waiter.event.set()
+        elif waiter.future is not None and waiter.loop is not None:
+            future = waiter.future
+            try:
+                waiter.loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+            except RuntimeError:
+                pass
+
+    def _eta(self) -> float:
+        """Sıradaki bekleyenin izin alabileceği tahmini süre (saniye)."""
+        if not self._heap:
+            return 0.0
+        head = self._heap[0]
+        missing = head.weight + self._reserve(head.priority) - self._tokens
+        return min(1.0, max(0.002, missing / self.rate))
+
+    def _enqueue(self, weight: float, priority: Priority) -> _Waiter:
+        priority = Priority(priority)
+        # Kapasiteden (reserve düşülmüş) büyük istek hiç geçemezdi: en fazla bucket'ın tamamını bekler
+        waiter = _Waiter(priority, next(self._seq), min(float(weight), self.capacity - self._reserve(priority)))
+        self._metrics[waiter.priority]["queued"] += 1
+        heapq.heappush(self._heap, waiter)
+        return waiter
+
+    def _cancel(self, waiter: _Waiter, timed_out: bool) -> None:
+        if waiter.granted or waiter.cancelled:
+            return
+        waiter.cancelled = True
+        m = self._metrics[waiter.priority]
+        m["queued"] -= 1
+        if timed_out:
+            m["timeouts"] += 1
+
+    # --- İzin ---
+
+    def acquire(self, weight: float = 1, priority: Priority = Priority.SCAN, timeout: Optional[float] = None) -> float:
+        """İzin alınana kadar bloklar. Returns: bekleme süresi (sn). timeout dolarsa RateLimitTimeout."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            waiter = self._enqueue(weight, priority)
+            waiter.event = threading.Event()
+            self._dispatch()
+        while not waiter.granted:
+            with self._lock:
+                delay = self._eta()
+            if deadline is not None:
+                delay = min(delay, deadline - time.monotonic())
+                if delay <= 0:
+                    with self._lock:
+                        self._dispatch()
+                        if not waiter.granted:
+                            self._cancel(waiter, timed_out=True)
+                            raise RateLimitTimeout(f"{waiter.priority.name} weight={weight}")
+                    break
+            waiter.event.wait(delay)
+            with self._lock:
+                self._dispatch()
+        return time.monotonic() - waiter.enqueued
+
+    async def acquire_async(self, weight: float = 1, priority: Priority = Priority.SCAN) -> float:
+        """acquire'ın asyncio karşılığı (event loop'u bloklamaz). Returns: bekleme süresi (sn)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            waiter = self._enqueue(weight, priority)
+            waiter.loop = loop
+            waiter.future = loop.create_future()
+            self._dispatch()
+        try:
+            while not waiter.granted:
+                with self._lock:
+                    delay = self._eta()
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter.future), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                with self._lock:
+                    self._dispatch()
+        finally:
+            if not waiter.granted:
+                with self._lock:
+                    self._cancel(waiter, timed_out=False)
+        return time.monotonic() - waiter.enqueued
+
+    def stats(self) -> Dict[str, Any]:
+        """Bucket durumu ve sınıf başına kuyruk derinliği / geçen istek / bekleme süreleri."""
+        with self._lock:
+            self._refill()
+            classes = {}
+            for priority, m in self._metrics.items():
+                classes[priority.name.lower()] = {
+                    "queue_depth": m["queued"],
+                    "granted": m["granted"],
+                    "timeouts": m["timeouts"],
+                    "avg_wait_ms": round(m["wait_total"] / m["granted"] * 1000, 2) if m["granted"] else 0.0,
+                    "max_wait_ms": round(m["wait_max"] * 1000, 2),
+                }
+            return {
+                "weight_per_minute": self.weight_per_minute,
+                "capacity": self.capacity,
+                "rate_per_second": round(self.rate, 3),
+                "tokens": round(self._tokens, 2),
+                "classes": classes,
+            }
+
+
+def limiter_from_config(cfg: Dict[str, Any]) -> RateLimiter:
+    """exchange.name'in varsayılan limiti; exchange.rate_limit_weight_per_minute verilmişse o."""
+    exchange = cfg.get("exchange") or {}
+    name = str(exchange.get("name") or "binance").lower().strip()
+    weight = exchange.get("rate_limit_weight_per_minute") or VENUE_WEIGHT_PER_MINUTE.get(name, 1200)
+    return RateLimiter(weight_per_minute=float(weight))
+
+
+def _binance_kline_weight(symbol: str, timeframe: str, limit: int = 500, since: Optional[int] = None) -> float:
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+Weight = Union[float, Callable[..., float]]
+
+# Binance USDT-M endpoint ağırlıkları (yaklaşık; listede olmayan = 1). MEXC ağırlık değil istek sayar.
+BINANCE_WEIGHTS: Dict[str, Weight] = {
+    "balance": 5,
+    "positions": 5,
+    "klines": _binance_kline_weight,
+    "tickers": 2,  # get_tickers: /fapi/v1/ticker/price (tüm semboller)
+    "tickers_24h": 40,  # fetch_tickers: /fapi/v1/ticker/24hr (tüm semboller; top hacim listesi)
+    "load_markets": 5,
+}
+
+
+def request_weight(connector: Any, endpoint: str, *args: Any, **kwargs: Any) -> float:
+    """Connector'ın _weights tablosuna göre isteğin ağırlığı (tabloda yoksa 1)."""
+    weight = getattr(connector, "_weights", {}).get(endpoint, 1)
+    return weight(*args, **kwargs) if callable(weight) else weight
+
+
+def acquire_for(connector: Any, endpoint: str, priority: Priority) -> None:
+    """Connector metodu dışındaki ham client istekleri için izin (connector'da limiter yoksa hemen döner)."""
+    limiter = getattr(connector, "_limiter", None)
+    if limiter is not None:
+        limiter.acquire(request_weight(connector, endpoint), current_priority(priority))
+
+
+async def acquire_for_async(connector: Any, endpoint: str, priority: Priority) -> None:
+    """acquire_for'un asyncio karşılığı."""
+    limiter = getattr(connector, "_limiter", None)
+    if limiter is not None:
+        await limiter.acquire_async(request_weight(connector, endpoint), current_priority(priority))
+
+
+def limited(endpoint: str, priority: Priority, fixed: bool = False) -> Callable:
+    """
+    Connector metodu dekoratörü: çağrıdan önce self._limiter'dan izin alır (limiter yoksa doğrudan).
+    Ağırlık self._weights[endpoint] (sabit veya metot argümanlarıyla çağrılan fonksiyon; yoksa 1).
+    priority: request_priority verilmemişse kullanılır; fixed=True ise her zaman bu (emirler).
+    """
+    def decorator(method: Callable) -> Callable:
+        def resolve(self, args, kwargs) -> tuple:
+            weight = request_weight(self, endpoint, *args, **kwargs)
+            return weight, (priority if fixed else current_priority(priority))
+
+        if asyncio.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                limiter = getattr(self, "_limiter", None)
+                if limiter is not None:
+                    await limiter.acquire_async(*resolve(self, args, kwargs))
+                return await method(self, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            limiter = getattr(self, "_limiter", None)
+            if limiter is not None:
+                limiter.acquire(*resolve(self, args, kwargs))
+            return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,122 @@
+"""
+Exchange Registry - Süreç genelinde config başına tek paylaşılan exchange.
+
+Engine thread'i ve dashboard API'si ayrı ayrı get_exchange() çağırınca aynı süreçte iki ccxt
+client, iki rate limiter ve iki market yüklemesi oluşuyordu; paper trade'de dashboard engine'in
+bakiye ve pozisyonlarını hiç görmüyordu. shared_exchange() aynı config için hep aynı instance'ı
+döndürür:
+  - tek ccxt client: piyasa bilgisi bir kez yüklenir, tüm çağıranlar aynı rate-limit bütçesini kullanır
+  - paper trade: tek PaperBook (thread-safe); shared_async_exchange() da aynı defteri kullanır,
+    böylece async engine'in açtığı pozisyonlar dashboard'da görünür
+  - tek RateLimiter (rate_limiter.py): sync ve async exchange aynı öncelikli istek bütçesini kullanır
+
+Anahtar config yolu + config'in exchange bölümüdür: exchange.* değişince sonraki çağrı yeni instance
+kurar (eskisini tutan, örn. pozisyonu açık engine, onu kullanmaya devam eder).
+Async exchange'ler event loop'a bağlı olduğu için her çağrıda yeni kurulur (sadece paper defteri
+paylaşılır); kapatmak çağıranın işidir.
+
+Kullanım:
+    exchange = shared_exchange()                 # engine ve dashboard aynı nesneyi alır
+    async_exchange = shared_async_exchange()     # async engine (await async_exchange.close())
+"""
+
+import json
+import threading
+from typing import Any, Dict, Optional
+
+from .async_base_exchange import AsyncBaseExchange
+from .base_exchange import BaseExchange
+from .factory import _get, get_async_exchange_from_config_dict, get_exchange_from_config_dict
+from .paper_trader import PaperBook
+from .rate_limiter import RateLimiter, limiter_from_config
+
+
+def _fingerprint(cfg: Dict[str, Any]) -> str:
+    return json.dumps(cfg.get("exchange") or {}, sort_keys=True, default=str)
+
+
+class _Entry:
+    __slots__ = ("fingerprint", "exchange", "book", "limiter")
+
+    def __init__(self, fingerprint: str, limiter: RateLimiter):
+        self.fingerprint = fingerprint
+        self.exchange: Optional[BaseExchange] = None
+        self.book: Optional[PaperBook] = None
+        self.limiter = limiter
+
+
+class ExchangeRegistry:
+    """Config yolu başına paylaşılan exchange ve paper defteri (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Optional[str], _Entry] = {}
+
+    def _entry(self, config_path: Optional[str], cfg: Dict[str, Any]) -> _Entry:
+        """Çağıran self._lock'u tutar. exchange bölümü değiştiyse yeni kayıt."""
+        fingerprint = _fingerprint(cfg)
+        entry = self._entries.get(config_path)
+        if entry is None or entry.fingerprint != fingerprint:
+            entry = self._entries[config_path] = _Entry(fingerprint, limiter_from_config(cfg))
+        return entry
+
+    def _paper_book(self, entry: _Entry, cfg: Dict[str, Any]) -> PaperBook:
+        """Kaydın paper defteri (paper_trade kapalıysa factory kullanmaz)."""
+        if entry.book is None:
+            entry.book = PaperBook(float(_get("account.fixed_balance", cfg) or 1000))
+        return entry.book
+
+    def get(self, config_path: Optional[str] = None) -> BaseExchange:
+        """Config'e göre paylaşılan sync exchange (ilk çağrıda kurulur)."""
+        cfg = _load(config_path)
+        with self._lock:
+            entry = self._entry(config_path, cfg)
+            if entry.exchange is None:
+                entry.exchange = get_exchange_from_config_dict(
+                    cfg, paper_book=self._paper_book(entry, cfg), limiter=entry.limiter
+                )
+            return entry.exchange
+
+    def get_async(self, config_path: Optional[str] = None) -> AsyncBaseExchange:
+        """Yeni async exchange; paper trade'de sync exchange ile aynı PaperBook'u kullanır."""
+        cfg = _load(config_path)
+        with self._lock:
+            entry = self._entry(config_path, cfg)
+            book = self._paper_book(entry, cfg)
+        return get_async_exchange_from_config_dict(cfg, paper_book=book, limiter=entry.limiter)
+
+    def limiter(self, config_path: Optional[str] = None) -> RateLimiter:
+        """Config'in paylaşılan rate limiter'ı (metrikler için)."""
+        cfg = _load(config_path)
+        with self._lock:
+            return self._entry(config_path, cfg).limiter
+
+    def clear(self) -> None:
+        """Kayıtları unutur (sonraki çağrılar yeni instance kurar)."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _load(config_path: Optional[str]) -> Dict[str, Any]:
+    try:
+        from ..core.config_manager import get_config
+    except ImportError:
+        from core.config_manager import get_config
+    return get_config(config_path).as_dict()
+
+
+_registry = ExchangeRegistry()
+
+
+def get_registry() -> ExchangeRegistry:
+    return _registry
+
+
+def shared_exchange(config_path: Optional[str] = None) -> BaseExchange:
+    """Süreç genelinde paylaşılan sync exchange (engine thread + dashboard)."""
+    return _registry.get(config_path)
+
+
+def shared_async_exchange(config_path: Optional[str] = None) -> AsyncBaseExchange:
+    """Async engine için exchange; paper defteri shared_exchange() ile ortak."""
+    return _registry.get_async(config_path)
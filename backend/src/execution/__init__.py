@@ -1,11 +1,32 @@
 # Execution modules
 
-from .order_executor import open_position, close_position
+from .order_executor import open_position, close_position, close_position_at
+from .order_executor import place_stop_loss, amend_stop_loss, cancel_stop_loss
 from .trailing_stop import TrailingStopState, create_trailing_state
+from .position_book import PositionBook, PositionView
+from .trailing_monitor import TrailingMonitor, trailing_update, publish_marks, publish_stop
+from .exchange_stop import amend_target, stop_fill_price, stop_order_open
+from .intrabar import IntrabarHit, intrabar_requests, replay_stops
 
 __all__ = [
     "open_position",
     "close_position",
+    "close_position_at",
+    "place_stop_loss",
+    "amend_stop_loss",
+    "cancel_stop_loss",
     "TrailingStopState",
     "create_trailing_state",
+    "PositionBook",
+    "PositionView",
+    "TrailingMonitor",
+    "trailing_update",
+    "publish_marks",
+    "publish_stop",
+    "amend_target",
+    "stop_fill_price",
+    "stop_order_open",
+    "IntrabarHit",
+    "intrabar_requests",
+    "replay_stops",
 ]
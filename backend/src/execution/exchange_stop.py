@@ -0,0 +1,55 @@
+"""
+Exchange Stop - Pozisyon stop'unun borsada reduce-only STOP_MARKET order olarak tutulması.
+
+Stop sadece bellekte (TrailingStopState.current_stop) olursa tetiklenme engine'in fiyat
+kontrolüne ve process'in ayakta olmasına bağlıdır. Borsa stop'u açıkken:
+  - Pozisyon açılınca stop order gönderilir
+  - Trailing stop, borsadaki stop'tan lehte en az amend_min_ticks fiyat adımı ilerleyince
+    order güncellenir (her küçük hareket için istek gönderilmez)
+  - Kapatma kararında önce stop order'ın dolup dolmadığına bakılır
+
+Pozisyon dict alanları: stop_order_id, exchange_stop (borsadaki tetik fiyatı), price_tick
+"""
+
+from typing import Any, Dict, Optional
+
+# Borsa fiyat adımını vermezse: stop fiyatının on binde biri bir adım sayılır
+_FALLBACK_TICK_RATIO = 1e-4
+
+
+def stop_fill_price(order: Optional[Dict[str, Any]]) -> Optional[float]:
+    """fetch_order cevabından (ccxt formatı) stop order dolduysa ortalama fiyat; dolmadıysa None."""
+    if not order:
+        return None
+    filled = float(order.get("filled") or 0)
+    status = str(order.get("status") or "").lower()
+    if filled <= 0 or status not in ("closed", "filled"):
+        return None
+    price = order.get("average") or order.get("price") or order.get("stopPrice") or order.get("triggerPrice")
+    return float(price) if price else None
+
+
+def stop_order_open(order: Optional[Dict[str, Any]]) -> bool:
+    """fetch_order cevabına göre order hâlâ açık mı (bilinmiyorsa True)."""
+    if not order:
+        return True
+    return str(order.get("status") or "open").lower() == "open"
+
+
+def amend_target(pos: Dict[str, Any], min_ticks: int) -> Optional[float]:
+    """
+    Trailing stop borsadaki stop'tan lehte en az min_ticks fiyat adımı ilerlediyse yeni tetik
+    fiyatı; değilse None. Borsa stop'u yoksa (exchange_stop None) None.
+    """
+    exchange_stop = pos.get("exchange_stop")
+    if exchange_stop is None:
+        return None
+    current = float(pos["trailing_state"].current_stop)
+    if pos["side"] == "long":
+        moved = current - exchange_stop
+    else:
+        moved = exchange_stop - current
+    tick = pos.get("price_tick") or abs(exchange_stop) * _FALLBACK_TICK_RATIO
+    if moved <= 0 or moved < max(1, int(min_ticks)) * tick:
+        return None
+    return current
@@ -0,0 +1,145 @@
+"""
+Intrabar - Kontroller arasında stop'a değen fitillerin 1m mumlardan tespiti.
+
+TrailingStopState.update sadece kontrol anındaki fiyatı görür; iki kontrol arasında stop'a
+değip geri dönen fiyat kaçar (paper trader gerçekte olmayacak sonuçlar raporlar). Bu modül
+açık pozisyonların son kontrolden beri kapanmış 1m mumlarını tek matris üzerinde (tüm
+pozisyonlar birlikte) oynatır:
+  - Her mumda önce low/high stop'a değdi mi bakılır (önceki mumlara göre stop ile), sonra
+    lehte uç (long: high, short: low) ile break-even ve ATR trailing ilerletilir
+  - Stop'a değen ilk mum: zaman ve dolum fiyatı (mum stop'un ötesinde açıldıysa açılış fiyatı)
+  - Değmeyen pozisyonların TrailingStopState'i oynatılan stop ile güncellenir
+
+Pozisyon dict'inde "intrabar" imleci tutulur: { last_ts: son işlenen 1m mum, stop, break_even }.
+İlk görüldüğünde oluşmakta olan dakika atlanır (açılış öncesi fiyatlar sayılmasın).
+
+Kullanım:
+    requests = intrabar_requests(tracked.items(), now_ms)        # get_klines_many istekleri
+    klines = exchange.get_klines_many(requests)
+    hits = replay_stops(tracked.items(), klines, now_ms)         # [IntrabarHit(symbol, ts, price)]
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+
+import numpy as np
+
+INTRABAR_TIMEFRAME = "1m"
+_BAR_MS = 60_000
+# Tek istekte en fazla mum (uzun kesintiden sonra eski mumlar atlanır)
+_MAX_BARS = 1000
+
+
+class IntrabarHit(NamedTuple):
+    symbol: str
+    ts: int       # Stop'a değen 1m mumun açılış zamanı (ms)
+    price: float  # Dolum fiyatı
+
+
+def _cursor(pos: Dict[str, Any], now_ms: int) -> Dict[str, Any]:
+    """Pozisyonun imleci; yoksa şu anki stop ile, oluşmakta olan dakikayı atlayarak başlatılır."""
+    cursor = pos.get("intrabar")
+    if cursor is None:
+        state = pos["trailing_state"]
+        cursor = {
+            "last_ts": now_ms // _BAR_MS * _BAR_MS,
+            "stop": float(state.current_stop),
+            "break_even": bool(state.break_even_done),
+        }
+        pos["intrabar"] = cursor
+    return cursor
+
+
+def intrabar_requests(
+    positions: Iterable[Tuple[str, Dict[str, Any]]],
+    now_ms: int,
+) -> List[Tuple[str, str, int, int]]:
+    """Son işlenen mumdan sonra kapanmış 1m mumu olan pozisyonlar için (symbol, '1m', limit, since)."""
+    requests = []
+    for symbol, pos in positions:
+        since = _cursor(pos, now_ms)["last_ts"] + _BAR_MS
+        closed = (now_ms - since) // _BAR_MS
+        if closed <= 0:
+            continue
+        limit = int(min(closed, _MAX_BARS))
+        requests.append((symbol, INTRABAR_TIMEFRAME, limit, int(now_ms // _BAR_MS * _BAR_MS - limit * _BAR_MS)))
+    return requests
+
+
+def replay_stops(
+    positions: Iterable[Tuple[str, Dict[str, Any]]],
+    klines: Dict[Tuple[str, str], List[List[Any]]],
+    now_ms: int,
+) -> List[IntrabarHit]:
+    """
+    Kapanmış 1m mumları tüm pozisyonlar için birlikte oynatır; stop'a değenleri döndürür.
+    Değmeyen pozisyonların trailing state'i ve imleci güncellenir. ATR: pos['atr'] (bar
+    kapanışında cache'lenen), yoksa başlangıç stop mesafesi (trailing_update ile aynı).
+    """
+    rows = []
+    for symbol, pos in positions:
+        cursor = _cursor(pos, now_ms)
+        bars = [
+            bar for bar in klines.get((symbol, INTRABAR_TIMEFRAME)) or []
+            if int(bar[0]) > cursor["last_ts"] and int(bar[0]) + _BAR_MS <= now_ms
+        ]
+        if bars:
+            rows.append((symbol, pos, cursor, bars))
+    if not rows:
+        return []
+
+    n = len(rows)
+    width = max(len(r[3]) for r in rows)
+    counts = np.array([len(r[3]) for r in rows])
+    # Fiyatlar yöne göre işaretlenir (long +1, short -1): her iki yön de "long" gibi hesaplanır
+    sign = np.array([1.0 if r[1]["side"] == "long" else -1.0 for r in rows])
+    opens = np.zeros((n, width))
+    fav = np.full((n, width), -np.inf)   # Lehte uç (long: high, short: -low)
+    adv = np.full((n, width), np.inf)    # Aleyhte uç (long: low, short: -high)
+    for i, (_, _, _, bars) in enumerate(rows):
+        arr = np.asarray(bars, dtype=float)
+        high, low = arr[:, 2] * sign[i], arr[:, 3] * sign[i]
+        opens[i, : len(bars)] = arr[:, 1] * sign[i]
+        fav[i, : len(bars)] = np.maximum(high, low)
+        adv[i, : len(bars)] = np.minimum(high, low)
+
+    states = [r[1]["trailing_state"] for r in rows]
+    stop0 = np.array([r[2]["stop"] for r in rows]) * sign
+    be0 = np.array([r[2]["break_even"] for r in rows])
+    entry = np.array([s.entry_price for s in states]) * sign
+    one_r = np.array([abs(s.entry_price - s.initial_stop_price) for s in states])
+    atr = np.array([float(r[1].get("atr") or 0) for r in rows])
+    atr = np.where(atr > 0, atr, one_r)
+    trail_dist = atr * np.array([s.atr_trailing_mult for s in states])
+
+    best = np.maximum.accumulate(fav, axis=1)
+    break_even = be0[:, None] | (best >= (entry + one_r)[:, None])
+    after = np.maximum(stop0[:, None], best - trail_dist[:, None])
+    after = np.where(break_even, np.maximum(after, entry[:, None]), after)
+    before = np.concatenate([stop0[:, None], after[:, :-1]], axis=1)
+    hit = adv <= before
+    any_hit = hit.any(axis=1)
+    first = hit.argmax(axis=1)
+
+    hits: List[IntrabarHit] = []
+    idx = np.arange(n)
+    fill = np.minimum(opens[idx, first], before[idx, first]) * sign
+    hit_stop = before[idx, first] * sign
+    last = counts - 1
+    final_stop = after[idx, last] * sign
+    final_be = break_even[idx, last]
+    for i, (symbol, pos, cursor, bars) in enumerate(rows):
+        state = states[i]
+        stop = float(hit_stop[i] if any_hit[i] else final_stop[i])
+        # Kontrollerle (fiyat) ilerlemiş stop geri çekilmez (kapatma başarısız olursa da pozisyonda kalır)
+        if state.side == "long":
+            state.current_stop = max(state.current_stop, stop)
+        else:
+            state.current_stop = min(state.current_stop, stop)
+        if any_hit[i]:
+            hits.append(IntrabarHit(symbol, int(bars[first[i]][0]), float(fill[i])))
+            continue
+        state.break_even_done = state.break_even_done or bool(final_be[i])
+        cursor["last_ts"] = int(bars[-1][0])
+        cursor["stop"] = float(final_stop[i])
+        cursor["break_even"] = bool(final_be[i])
+    return hits
@@ -3,6 +3,8 @@ Order Executor - Pozisyon açma ve kapatma (market order).
 
 Exchange interface: place_order(symbol, side, quantity, order_type, reduce_only).
 side: 'buy' | 'sell'  (long = buy, short = sell; kapatma = tersi + reduce_only)
+Borsa stop'u: place_stop_order / amend_stop_order / cancel_stop_order (reduce-only STOP_MARKET).
+AsyncBaseExchange verilirse place_order coroutine'i döner; çağıran await eder.
 """
 
 from typing import Any, Dict, Literal, Optional
@@ -15,6 +17,10 @@ def _to_order_side(position_side: PositionSide) -> OrderSide:
     return "buy" if position_side == "long" else "sell"
 
 
+def _to_close_side(position_side: PositionSide) -> OrderSide:
+    return "sell" if position_side == "long" else "buy"
+
+
 def open_position(
     exchange,
     symbol: str,
@@ -64,7 +70,7 @@ def close_position(
     Returns:
         place_order cevabı
     """
-    close_side = "sell" if side == "long" else "buy"
+    close_side = _to_close_side(side)
     return exchange.place_order(
         symbol=symbol,
         side=close_side,
@@ -72,3 +78,54 @@ def close_position(
         order_type=order_type,
         reduce_only=True,
     )
+
+
+def close_position_at(
+    exchange,
+    symbol: str,
+    side: PositionSide,
+    quantity: float,
+    price: float,
+) -> Dict[str, Any]:
+    """
+    Pozisyonu verilen fiyattan kapatır; sadece simülasyon borsalarında (place_order_at, paper trader).
+    1m mumlardan tespit edilen stop dolumunu paper sonuçlarına gerçek fiyatıyla yansıtmak için.
+    """
+    return exchange.place_order_at(symbol, _to_close_side(side), quantity, price, reduce_only=True)
+
+
+def place_stop_loss(
+    exchange,
+    symbol: str,
+    side: PositionSide,
+    quantity: float,
+    stop_price: float,
+) -> Dict[str, Any]:
+    """
+    Pozisyon için borsada reduce-only STOP_MARKET order gönderir.
+
+    Args:
+        side: Pozisyon yönü ('long' ise stop order sell)
+        stop_price: Tetik fiyatı
+
+    Returns:
+        place_stop_order cevabı: order_id, stop_price, ...
+    """
+    return exchange.place_stop_order(symbol, _to_close_side(side), quantity, stop_price)
+
+
+def amend_stop_loss(
+    exchange,
+    order_id: str,
+    symbol: str,
+    side: PositionSide,
+    quantity: float,
+    stop_price: float,
+) -> Dict[str, Any]:
+    """Stop order'ın tetik fiyatını günceller (borsaya göre düzenleme veya iptal + yeniden gönder)."""
+    return exchange.amend_stop_order(order_id, symbol, _to_close_side(side), quantity, stop_price)
+
+
+def cancel_stop_loss(exchange, order_id: str, symbol: str) -> bool:
+    """Stop order iptal eder."""
+    return exchange.cancel_stop_order(order_id, symbol)
@@ -0,0 +1,226 @@
+"""
+Position Book - Tüm açık pozisyonların trailing state'i NumPy sütunlarında.
+
+Pozisyon başına bir TrailingStopState nesnesi ve Python döngüsü yerine: entry, stop, yön,
+miktar, break-even bayrağı ve 1R mesafesi sütunlarda tutulur; update(marks, atrs) tek
+vektörel adımda tüm pozisyonları günceller ve kapatılacakların maskesini döndürür.
+Sonuçlar TrailingStopState.update ile birebir aynıdır (scripts/bench_position_book.py).
+
+Pozisyon eklenince TrailingStopState arayüzünü sunan bir PositionView döner; engine ve
+intrabar/exchange stop kodu onu TrailingStopState gibi kullanır (current_stop, update, ...).
+Slot'lar kapanan pozisyonlardan yeniden kullanılır; view'in slot'u pozisyon yaşadıkça değişmez.
+
+Kullanım:
+    book = PositionBook()
+    view = book.add("BTC/USDT", "long", entry_price=100.0, stop_price=98.0, quantity=0.5)
+    close, stops = book.update(marks, atrs, slots)   # slots: book.slot_of(symbol) değerleri
+    book.release(view)
+"""
+
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from ..core.config_manager import get_config
+except ImportError:
+    from core.config_manager import get_config
+
+
+class PositionBook:
+    """Açık pozisyonların trailing stop sütunları (slot = satır)."""
+
+    def __init__(self, capacity: int = 64):
+        capacity = max(1, int(capacity))
+        self._lock = threading.RLock()
+        self.symbols: List[Optional[str]] = [None] * capacity
+        self.active = np.zeros(capacity, dtype=bool)
+        self.sign = np.ones(capacity)  # long +1, short -1
+        self.entry = np.zeros(capacity)
+        self.initial_stop = np.zeros(capacity)
+        self.stop = np.zeros(capacity)
+        self.quantity = np.zeros(capacity)
+        self.break_even = np.zeros(capacity, dtype=bool)
+        self.break_even_r = np.ones(capacity)
+        self.one_r = np.zeros(capacity)
+        self.mult = np.ones(capacity)
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+
+    def __len__(self) -> int:
+        return int(self.active.sum())
+
+    @property
+    def capacity(self) -> int:
+        return len(self.symbols)
+
+    def _grow(self) -> None:
+        old = self.capacity
+        new = old * 2
+        for name in ("active", "sign", "entry", "initial_stop", "stop", "quantity", "break_even",
+                     "break_even_r", "one_r", "mult"):
+            arr = getattr(self, name)
+            grown = np.zeros(new, dtype=arr.dtype)
+            grown[:old] = arr
+            setattr(self, name, grown)
+        self.symbols.extend([None] * (new - old))
+        self._free.extend(range(new - 1, old - 1, -1))
+
+    def add(
+        self,
+        symbol: str,
+        side: str,
+        entry_price: float,
+        stop_price: float,
+        quantity: float,
+        break_even_r: Optional[float] = None,
+        atr_trailing_mult: Optional[float] = None,
+    ) -> "PositionView":
+        """Pozisyon ekler (create_trailing_state ile aynı config varsayılanları); view döndürür."""
+        if break_even_r is None or atr_trailing_mult is None:
+            config = get_config()
+            if break_even_r is None:
+                break_even_r = float(config.get("strategy.trailing.break_even_r") or 1.0)
+            if atr_trailing_mult is None:
+                atr_trailing_mult = float(config.get("strategy.trailing.atr_multiplier") or 1.0)
+        with self._lock:
+            if not self._free:
+                self._grow()
+            slot = self._free.pop()
+            self.symbols[slot] = symbol
+            self.active[slot] = True
+            self.sign[slot] = 1.0 if side == "long" else -1.0
+            self.entry[slot] = entry_price
+            self.initial_stop[slot] = stop_price
+            self.stop[slot] = stop_price
+            self.quantity[slot] = quantity
+            self.break_even[slot] = False
+            self.break_even_r[slot] = break_even_r
+            self.one_r[slot] = abs(entry_price - stop_price)
+            self.mult[slot] = atr_trailing_mult
+        return PositionView(self, slot)
+
+    def release(self, view: "PositionView") -> None:
+        """Pozisyonun slot'unu boşaltır (kapanınca)."""
+        with self._lock:
+            slot = view.slot
+            if not self.active[slot]:
+                return
+            self.active[slot] = False
+            self.symbols[slot] = None
+            self._free.append(slot)
+
+    def prune(self, live_slots) -> None:
+        """live_slots dışındaki aktif slot'ları boşaltır (tracked'den doğrudan silinen pozisyonlar)."""
+        live = set(live_slots)
+        with self._lock:
+            for slot in np.flatnonzero(self.active):
+                if int(slot) not in live:
+                    self.active[slot] = False
+                    self.symbols[slot] = None
+                    self._free.append(int(slot))
+
+    def slot_of(self, symbol: str) -> Optional[int]:
+        """Sembolün aktif slot'u; yoksa None."""
+        with self._lock:
+            for slot, sym in enumerate(self.symbols):
+                if sym == symbol and self.active[slot]:
+                    return slot
+        return None
+
+    def update(
+        self,
+        marks: np.ndarray,
+        atrs: np.ndarray,
+        slots: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Verilen slot'ları (None: tüm aktif slot'lar, slot sırasıyla) fiyat ve ATR ile günceller.
+        TrailingStopState.update mantığı: fiyat stop'a geldiyse kapat (stop değişmez); değilse
+        1R lehte gidildiyse break-even, sonra stop'u fiyat - ATR * mult'a sürükle.
+        marks <= 0 veya NaN olan satırlar güncellenmez.
+
+        Returns:
+            (close_mask, stops): slots ile aynı sırada; stops yeni stop fiyatları
+        """
+        with self._lock:
+            if slots is None:
+                slots = np.flatnonzero(self.active)
+            slots = np.asarray(slots, dtype=np.intp)
+            marks = np.asarray(marks, dtype=float)
+            atrs = np.asarray(atrs, dtype=float)
+            sign = self.sign[slots]
+            # Yön işaretiyle çarpılmış fiyatlarda short da long gibi hesaplanır
+            mark = marks * sign
+            stop = self.stop[slots] * sign
+            entry = self.entry[slots] * sign
+            valid = (marks > 0) & self.active[slots]
+            close = valid & (mark <= stop)
+            move = valid & ~close
+            reach = move & ~self.break_even[slots] & (mark >= entry + self.one_r[slots])
+            new_stop = np.where(reach, np.maximum(stop, entry), stop)
+            new_stop = np.where(move, np.maximum(new_stop, mark - atrs * self.mult[slots]), new_stop)
+            self.stop[slots] = new_stop * sign
+            self.break_even[slots] |= reach
+            return close, self.stop[slots].copy()
+
+
+class PositionView:
+    """PositionBook'taki bir pozisyon; TrailingStopState ile aynı arayüz."""
+
+    __slots__ = ("book", "slot")
+
+    def __init__(self, book: PositionBook, slot: int):
+        self.book = book
+        self.slot = slot
+
+    @property
+    def symbol(self) -> Optional[str]:
+        return self.book.symbols[self.slot]
+
+    @property
+    def side(self) -> str:
+        return "long" if self.book.sign[self.slot] > 0 else "short"
+
+    @property
+    def entry_price(self) -> float:
+        return float(self.book.entry[self.slot])
+
+    @property
+    def initial_stop_price(self) -> float:
+        return float(self.book.initial_stop[self.slot])
+
+    @property
+    def quantity(self) -> float:
+        return float(self.book.quantity[self.slot])
+
+    @property
+    def break_even_r(self) -> float:
+        return float(self.book.break_even_r[self.slot])
+
+    @property
+    def atr_trailing_mult(self) -> float:
+        return float(self.book.mult[self.slot])
+
+    @property
+    def current_stop(self) -> float:
+        return float(self.book.stop[self.slot])
+
+    @current_stop.setter
+    def current_stop(self, value: float) -> None:
+        self.book.stop[self.slot] = value
+
+    @property
+    def break_even_done(self) -> bool:
+        return bool(self.book.break_even[self.slot])
+
+    @break_even_done.setter
+    def break_even_done(self, value: bool) -> None:
+        self.book.break_even[self.slot] = bool(value)
+
+    def update(self, mark_price: float, atr_value: float) -> Tuple[bool, float]:
+        """TrailingStopState.update (tek satır)."""
+        close, stops = self.book.update(
+            np.array([mark_price], dtype=float), np.array([atr_value], dtype=float), np.array([self.slot])
+        )
+        return bool(close[0]), float(stops[0])
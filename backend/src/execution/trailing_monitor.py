@@ -0,0 +1,273 @@
+"""
+Trailing Monitor - Açık pozisyonların trailing stop'unu sinyal döngüsünden bağımsız, sık kontrol eder.
+
+Her `interval` saniyede (1–2 sn) tüm açık pozisyonların fiyatı tek toplu get_tickers isteğiyle
+alınır ve TrailingStopState güncellenir. ATR her kontrolde yeniden hesaplanmaz: engine bar
+kapanışında set_atr ile günceller (mum indirmeden). Stop tetiklenince kapatma kararı hemen
+on_close callback'ine (executor) verilir. Pozisyonun borsada stop order'ı varsa (exchange_stop.py),
+trailing stop amend_ticks adım ilerleyince on_amend callback'i çağrılır.
+
+tracked: engine'in pozisyon dict'i ({symbol: {side, quantity, entry_price, stop_price, ...,
+trailing_state}}); engine ve monitor aynı dict'i `lock` altında kullanır. Engine yeni pozisyonları
+monitor.book'a (PositionBook) ekler; bu pozisyonlar her kontrolde tek vektörel update ile güncellenir.
+Her kontrolde pozisyonların fiyatı (ticker) ve taşınan stop'lar (stop.moved) core.events'e yayınlanır.
+
+Kullanım:
+    monitor = TrailingMonitor(tracked, interval=1.5)
+    monitor.start(exchange, on_close=lambda symbol, pos, mark, new_stop: ...,
+                  on_amend=lambda symbol, pos, new_stop: ...)
+    monitor.set_atr("BTC/USDT", atr_value, bar_ts)   # bar kapanışında
+    monitor.stop()
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from ..core.events import publish
+    from ..core.logger import get_logger
+except ImportError:
+    from core.events import publish
+    from core.logger import get_logger
+
+from .exchange_stop import amend_target
+from .position_book import PositionBook, PositionView
+
+logger = get_logger(__name__)
+
+
+def publish_marks(tickers: Dict[str, Dict[str, float]], symbols: List[str]) -> None:
+    """Açık pozisyonların fiyatlarını 'ticker' olayı olarak yayınlar (engine'in zaten aldığı veriden)."""
+    for symbol in symbols:
+        ticker = tickers.get(symbol)
+        if ticker:
+            publish("ticker", {"symbol": symbol, **ticker}, key=symbol)
+
+
+def publish_stop(symbol: str, pos: Dict[str, Any], stop: float, mark: float) -> None:
+    """Trailing stop taşındığında 'stop.moved' olayı."""
+    publish(
+        "stop.moved",
+        {"symbol": symbol, "side": pos.get("side"), "stop": float(stop), "mark": float(mark)},
+        key=symbol,
+    )
+
+# (symbol, pos, mark_price, new_stop)
+CloseDecision = Tuple[str, Dict[str, Any], float, float]
+OnClose = Callable[[str, Dict[str, Any], float, float], None]
+# (symbol, pos, new_stop)
+StopAmend = Tuple[str, Dict[str, Any], float]
+OnAmend = Callable[[str, Dict[str, Any], float], None]
+
+
+def _trailing_atr(pos: Dict[str, Any], atr: float) -> float:
+    """ATR yoksa başlangıç stop mesafesi kullanılır."""
+    if atr <= 0:
+        return abs(pos["entry_price"] - pos["stop_price"])  # fallback
+    return atr
+
+
+def trailing_update(pos: Dict[str, Any], mark: float, atr: float) -> Tuple[bool, float]:
+    """Pozisyonun trailing state'ini günceller. ATR yoksa başlangıç stop mesafesi kullanılır."""
+    return pos["trailing_state"].update(mark, _trailing_atr(pos, atr))
+
+
+class TrailingMonitor:
+    """Açık pozisyonlar için yüksek frekanslı trailing kontrolü (thread veya async task ile)."""
+
+    def __init__(
+        self,
+        tracked: Dict[str, Dict[str, Any]],
+        interval: float = 1.5,
+        lock: Optional[threading.RLock] = None,
+        amend_ticks: int = 5,
+    ):
+        self.tracked = tracked
+        self.interval = 0.0
+        self.amend_ticks = 0
+        self.configure(interval, amend_ticks)
+        self.lock = lock or threading.RLock()
+        # Engine yeni pozisyonların trailing state'ini buraya ekler (_record_open book=)
+        self.book = PositionBook()
+        self.checks = 0
+        self.last_check: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # --- ATR (bar kapanışında engine günceller) ---
+
+    def set_atr(self, symbol: str, atr: float, bar_ts: Optional[int]) -> None:
+        """Son kapanan bar'ın ATR'si; bar_ts: ATR'nin hesaplandığı son kapanmış bar (ms)."""
+        with self.lock:
+            pos = self.tracked.get(symbol)
+            if pos is not None:
+                pos["atr"] = float(atr)
+                pos["atr_bar_ts"] = bar_ts
+
+    def reset_atr(self) -> None:
+        """Tüm pozisyonların ATR'sini eskimiş sayar (timeframe / ATR periyodu değişti); engine yeniden hesaplar."""
+        with self.lock:
+            for pos in self.tracked.values():
+                pos["atr_bar_ts"] = None
+
+    def needs_atr(self, symbol: str, closed_bar_ts: int) -> bool:
+        """Pozisyonun ATR'si closed_bar_ts bar'ından eskiyse True."""
+        with self.lock:
+            pos = self.tracked.get(symbol)
+            if pos is None:
+                return False
+            bar_ts = pos.get("atr_bar_ts")
+            return bar_ts is None or bar_ts < closed_bar_ts
+
+    def configure(self, interval: float, amend_ticks: int) -> None:
+        """Kontrol aralığı ve amend eşiği (config değişince; çalışan thread sonraki beklemede kullanır)."""
+        self.interval = max(0.2, float(interval))
+        self.amend_ticks = max(0, int(amend_ticks))
+
+    # --- Kontrol ---
+
+    def symbols(self) -> List[str]:
+        with self.lock:
+            return list(self.tracked.keys())
+
+    def evaluate(self, tickers: Dict[str, Dict[str, float]]) -> List[CloseDecision]:
+        """Fiyatlarla trailing state'leri günceller; stop'a gelen pozisyonları döndürür."""
+        decisions: List[CloseDecision] = []
+        moved: List[Tuple[str, Dict[str, Any], float, float]] = []
+        with self.lock:
+            # Book'taki pozisyonlar tek vektörel update ile; diğerleri (TrailingStopState) tek tek
+            live: List[int] = []
+            rows: List[Tuple[str, Dict[str, Any], float]] = []
+            slots: List[int] = []
+            atrs: List[float] = []
+            for symbol, pos in list(self.tracked.items()):
+                state = pos["trailing_state"]
+                booked = isinstance(state, PositionView) and state.book is self.book
+                if booked:
+                    live.append(state.slot)
+                if pos.get("busy"):
+                    continue
+                mark = float((tickers.get(symbol) or {}).get("last") or 0)
+                if mark <= 0:
+                    continue
+                if booked:
+                    rows.append((symbol, pos, mark))
+                    slots.append(state.slot)
+                    atrs.append(_trailing_atr(pos, float(pos.get("atr") or 0)))
+                    continue
+                old_stop = state.current_stop
+                should_close, new_stop = trailing_update(pos, mark, float(pos.get("atr") or 0))
+                if should_close:
+                    # Kapatma sürerken tekrar karar verilmesin (busy: kapatma veya stop işlemi sürüyor)
+                    pos["busy"] = True
+                    decisions.append((symbol, pos, mark, new_stop))
+                elif new_stop != old_stop:
+                    moved.append((symbol, pos, new_stop, mark))
+            # tracked'den engine tarafında silinen pozisyonların slot'ları
+            self.book.prune(live)
+            if slots:
+                marks = np.array([row[2] for row in rows])
+                slot_arr = np.array(slots)
+                old_stops = self.book.stop[slot_arr].copy()
+                close, stops = self.book.update(marks, np.array(atrs), slot_arr)
+                for (symbol, pos, mark), should_close, new_stop, old_stop in zip(rows, close, stops, old_stops):
+                    if should_close:
+                        pos["busy"] = True
+                        decisions.append((symbol, pos, mark, float(new_stop)))
+                    elif new_stop != old_stop:
+                        moved.append((symbol, pos, float(new_stop), mark))
+            symbols = list(self.tracked.keys())
+        publish_marks(tickers, symbols)
+        for symbol, pos, stop, mark in moved:
+            publish_stop(symbol, pos, stop, mark)
+        self.checks += 1
+        self.last_check = time.time()
+        return decisions
+
+    def stop_amends(self) -> List[StopAmend]:
+        """Borsa stop'u trailing stop'un amend_ticks adım gerisinde kalan pozisyonlar."""
+        amends: List[StopAmend] = []
+        with self.lock:
+            for symbol, pos in self.tracked.items():
+                if pos.get("busy"):
+                    continue
+                target = amend_target(pos, self.amend_ticks)
+                if target is not None:
+                    amends.append((symbol, pos, target))
+        return amends
+
+    def remove(self, symbol: str) -> None:
+        """Kapatılan pozisyonu tracked'den çıkarır (book slot'u boşaltılır)."""
+        with self.lock:
+            pos = self.tracked.pop(symbol, None)
+            state = pos.get("trailing_state") if pos is not None else None
+            if isinstance(state, PositionView) and state.book is self.book:
+                self.book.release(state)
+
+    def release(self, symbol: str) -> None:
+        """Kapatma başarısızsa pozisyon tekrar kontrole açılır."""
+        with self.lock:
+            pos = self.tracked.get(symbol)
+            if pos is not None:
+                pos.pop("busy", None)
+
+    def run_once(self, exchange, on_close: OnClose, on_amend: Optional[OnAmend] = None) -> int:
+        """Tek kontrol: toplu fiyat + trailing + kapatma (+ stop amend). Kapatılan pozisyon sayısını döndürür."""
+        symbols = self.symbols()
+        if not symbols:
+            return 0
+        try:
+            tickers = exchange.get_tickers(symbols)
+        except Exception as e:
+            logger.warning("Trailing fiyatları alınamadı: %s", e)
+            return 0
+        closed = 0
+        for symbol, pos, mark, new_stop in self.evaluate(tickers):
+            try:
+                on_close(symbol, pos, mark, new_stop)
+            except Exception as e:
+                logger.warning("Trailing kapatma hatası (%s): %s", symbol, e)
+                self.release(symbol)
+                continue
+            self.remove(symbol)
+            closed += 1
+        if on_amend is not None:
+            for symbol, pos, new_stop in self.stop_amends():
+                try:
+                    on_amend(symbol, pos, new_stop)
+                except Exception as e:
+                    logger.warning("Stop amend hatası (%s): %s", symbol, e)
+        return closed
+
+    # --- Thread ---
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, exchange, on_close: OnClose, on_amend: Optional[OnAmend] = None) -> None:
+        """Kontrol döngüsünü daemon thread'de başlatır."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(exchange, on_close, on_amend), name="trailing-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self, exchange, on_close: OnClose, on_amend: Optional[OnAmend]) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once(exchange, on_close, on_amend)
+            except Exception as e:
+                logger.warning("Trailing monitor hatası: %s", e)
+            self._stop.wait(self.interval)
@@ -10,9 +10,9 @@ Mantık:
 from typing import Literal, Optional, Tuple
 
 try:
-    from ..core.config_manager import ConfigManager
+    from ..core.config_manager import get_config
 except ImportError:
-    from core.config_manager import ConfigManager
+    from core.config_manager import get_config
 
 PositionSide = Literal["long", "short"]
 
@@ -40,7 +40,7 @@ class TrailingStopState:
         self.quantity = quantity
         self.break_even_r = break_even_r
         if atr_trailing_mult is None:
-            config = ConfigManager()
+            config = get_config()
             atr_trailing_mult = float(config.get("strategy.trailing.atr_multiplier") or 1.0)
         self.atr_trailing_mult = atr_trailing_mult
 
@@ -91,7 +91,7 @@ def create_trailing_state(
 ) -> TrailingStopState:
     """Config'ten break_even_r ve atr_trailing_mult alır; TrailingStopState oluşturur."""
     if break_even_r is None:
-        config = ConfigManager()
+        config = get_config()
         break_even_r = float(config.get("strategy.trailing.break_even_r") or 1.0)
     return TrailingStopState(
         symbol=symbol,
@@ -15,9 +15,9 @@ Kullanım (execution katmanında):
 from typing import Optional
 
 try:
-    from ..core.config_manager import ConfigManager
+    from ..core.config_manager import get_config
 except ImportError:
-    from core.config_manager import ConfigManager
+    from core.config_manager import get_config
 
 
 class RiskManager:
@@ -32,7 +32,7 @@ class RiskManager:
         """
         None verilen değerler config'ten okunur.
         """
-        config = ConfigManager()
+        config = get_config()
         self._fixed_balance = fixed_balance if fixed_balance is not None else float(config.get("account.fixed_balance") or 1000)
         self._risk_percent = risk_percent if risk_percent is not None else float(config.get("account.risk_percent") or 1.0)
         self._daily_r_limit = daily_r_limit if daily_r_limit is not None else float(config.get("account.daily_r_limit") or -3.0)
@@ -5,15 +5,23 @@ from .statistics import (
     get_day_pnl,
     get_day_fees,
     record_trade,
+    get_ledger,
 )
 from .trade_logger import log_trade as log_trade_event, log_signal, log_trailing
+from .log_writer import LogWriter, get_log_writer, flush_logs
+from .event_log import query_events
 
 __all__ = [
     "get_snapshot",
     "get_day_pnl",
     "get_day_fees",
     "record_trade",
+    "get_ledger",
     "log_trade_event",
     "log_signal",
     "log_trailing",
+    "LogWriter",
+    "get_log_writer",
+    "flush_logs",
+    "query_events",
 ]
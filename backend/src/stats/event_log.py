@@ -0,0 +1,248 @@
+"""
+Event Log - Trade / signal / trailing olaylarının JSONL kaydı ve sabit boyutlu offset index'i.
+
+Her gün ve log için iki dosya (logging.log_dir altında):
+  {name}_YYYY-MM-DD.jsonl  her satır bir olay: {"ts": ..., "ts_ms": ..., "type": "SIGNAL", "symbol": ...}
+  {name}_YYYY-MM-DD.idx    olay başına 24 byte: ts_ms, jsonl offset, satır uzunluğu, sembol hash'i
+
+Index kayıtları ts_ms'e göre sıralı tutulur (yazıcı geriye giden zamanı bir önceki değere sabitler),
+böylece okuyucu:
+  - son N olayı dosyanın sonundan N kayıt okuyarak
+  - zaman aralığını index üzerinde ikili arama ile
+  - sembol filtresini JSON'a dokunmadan index'teki hash ile
+bulur ve sadece dönen olayların satırlarını seek ile okur. Dosya boyutundan bağımsızdır.
+
+Yazma LogWriter thread'indedir (stats/log_writer.py); okuma query_events() ile (dashboard API).
+"""
+
+import json
+import struct
+import zlib
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+RECORD = struct.Struct("<qQII")  # ts_ms, offset, length, symbol hash
+_CHUNK = 512  # geriye taramada tek okumadaki kayıt sayısı
+
+
+def symbol_key(symbol: Optional[str]) -> int:
+    """Index'te saklanan sembol hash'i (sembolsüz olay = 0)."""
+    if not symbol:
+        return 0
+    return zlib.crc32(str(symbol).encode("utf-8")) or 1
+
+
+def _encode(event: Dict[str, Any]) -> bytes:
+    return json.dumps(event, ensure_ascii=False, default=str, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _event_ts(event: Dict[str, Any]) -> int:
+    ts = event.get("ts_ms")
+    if ts is None:
+        return int(datetime.now().timestamp() * 1000)
+    return int(ts)
+
+
+class EventAppender:
+    """Tek günün jsonl + idx dosyasına ekleme yapar (sadece yazıcı thread kullanır)."""
+
+    def __init__(self, data_path: Path, index_path: Path):
+        self.data_path = Path(data_path)
+        self.index_path = Path(index_path)
+        self._data = open(self.data_path, "a+b")
+        self._index = open(self.index_path, "a+b")
+        self._size = 0
+        self._last_ts = 0
+        self._recover()
+
+    def _recover(self) -> None:
+        """Yarım kalmış yazmaları onarır: kesik index kaydı / satır silinir, index'te eksik satırlar eklenir."""
+        data_size = self._data.seek(0, 2)
+        index_size = self._index.seek(0, 2)
+        count = index_size // RECORD.size
+        indexed_end = 0
+        while count:
+            self._index.seek((count - 1) * RECORD.size)
+            ts, offset, length, _ = RECORD.unpack(self._index.read(RECORD.size))
+            if offset + length <= data_size:
+                indexed_end = offset + length
+                self._last_ts = ts
+                break
+            count -= 1
+        if count * RECORD.size != index_size:
+            self._index.truncate(count * RECORD.size)
+        self._index.seek(0, 2)
+        self._size = indexed_end
+        if indexed_end < data_size:
+            self._data.seek(indexed_end)
+            tail = self._data.read(data_size - indexed_end)
+            complete = tail.rfind(b"\n") + 1
+            if complete < len(tail):
+                self._data.truncate(indexed_end + complete)
+            for raw in tail[:complete].splitlines(keepends=True):
+                try:
+                    event = json.loads(raw)
+                except ValueError:
+                    event = {}
+                self._append_index(event, len(raw))
+        self._data.seek(0, 2)
+
+    def _append_index(self, event: Dict[str, Any], length: int) -> None:
+        ts = max(_event_ts(event), self._last_ts)
+        self._index.write(RECORD.pack(ts, self._size, length, symbol_key(event.get("symbol"))))
+        self._last_ts = ts
+        self._size += length
+
+    def append(self, event: Dict[str, Any]) -> None:
+        raw = _encode(event)
+        self._data.write(raw)
+        self._append_index(event, len(raw))
+
+    def flush(self) -> None:
+        # Önce veri: index hiçbir zaman diskte olmayan bir satırı göstermez
+        self._data.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._data.close()
+            self._index.close()
+
+
+class _IndexFile:
+    """Bir günün index'i üzerinde ikili arama ve geriye doğru tarama."""
+
+    def __init__(self, data_path: Path, index_path: Path):
+        self._index = open(index_path, "rb")
+        self._data = open(data_path, "rb")
+        self.count = self._index.seek(0, 2) // RECORD.size
+
+    def record(self, n: int) -> Tuple[int, int, int, int]:
+        self._index.seek(n * RECORD.size)
+        return RECORD.unpack(self._index.read(RECORD.size))
+
+    def bisect(self, ts_ms: int, right: bool = False) -> int:
+        """ts_ms'ten küçük (right=True: küçük-eşit) kayıt sayısı."""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            ts = self.record(mid)[0]
+            if ts < ts_ms or (right and ts == ts_ms):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def iter_back(self, lo: int, hi: int) -> Iterator[Tuple[int, Tuple[int, int, int, int]]]:
+        """[lo, hi) aralığındaki kayıtları sondan başa (kayıt no, kayıt) olarak verir."""
+        end = hi
+        while end > lo:
+            start = max(lo, end - _CHUNK)
+            self._index.seek(start * RECORD.size)
+            buf = self._index.read((end - start) * RECORD.size)
+            n = len(buf) // RECORD.size
+            for i in range(n - 1, -1, -1):
+                yield start + i, RECORD.unpack_from(buf, i * RECORD.size)
+            end = start
+
+    def event(self, offset: int, length: int) -> Optional[Dict[str, Any]]:
+        self._data.seek(offset)
+        try:
+            return json.loads(self._data.read(length))
+        except ValueError:
+            return None
+
+    def close(self) -> None:
+        self._index.close()
+        self._data.close()
+
+
+def _local(dt: datetime) -> datetime:
+    return dt.astimezone().replace(tzinfo=None) if dt.tzinfo is not None else dt
+
+
+def _parse_cursor(cursor: str) -> Tuple[date, Optional[int]]:
+    day, _, rec = cursor.partition(":")
+    return date.fromisoformat(day), (int(rec) if rec else None)
+
+
+def query_events(
+    log_dir: Path,
+    name: str,
+    limit: int = 100,
+    symbol: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    days: int = 7,
+) -> Dict[str, Any]:
+    """
+    {name}_*.jsonl olaylarını en yeniden eskiye döndürür (günler arası).
+
+    Args:
+        since / until: Zaman aralığı (dahil); until yoksa şimdi
+        symbol: Sadece bu sembolün olayları
+        cursor: Önceki yanıttaki next_cursor ("YYYY-MM-DD:kayıt_no"); oradan devam eder
+        days: since verilmediğinde başlangıç gününden geriye bakılacak gün sayısı
+
+    Returns:
+        {"events": [...], "next_cursor": str | None}  (None = aralıkta başka olay yok)
+    """
+    limit = max(1, int(limit))
+    since = _local(since) if since is not None else None
+    until = _local(until) if until is not None else None
+    since_ms = int(since.timestamp() * 1000) if since is not None else None
+    until_ms = int(until.timestamp() * 1000) if until is not None else None
+    if cursor:
+        day, start = _parse_cursor(cursor)
+    else:
+        day, start = (until or datetime.now()).date(), None
+    stop_day = since.date() if since is not None else day - timedelta(days=max(1, int(days)) - 1)
+    key = symbol_key(symbol) if symbol else None
+
+    events: List[Dict[str, Any]] = []
+    while day >= stop_day:
+        data_path = Path(log_dir) / f"{name}_{day.isoformat()}.jsonl"
+        index_path = data_path.with_suffix(".idx")
+        if index_path.exists() and data_path.exists():
+            idx = _IndexFile(data_path, index_path)
+            try:
+                hi = idx.count if start is None else min(start, idx.count)
+                if until_ms is not None:
+                    hi = min(hi, idx.bisect(until_ms, right=True))
+                lo = idx.bisect(since_ms) if since_ms is not None else 0
+                for n, (_, offset, length, h) in idx.iter_back(lo, hi):
+                    if key is not None and h != key:
+                        continue
+                    event = idx.event(offset, length)
+                    if event is None or (symbol and event.get("symbol") != symbol):
+                        continue
+                    events.append(event)
+                    if len(events) >= limit:
+                        return {"events": events, "next_cursor": f"{day.isoformat()}:{n}"}
+            finally:
+                idx.close()
+        day -= timedelta(days=1)
+        start = None
+    return {"events": events, "next_cursor": None}
+
+
+def tail_lines(path: Path, limit: int = 100, block: int = 8192) -> List[str]:
+    """Metin dosyasının son limit satırı; dosyanın sonundan blok blok geriye okur."""
+    limit = max(1, int(limit))
+    with open(path, "rb") as f:
+        end = f.seek(0, 2)
+        pos = end
+        buf = b""
+        while pos > 0 and buf.count(b"\n") <= limit:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    lines = buf.decode("utf-8", errors="replace").strip().split("\n")
+    if lines == [""]:
+        return []
+    return lines[-limit:]
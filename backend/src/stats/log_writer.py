@@ -0,0 +1,273 @@
+"""
+Log Writer - Trade / signal / trailing log satırlarını arka plan thread'inde toplu yazar.
+
+Engine thread'i her satır için config okuyup dosya açıp kapatıyordu; emir akışı disk I/O'su
+bekliyordu. Bu modülde çağıran satırı sadece sınırlı bir kuyruğa bırakır (bloklamaz); yazıcı
+thread satırları toplar, günlük dosya handle'larını açık tutar ve:
+  - flush_lines satır birikince veya flush_seconds geçince diske flush eder
+  - gün değişince (satırın zaman damgasına göre) önceki günün dosyalarını kapatır
+  - flush() / close() ile (ve süreç çıkışında atexit ile) kuyruğu boşaltır
+write_event() ile bırakılan olaylar aynı batch'te {name}_{gün}.jsonl + .idx dosyalarına eklenir
+(stats/event_log.py).
+
+Kuyruk dolarsa (disk takıldı, yazıcı geride kaldı): yeni satır düşürülür, çağıran asla beklemez.
+Düşürülen satırlar dosya başına sayılır; yazıcı yetişince ilgili dosyaya
+"[zaman] DROPPED count=N" satırı (jsonl için {"type": "DROPPED", "count": N} olayı) yazılır. Trade'lerin kalıcı kaydı ledger'dadır (storage/trade_ledger.py).
+
+Kullanım:
+    writer = get_log_writer()
+    writer.write("trades", line, day="2024-01-31")
+    writer.flush()
+"""
+
+import atexit
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .event_log import EventAppender
+
+# (dosya adı öneki, gün, satır veya olay) veya flush isteği (threading.Event)
+_Item = Tuple[str, str, Union[str, Dict[str, Any]]]
+
+
+class LogWriter:
+    """Sınırlı kuyruk + arka plan yazıcı thread. write() thread-safe ve bloklamaz."""
+
+    def __init__(
+        self,
+        log_dir: Callable[[], Path],
+        max_queue: int = 10_000,
+        flush_lines: int = 256,
+        flush_seconds: float = 1.0,
+        suffix: str = ".log",
+    ):
+        """
+        Args:
+            log_dir: Log klasörünü döndüren fonksiyon (yazıcı thread'de, batch başına çağrılır)
+            max_queue: Kuyruktaki en fazla satır; dolunca yeni satırlar düşürülür
+            flush_lines / flush_seconds: Diske flush eşikleri
+            suffix: Dosya uzantısı ({name}_{day}{suffix})
+        """
+        self._log_dir = log_dir
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, int(max_queue)))
+        self.flush_lines = max(1, int(flush_lines))
+        self.flush_seconds = max(0.05, float(flush_seconds))
+        self.suffix = suffix
+        self._files: Dict[Tuple[str, str], IO[str]] = {}
+        self._events: Dict[Tuple[str, str], EventAppender] = {}
+        self._dropped: Dict[Tuple[str, str, bool], int] = {}
+        self._dropped_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        self.written = 0
+
+    # --- Çağıran taraf ---
+
+    def write(self, name: str, line: str, day: Optional[str] = None) -> bool:
+        """Satırı kuyruğa bırakır. day: YYYY-MM-DD (None = bugün). Kuyruk doluysa False (satır düşürüldü)."""
+        return self._put(name, line, day)
+
+    def write_event(self, name: str, event: Dict[str, Any], day: Optional[str] = None) -> bool:
+        """Olayı {name}_{day}.jsonl'e eklenmek üzere kuyruğa bırakır (write ile aynı taşma politikası)."""
+        return self._put(name, event, day)
+
+    def _put(self, name: str, payload: Union[str, Dict[str, Any]], day: Optional[str]) -> bool:
+        day = day or datetime.now().strftime("%Y-%m-%d")
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((name, day, payload))
+            return True
+        except queue.Full:
+            key = (name, day, isinstance(payload, dict))
+            with self._dropped_lock:
+                self._dropped[key] = self._dropped.get(key, 0) + 1
+            return False
+
+    @property
+    def dropped(self) -> int:
+        with self._dropped_lock:
+            return sum(self._dropped.values())
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Kuyruktaki satırlar diske yazılana kadar bekler (en fazla timeout). Yazıldıysa True."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Kuyruğu boşaltır, dosyaları kapatır ve thread'i durdurur."""
+        self._closed = True
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(timeout)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._closed or (self._thread is not None and self._thread.is_alive()):
+                return
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    # --- Yazıcı thread ---
+
+    def _run(self) -> None:
+        pending: List[_Item] = []
+        waiters: List[threading.Event] = []
+        last_flush = time.monotonic()
+        stop = False
+        while not stop:
+            timeout = max(0.0, self.flush_seconds - (time.monotonic() - last_flush))
+            try:
+                item = self._queue.get(timeout=timeout if pending else None)
+            except queue.Empty:
+                item = False
+            # Kuyrukta bekleyenleri de aynı batch'e al
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                elif item is not False:
+                    pending.append(item)
+                if len(pending) >= self.flush_lines:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            due = time.monotonic() - last_flush >= self.flush_seconds
+            if pending and (stop or waiters or due or len(pending) >= self.flush_lines):
+                self._write_batch(pending)
+                pending = []
+                last_flush = time.monotonic()
+            elif not pending:
+                last_flush = time.monotonic()
+            for event in waiters:
+                event.set()
+            waiters = []
+        self._close_files()
+
+    def _write_batch(self, items: List[_Item]) -> None:
+        try:
+            log_dir = self._log_dir()
+        except Exception:
+            return
+        days = set()
+        touched = set()
+        for name, day, payload in items:
+            f = self._event_file(log_dir, name, day) if isinstance(payload, dict) else self._file(log_dir, name, day)
+            if f is None:
+                continue
+            if isinstance(payload, dict):
+                f.append(payload)
+            else:
+                f.write(payload)
+            days.add(day)
+            touched.add(f)
+        touched.update(self._write_dropped(log_dir))
+        for f in touched:
+            try:
+                f.flush()
+            except OSError:
+                pass
+        self.written += len(items)
+        # Gün dönümü: bu batch'teki en yeni günden eski dosyalar kapatılır
+        if days:
+            newest = max(days)
+            for key in [k for k in self._files if k[1] < newest]:
+                self._files.pop(key).close()
+            for key in [k for k in self._events if k[1] < newest]:
+                self._events.pop(key).close()
+
+    def _file(self, log_dir: Path, name: str, day: str) -> Optional[IO[str]]:
+        key = (name, day)
+        f = self._files.get(key)
+        if f is None:
+            try:
+                f = open(log_dir / f"{name}_{day}{self.suffix}", "a", encoding="utf-8")
+            except OSError:
+                return None
+            self._files[key] = f
+        return f
+
+    def _event_file(self, log_dir: Path, name: str, day: str) -> Optional[EventAppender]:
+        key = (name, day)
+        f = self._events.get(key)
+        if f is None:
+            data_path = log_dir / f"{name}_{day}.jsonl"
+            try:
+                f = EventAppender(data_path, data_path.with_suffix(".idx"))
+            except OSError:
+                return None
+            self._events[key] = f
+        return f
+
+    def _write_dropped(self, log_dir: Path) -> List[Any]:
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, {}
+        touched = []
+        now = datetime.now()
+        for (name, day, is_event), count in dropped.items():
+            if is_event:
+                f = self._event_file(log_dir, name, day)
+                if f is not None:
+                    f.append({"ts": now.isoformat(), "ts_ms": int(now.timestamp() * 1000), "type": "DROPPED", "count": count})
+            else:
+                f = self._file(log_dir, name, day)
+                if f is not None:
+                    f.write(f"[{now.isoformat()}] DROPPED count={count}\n")
+            if f is not None:
+                touched.append(f)
+        return touched
+
+    def _close_files(self) -> None:
+        for f in list(self._files.values()) + list(self._events.values()):
+            try:
+                f.close()
+            except OSError:
+                pass
+        self._files.clear()
+        self._events.clear()
+
+
+_writer: Optional[LogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer() -> LogWriter:
+    """Süreç genelinde paylaşılan yazıcı (trade_logger kullanır); çıkışta atexit ile boşaltılır."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                try:
+                    from .trade_logger import _log_dir
+                except ImportError:
+                    from stats.trade_logger import _log_dir
+                _writer = LogWriter(_log_dir)
+                atexit.register(_writer.close)
+    return _writer
+
+
+def flush_logs(timeout: float = 5.0) -> bool:
+    """Paylaşılan yazıcının kuyruğunu diske yazar (engine durdurulurken)."""
+    if _writer is None:
+        return True
+    return _writer.flush(timeout)
@@ -1,120 +1,76 @@
 """
 İstatistik modülü - total/day PnL, R, win rate, fees, trading_disabled_today.
 
-Veriler backend/data/stats.json içinde saklanır.
+Veriler veri dizinindeki ledger.db'de (core/paths.get_data_dir: geliştirmede backend/data, build'de
+AppData; SQLite trade ledger, storage/trade_ledger.py) saklanır:
+her trade bir satır, toplamlar ve günlükler trade eklenirken artımlı güncellenir. Eski
+data/stats.json ve trades_*.log ledger ilk açıldığında bir kez aktarılır.
 day_r ve trading_disabled_today state'ten alınır; diğerleri burada güncellenir.
 """
 
-from datetime import date
-from pathlib import Path
+import threading
 from typing import Any, Dict, Optional
 
 try:
-    from ..core.config_manager import ConfigManager
+    from ..core.paths import get_data_dir
+    from ..storage.trade_ledger import TradeLedger
 except ImportError:
-    from core.config_manager import ConfigManager
-
-
-def _stats_path() -> Path:
-    config = ConfigManager()
-    base = Path(__file__).resolve().parent.parent.parent  # backend
-    data_dir = base / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir / "stats.json"
-
-
-def _load() -> Dict[str, Any]:
-    p = _stats_path()
-    if not p.exists():
-        return {
-            "total_trades": 0,
-            "wins": 0,
-            "losses": 0,
-            "total_pnl": 0.0,
-            "total_fees": 0.0,
-            "total_r": 0.0,
-            "max_win": 0.0,
-            "max_loss": 0.0,
-            "max_r": 0.0,
-            "min_r": 0.0,
-            "daily": [],  # [{"date": "YYYY-MM-DD", "pnl": float, "r": float, "fees": float}, ...]
-        }
-    import json
-    with open(p, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    if "daily" not in data:
-        data["daily"] = []
-    return data
-
-
-def _save(data: Dict[str, Any]) -> None:
-    import json
-    with open(_stats_path(), "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    from core.paths import get_data_dir
+    from storage.trade_ledger import TradeLedger
+
+from .trade_logger import _log_dir
+
+_ledger: Optional[TradeLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def get_ledger() -> TradeLedger:
+    """Süreç genelinde paylaşılan ledger; ilk açılışta boşsa eski stats.json / trade log'ları aktarılır."""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                data_dir = get_data_dir()
+                ledger = TradeLedger(data_dir / "ledger.db")
+                if ledger.is_empty() and not ledger.imported():
+                    ledger.import_legacy(data_dir / "stats.json", _log_dir())
+                _ledger = ledger
+    return _ledger
 
 
 def record_trade(
     pnl_usdt: float,
     r_value: float,
     fees: float = 0.0,
+    symbol: Optional[str] = None,
+    side: Optional[str] = None,
+    entry_price: Optional[float] = None,
+    exit_price: Optional[float] = None,
+    quantity: Optional[float] = None,
 ) -> None:
     """
     Kapanan bir trade'i kaydet; toplam ve günlük istatistikleri günceller.
     """
-    data = _load()
-    today = date.today().isoformat()
-
-    data["total_trades"] = data.get("total_trades", 0) + 1
-    data["total_pnl"] = data.get("total_pnl", 0) + pnl_usdt
-    data["total_fees"] = data.get("total_fees", 0) + fees
-    data["total_r"] = data.get("total_r", 0) + r_value
-
-    if pnl_usdt > 0:
-        data["wins"] = data.get("wins", 0) + 1
-        data["max_win"] = max(data.get("max_win", 0), pnl_usdt)
-    else:
-        data["losses"] = data.get("losses", 0) + 1
-        data["max_loss"] = min(data.get("max_loss", 0), pnl_usdt)
-
-    if r_value > data.get("max_r", 0):
-        data["max_r"] = r_value
-    if data.get("min_r", 0) == 0 or r_value < data["min_r"]:
-        data["min_r"] = r_value
-
-    daily = data.get("daily", [])
-    found = False
-    for d in daily:
-        if d.get("date") == today:
-            d["pnl"] = d.get("pnl", 0) + pnl_usdt
-            d["r"] = d.get("r", 0) + r_value
-            d["fees"] = d.get("fees", 0) + fees
-            found = True
-            break
-    if not found:
-        daily.append({"date": today, "pnl": pnl_usdt, "r": r_value, "fees": fees})
-    data["daily"] = daily
-
-    _save(data)
+    get_ledger().record(
+        pnl_usdt,
+        r_value,
+        fees,
+        symbol=symbol,
+        side=side,
+        entry_price=entry_price,
+        exit_price=exit_price,
+        quantity=quantity,
+    )
 
 
 def get_day_pnl() -> float:
     """Bugünkü PnL (kayıtlı trade'lerden)."""
-    data = _load()
-    today = date.today().isoformat()
-    for d in data.get("daily", []):
-        if d.get("date") == today:
-            return float(d.get("pnl", 0))
-    return 0.0
+    return float(get_ledger().day()["pnl"])
 
 
 def get_day_fees() -> float:
     """Bugünkü fees."""
-    data = _load()
-    today = date.today().isoformat()
-    for d in data.get("daily", []):
-        if d.get("date") == today:
-            return float(d.get("fees", 0))
-    return 0.0
+    return float(get_ledger().day()["fees"])
 
 
 def get_snapshot(state=None) -> Dict[str, Any]:
@@ -122,7 +78,9 @@ def get_snapshot(state=None) -> Dict[str, Any]:
     GUI/API için tüm istatistikleri döndürür.
     state verilirse day_r ve trading_disabled_today state'ten alınır.
     """
-    data = _load()
+    ledger = get_ledger()
+    data = ledger.totals()
+    today = ledger.day()
     total_trades = data.get("total_trades", 0)
     wins = data.get("wins", 0)
     losses = data.get("losses", 0)
@@ -134,8 +92,8 @@ def get_snapshot(state=None) -> Dict[str, Any]:
     max_r = float(data.get("max_r", 0))
     min_r = float(data.get("min_r", 0))
 
-    day_pnl = get_day_pnl()
-    day_fees = get_day_fees()
+    day_pnl = float(today["pnl"])
+    day_fees = float(today["fees"])
     day_r = 0.0
     trading_disabled_today = False
     if state is not None:
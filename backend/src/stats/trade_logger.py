@@ -2,7 +2,11 @@
 Trade / Signals / Trailing log - Günlük dosyalara yazar.
 
 Dosyalar: logs/trades_YYYY-MM-DD.log, signals_YYYY-MM-DD.log, trailing_YYYY-MM-DD.log
+Aynı olaylar JSONL olarak da yazılır: trades_YYYY-MM-DD.jsonl (+ .idx offset index'i, stats/event_log.py)
 Config: logging.log_dir (örn. backend/logs)
+
+Satırlar çağıran thread'de sadece biçimlenir; diske yazma arka plandaki LogWriter'dadır
+(stats/log_writer.py). Engine durdurulurken flush_logs() ile kuyruk boşaltılır.
 """
 
 from datetime import datetime
@@ -10,14 +14,16 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 try:
-    from ..core.config_manager import ConfigManager
+    from ..core.config_manager import get_config
 except ImportError:
-    from core.config_manager import ConfigManager
+    from core.config_manager import get_config
+
+from .log_writer import get_log_writer
 
 
 def _log_dir() -> Path:
     backend = Path(__file__).resolve().parent.parent.parent
-    config = ConfigManager()
+    config = get_config()
     raw = config.get("logging.log_dir") or "logs"
     p = Path(raw)
     if not p.is_absolute():
@@ -26,13 +32,24 @@ def _log_dir() -> Path:
     return p
 
 
-def _line(prefix: str, payload: Dict[str, Any]) -> str:
-    parts = [f"[{datetime.now().isoformat()}]", prefix]
+def _line(prefix: str, payload: Dict[str, Any], now: Optional[datetime] = None) -> str:
+    parts = [f"[{(now or datetime.now()).isoformat()}]", prefix]
     for k, v in payload.items():
         parts.append(f"{k}={v}")
     return " ".join(str(x) for x in parts) + "\n"
 
 
+def _emit(name: str, prefix: str, payload: Dict[str, Any]) -> None:
+    """Satırı ve JSONL olayını yazıcı kuyruğuna bırakır; gün, zaman damgasından alınır."""
+    now = datetime.now()
+    day = now.strftime("%Y-%m-%d")
+    writer = get_log_writer()
+    writer.write(name, _line(prefix, payload, now), day)
+    event = {"ts": now.isoformat(), "ts_ms": int(now.timestamp() * 1000), "type": prefix}
+    event.update(payload)
+    writer.write_event(name, event, day)
+
+
 def log_trade(
     symbol: str,
     side: str,
@@ -45,9 +62,6 @@ def log_trade(
     extra: Optional[Dict[str, Any]] = None,
 ) -> None:
     """Tek bir kapanan trade'i trades_YYYY-MM-DD.log'a yazar."""
-    d = _log_dir()
-    today = datetime.now().strftime("%Y-%m-%d")
-    path = d / f"trades_{today}.log"
     payload = {
         "symbol": symbol,
         "side": side,
@@ -60,8 +74,7 @@ def log_trade(
     }
     if extra:
         payload.update(extra)
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(_line("TRADE", payload))
+    _emit("trades", "TRADE", payload)
 
 
 def log_signal(
@@ -71,14 +84,10 @@ def log_signal(
     extra: Optional[Dict[str, Any]] = None,
 ) -> None:
     """Sinyal logu: signals_YYYY-MM-DD.log."""
-    d = _log_dir()
-    today = datetime.now().strftime("%Y-%m-%d")
-    path = d / f"signals_{today}.log"
     payload = {"symbol": symbol, "direction": direction, "reason": reason or "entry"}
     if extra:
         payload.update(extra)
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(_line("SIGNAL", payload))
+    _emit("signals", "SIGNAL", payload)
 
 
 def log_trailing(
@@ -90,9 +99,6 @@ def log_trailing(
     extra: Optional[Dict[str, Any]] = None,
 ) -> None:
     """Trailing stop güncellemesi: trailing_YYYY-MM-DD.log. action: break_even | trailing | close."""
-    d = _log_dir()
-    today = datetime.now().strftime("%Y-%m-%d")
-    path = d / f"trailing_{today}.log"
     payload = {
         "symbol": symbol,
         "side": side,
@@ -102,5 +108,4 @@ def log_trailing(
     }
     if extra:
         payload.update(extra)
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(_line("TRAIL", payload))
+    _emit("trailing", "TRAIL", payload)
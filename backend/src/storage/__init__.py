@@ -3,5 +3,6 @@ Kalıcı depolama – config, stats, log path'leri.
 """
 
 from .config_storage import ConfigStorage
+from .trade_ledger import TradeLedger
 
-__all__ = ["ConfigStorage"]
+__all__ = ["ConfigStorage", "TradeLedger"]
@@ -49,6 +49,14 @@ class ConfigStorage:
         with open(self._path, "w", encoding="utf-8") as f:
             json.dump(config.model_dump(), f, indent=2, ensure_ascii=False)
         self._raw = config.model_dump()
+        # Paylaşılan snapshot hemen yenilenir; abonelere (çalışan engine'in ConfigWatcher'ı) bildirilir
+        from core.config_manager import get_config, invalidate_config
+
+        invalidate_config(str(self._path))
+        try:
+            get_config(str(self._path))
+        except Exception:
+            pass
 
     def save_raw(self, data: Dict[str, Any]) -> None:
         """Ham dict'i doğrulayıp kaydeder. Geçersiz veri hata fırlatır."""
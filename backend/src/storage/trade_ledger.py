@@ -0,0 +1,331 @@
+"""
+Trade Ledger - Kapanan trade'ler için append-only SQLite (WAL) defteri.
+
+stats.json her trade'de baştan okunup yazılıyordu; günlük liste sonsuza dek büyüyor ve doğrusal
+taranıyordu, API ile engine aynı anda yazarsa kayıp olabiliyordu. Ledger:
+  - trades: trade başına bir satır (sadece eklenir)
+  - totals: tek satırlık toplamlar (trade eklenirken aynı transaction'da artımlı güncellenir)
+  - daily:  gün başına toplamlar (day PRIMARY KEY)
+WAL modu + busy timeout + BEGIN IMMEDIATE: API ve engine (aynı veya ayrı process) güvenle yazar;
+okumalar yazmaları beklemez. Snapshot okuması iki indeksli satır okumasıdır (O(1)).
+
+Eski veriler: import_legacy(stats.json, log klasörü) — trades_*.log satırları trade satırı olarak,
+toplamlar stats.json'dan (yoksa trade satırlarından) alınır. İkinci kez çalıştırılırsa bir şey yapmaz.
+
+Kullanım:
+    ledger = TradeLedger(path)
+    ledger.record(pnl, r_value, fees, symbol="BTC/USDT", side="long", ...)
+    totals = ledger.totals()
+    day = ledger.day("2024-01-31")
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts TEXT NOT NULL,
+    day TEXT NOT NULL,
+    symbol TEXT,
+    side TEXT,
+    entry_price REAL,
+    exit_price REAL,
+    quantity REAL,
+    pnl REAL NOT NULL,
+    r REAL NOT NULL,
+    fees REAL NOT NULL DEFAULT 0,
+    source TEXT NOT NULL DEFAULT 'engine'
+);
+CREATE INDEX IF NOT EXISTS trades_day ON trades(day);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total_trades INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    total_pnl REAL NOT NULL DEFAULT 0,
+    total_fees REAL NOT NULL DEFAULT 0,
+    total_r REAL NOT NULL DEFAULT 0,
+    max_win REAL NOT NULL DEFAULT 0,
+    max_loss REAL NOT NULL DEFAULT 0,
+    max_r REAL NOT NULL DEFAULT 0,
+    min_r REAL NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO totals (id) VALUES (1);
+CREATE TABLE IF NOT EXISTS daily (
+    day TEXT PRIMARY KEY,
+    trades INTEGER NOT NULL DEFAULT 0,
+    pnl REAL NOT NULL DEFAULT 0,
+    r REAL NOT NULL DEFAULT 0,
+    fees REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# record_trade (stats.json) ile aynı kurallar: max_win/max_loss kazanç/kayba göre, min_r 0 iken ilk R
+_UPDATE_TOTALS = """
+UPDATE totals SET
+    total_trades = total_trades + 1,
+    total_pnl = total_pnl + :pnl,
+    total_fees = total_fees + :fees,
+    total_r = total_r + :r,
+    wins = wins + (CASE WHEN :pnl > 0 THEN 1 ELSE 0 END),
+    losses = losses + (CASE WHEN :pnl > 0 THEN 0 ELSE 1 END),
+    max_win = CASE WHEN :pnl > 0 AND :pnl > max_win THEN :pnl ELSE max_win END,
+    max_loss = CASE WHEN :pnl <= 0 AND :pnl < max_loss THEN :pnl ELSE max_loss END,
+    max_r = CASE WHEN :r > max_r THEN :r ELSE max_r END,
+    min_r = CASE WHEN min_r = 0 OR :r < min_r THEN :r ELSE min_r END
+WHERE id = 1
+"""
+
+_UPSERT_DAILY = """
+INSERT INTO daily (day, trades, pnl, r, fees) VALUES (:day, 1, :pnl, :r, :fees)
+ON CONFLICT(day) DO UPDATE SET
+    trades = trades + 1,
+    pnl = pnl + excluded.pnl,
+    r = r + excluded.r,
+    fees = fees + excluded.fees
+"""
+
+_TOTAL_FIELDS = (
+    "total_trades", "wins", "losses", "total_pnl", "total_fees", "total_r",
+    "max_win", "max_loss", "max_r", "min_r",
+)
+
+# trade_logger satırı: [2024-01-31T12:00:00.123456] TRADE symbol=BTC/USDT side=long ...
+_LOG_LINE = re.compile(r"^\[(?P<ts>[^\]]+)\]\s+TRADE\s+(?P<body>.*)$")
+_LOG_FIELD = re.compile(r"(\w+)=(\S*)")
+
+
+class TradeLedger:
+    """SQLite trade defteri. Thread-safe (tek bağlantı + kilit); process'ler arası WAL + busy timeout."""
+
+    def __init__(self, path: Path, timeout: float = 30.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _write(self) -> "_Transaction":
+        return _Transaction(self._conn, self._lock)
+
+    # --- Yazma ---
+
+    def record(
+        self,
+        pnl: float,
+        r_value: float,
+        fees: float = 0.0,
+        symbol: Optional[str] = None,
+        side: Optional[str] = None,
+        entry_price: Optional[float] = None,
+        exit_price: Optional[float] = None,
+        quantity: Optional[float] = None,
+        when: Optional[datetime] = None,
+    ) -> int:
+        """Trade satırı ekler; toplamlar ve günlük satır aynı transaction'da güncellenir. Satır id'si döner."""
+        when = when or datetime.now()
+        params = {
+            "ts": when.isoformat(),
+            "day": when.date().isoformat(),
+            "symbol": symbol,
+            "side": side,
+            "entry_price": entry_price,
+            "exit_price": exit_price,
+            "quantity": quantity,
+            "pnl": float(pnl),
+            "r": float(r_value),
+            "fees": float(fees),
+        }
+        with self._write() as conn:
+            cur = conn.execute(
+                "INSERT INTO trades (ts, day, symbol, side, entry_price, exit_price, quantity, pnl, r, fees) "
+                "VALUES (:ts, :day, :symbol, :side, :entry_price, :exit_price, :quantity, :pnl, :r, :fees)",
+                params,
+            )
+            conn.execute(_UPDATE_TOTALS, params)
+            conn.execute(_UPSERT_DAILY, params)
+            return int(cur.lastrowid)
+
+    # --- Okuma ---
+
+    def totals(self) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM totals WHERE id = 1").fetchone()
+        return {k: row[k] for k in _TOTAL_FIELDS}
+
+    def day(self, day: Optional[str] = None) -> Dict[str, Any]:
+        """Günün toplamları (trade yoksa sıfırlar). day: YYYY-MM-DD, None = bugün."""
+        day = day or date.today().isoformat()
+        with self._lock:
+            row = self._conn.execute("SELECT trades, pnl, r, fees FROM daily WHERE day = ?", (day,)).fetchone()
+        if row is None:
+            return {"day": day, "trades": 0, "pnl": 0.0, "r": 0.0, "fees": 0.0}
+        return {"day": day, "trades": row["trades"], "pnl": row["pnl"], "r": row["r"], "fees": row["fees"]}
+
+    def daily(self, since: Optional[str] = None, until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Gün aralığının toplamları (tarihe göre sıralı)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, trades, pnl, r, fees FROM daily WHERE day >= ? AND day <= ? ORDER BY day",
+                (since or "", until or "9999-12-31"),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def trades(self, day: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Son trade'ler (yeniden eskiye). day verilirse sadece o gün."""
+        with self._lock:
+            if day is None:
+                rows = self._conn.execute("SELECT * FROM trades ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT * FROM trades WHERE day = ? ORDER BY id DESC LIMIT ?", (day, limit)
+                ).fetchall()
+        return [dict(row) for row in rows]
+
+    # --- Bakım / eski verinin aktarımı ---
+
+    def rebuild_aggregates(self) -> None:
+        """totals ve daily tablolarını trades tablosundan yeniden hesaplar."""
+        with self._write() as conn:
+            _rebuild(conn)
+
+    def import_legacy(self, stats_path: Optional[Path] = None, log_dir: Optional[Path] = None) -> Dict[str, int]:
+        """
+        Eski stats.json ve trades_*.log dosyalarını aktarır (bir kez; tekrar çağrılırsa atlanır).
+        Log satırları trade satırı olur (source='log'); stats.json varsa toplamlar ve günlükler
+        ondan (log'daki yuvarlanmış değerler yerine), yoksa trade satırlarından hesaplanır.
+        Returns: {"trades": aktarılan trade, "days": günlük satır}
+        """
+        if self.imported():
+            return {"trades": 0, "days": 0}
+        rows = list(_parse_trade_logs(log_dir)) if log_dir is not None else []
+        legacy = None
+        if stats_path is not None and Path(stats_path).exists():
+            with open(stats_path, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        with self._write() as conn:
+            if conn.execute("SELECT value FROM meta WHERE key = 'legacy_import'").fetchone() is not None:
+                return {"trades": 0, "days": 0}
+            conn.executemany(
+                "INSERT INTO trades (ts, day, symbol, side, entry_price, exit_price, quantity, pnl, r, fees, source) "
+                "VALUES (:ts, :day, :symbol, :side, :entry_price, :exit_price, :quantity, :pnl, :r, :fees, 'log')",
+                rows,
+            )
+            if legacy is not None:
+                _apply_legacy_stats(conn, legacy)
+            else:
+                _rebuild(conn)
+            days = conn.execute("SELECT COUNT(*) FROM daily").fetchone()[0]
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('legacy_import', ?)", (datetime.now().isoformat(),)
+            )
+        return {"trades": len(rows), "days": int(days)}
+
+    def imported(self) -> bool:
+        """Eski veriler aktarıldı mı (import_legacy çalıştı mı)."""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_import'").fetchone() is not None
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT total_trades FROM totals WHERE id = 1").fetchone()[0] == 0
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT (hata olursa ROLLBACK); ledger kilidi altında."""
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.Lock):
+        self._conn = conn
+        self._lock = lock
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._lock.acquire()
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+        except Exception:
+            self._lock.release()
+            raise
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self._conn.execute("ROLLBACK" if exc_type is not None else "COMMIT")
+        finally:
+            self._lock.release()
+
+
+def _rebuild(conn: sqlite3.Connection) -> None:
+    conn.execute("DELETE FROM daily")
+    conn.execute(
+        "INSERT INTO daily (day, trades, pnl, r, fees) "
+        "SELECT day, COUNT(*), SUM(pnl), SUM(r), SUM(fees) FROM trades GROUP BY day"
+    )
+    conn.execute("UPDATE totals SET " + ", ".join(f"{k} = 0" for k in _TOTAL_FIELDS) + " WHERE id = 1")
+    for row in conn.execute("SELECT pnl, r, fees FROM trades ORDER BY id").fetchall():
+        conn.execute(_UPDATE_TOTALS, {"pnl": row["pnl"], "r": row["r"], "fees": row["fees"]})
+
+
+def _apply_legacy_stats(conn: sqlite3.Connection, data: Dict[str, Any]) -> None:
+    values = {k: data.get(k, 0) or 0 for k in _TOTAL_FIELDS}
+    conn.execute(
+        "UPDATE totals SET " + ", ".join(f"{k} = :{k}" for k in _TOTAL_FIELDS) + " WHERE id = 1", values
+    )
+    conn.execute("DELETE FROM daily")
+    counts = dict(conn.execute("SELECT day, COUNT(*) FROM trades GROUP BY day").fetchall())
+    for d in data.get("daily", []):
+        if not d.get("date"):
+            continue
+        conn.execute(
+            "INSERT OR REPLACE INTO daily (day, trades, pnl, r, fees) VALUES (?, ?, ?, ?, ?)",
+            (d["date"], counts.get(d["date"], 0), d.get("pnl", 0) or 0, d.get("r", 0) or 0, d.get("fees", 0) or 0),
+        )
+
+
+def _parse_trade_logs(log_dir: Path) -> Iterator[Dict[str, Any]]:
+    """trades_YYYY-MM-DD.log satırları -> trade satırları (tarih sırasıyla)."""
+    for path in sorted(Path(log_dir).glob("trades_*.log")):
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                m = _LOG_LINE.match(line.strip())
+                if m is None:
+                    continue
+                fields = dict(_LOG_FIELD.findall(m.group("body")))
+                try:
+                    ts = datetime.fromisoformat(m.group("ts"))
+                    yield {
+                        "ts": ts.isoformat(),
+                        "day": ts.date().isoformat(),
+                        "symbol": fields.get("symbol"),
+                        "side": fields.get("side"),
+                        "entry_price": _float(fields.get("entry")),
+                        "exit_price": _float(fields.get("exit")),
+                        "quantity": _float(fields.get("qty")),
+                        "pnl": _float(fields.get("pnl")) or 0.0,
+                        "r": _float(fields.get("r")) or 0.0,
+                        "fees": _float(fields.get("fees")) or 0.0,
+                    }
+                except ValueError:
+                    continue
+
+
+def _float(value: Optional[str]) -> Optional[float]:
+    if value in (None, "", "None"):
+        return None
+    return float(value)
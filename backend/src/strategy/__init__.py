@@ -6,10 +6,21 @@ from .indicators import (
     compute_ema,
     compute_macd,
     compute_rsi,
+    compute_indicators,
+    get_indicator_backend,
     ohlcv_to_dataframe,
+    set_indicator_backend,
 )
-from .trend_filter import get_daily_trend
-from .signal_generator import get_entry_signal, get_atr_and_stop_price
+from .incremental import (
+    IncrementalATR,
+    IncrementalEMA,
+    IncrementalIndicatorSet,
+    IncrementalMACD,
+    IncrementalRSI,
+)
+from .market_snapshot import MarketSnapshot, build_market_snapshot
+from .trend_filter import clear_trend_cache, get_daily_trend, get_trend_cache_stats, peek_daily_trend
+from .signal_generator import get_entry_signal, get_entry_signals_batch, get_atr_and_stop_price
 
 __all__ = [
     "add_indicators_to_df",
@@ -17,8 +28,22 @@ __all__ = [
     "compute_ema",
     "compute_macd",
     "compute_rsi",
+    "compute_indicators",
+    "get_indicator_backend",
+    "set_indicator_backend",
     "ohlcv_to_dataframe",
+    "IncrementalATR",
+    "IncrementalEMA",
+    "IncrementalIndicatorSet",
+    "IncrementalMACD",
+    "IncrementalRSI",
+    "MarketSnapshot",
+    "build_market_snapshot",
     "get_daily_trend",
+    "get_trend_cache_stats",
+    "clear_trend_cache",
+    "peek_daily_trend",
     "get_entry_signal",
+    "get_entry_signals_batch",
     "get_atr_and_stop_price",
 ]
@@ -0,0 +1,179 @@
+"""
+Toplu (batch) indikatör hesabı - çok sembol için 2D (semboller × bar) array'ler üzerinde.
+
+Sembol başına Python döngüsünde indikatör pipeline'ı çalıştırmak yerine close/high/low
+matrisleri tek geçişte işlenir: ewm rekürsiyonu bar ekseninde ilerler, her adım tüm
+semboller için vektörel hesaplanır. Sonuçlar satır bazında indicators_np ile birebir aynıdır.
+
+Kararlar int8 array olarak döner: LONG=1, SHORT=-1, NONE=0 (trend için NEUTRAL=0).
+
+Kullanım:
+    close, high, low, valid = stack_ohlcv([ohlcv_btc, ohlcv_eth, ...], bars=250)
+    frame = indicators_batch(close, high, low, ema_period=200)
+    entries = entry_decisions_batch(frame, trends, valid, rsi_threshold=50)
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .indicators_np import ewm_mean
+
+LONG = 1
+SHORT = -1
+NONE = 0
+
+_DIRECTIONS = {LONG: "long", SHORT: "short"}
+
+
+def decode_direction(code: int, neutral: Any = None) -> Any:
+    """int8 kararı 'long' | 'short' | neutral değerine çevirir."""
+    return _DIRECTIONS.get(int(code), neutral)
+
+
+def group_by_length(ohlcv_list: Sequence[List[List[Any]]], min_bars: int) -> Dict[int, List[int]]:
+    """
+    Sembol indekslerini mum sayısına göre gruplar (min_bars'tan kısa olanlar atlanır).
+    ewm sonuçları geçmiş uzunluğuna bağlı olduğundan her grup kendi uzunluğunda batch'lenir;
+    böylece sonuçlar sembol bazlı hesapla birebir aynı kalır.
+    """
+    groups: Dict[int, List[int]] = {}
+    for i, ohlcv in enumerate(ohlcv_list):
+        n = len(ohlcv or [])
+        if n >= max(1, min_bars):
+            groups.setdefault(n, []).append(i)
+    return groups
+
+
+def stack_ohlcv(
+    ohlcv_list: Sequence[List[List[Any]]],
+    bars: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sembol başına OHLCV listelerini (S, bars) close/high/low matrislerine dizer.
+    Her sembolün son `bars` mumu alınır; daha az mumu olan semboller valid=False olur
+    (satırları 1.0 ile doldurulur, kararları NONE döner).
+
+    Returns:
+        (close, high, low, valid)
+    """
+    n = len(ohlcv_list)
+    close = np.ones((n, bars), dtype=np.float64)
+    high = np.ones((n, bars), dtype=np.float64)
+    low = np.ones((n, bars), dtype=np.float64)
+    valid = np.zeros(n, dtype=bool)
+    for i, ohlcv in enumerate(ohlcv_list):
+        if not ohlcv or len(ohlcv) < bars:
+            continue
+        data = np.array([row[2:5] for row in ohlcv[-bars:]], dtype=np.float64)
+        if np.isnan(data).any():
+            continue
+        high[i], low[i], close[i] = data[:, 0], data[:, 1], data[:, 2]
+        valid[i] = True
+    return close, high, low, valid
+
+
+def ewm_mean_2d(values: np.ndarray, span: int) -> np.ndarray:
+    """Her satır için Series.ewm(span, adjust=False).mean(); satırlar birbirinden bağımsız."""
+    if values.ndim != 2 or values.shape[1] == 0:
+        return np.empty_like(values, dtype=np.float64)
+    if np.isnan(values).any():
+        # NaN'lı satırlarda pandas ağırlık davranışı satır bazında uygulanır
+        return np.vstack([ewm_mean(row, span) for row in values])
+    com = (span - 1) / 2.0
+    alpha = 1.0 / (1.0 + com)
+    old_wt_factor = 1.0 - alpha
+    denom = old_wt_factor + alpha
+    out = np.empty_like(values, dtype=np.float64)
+    weighted = values[:, 0].copy()
+    out[:, 0] = weighted
+    for i in range(1, values.shape[1]):
+        cur = values[:, i]
+        updated = (old_wt_factor * weighted + alpha * cur) / denom
+        # pandas: değer zaten eşitse güncelleme yapılmaz
+        weighted = np.where(weighted != cur, updated, weighted)
+        out[:, i] = weighted
+    return out
+
+
+def indicators_batch(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    ema_period: int = 200,
+    macd_fast: int = 12,
+    macd_slow: int = 26,
+    macd_signal: int = 9,
+    rsi_period: int = 14,
+    atr_period: int = 14,
+) -> Dict[str, np.ndarray]:
+    """
+    (S, B) matrisler için EMA, MACD, RSI, ATR.
+    Returns: {"close", "ema", "macd", "macd_signal", "macd_hist", "rsi", "atr"} -> (S, B)
+    """
+    ema = ewm_mean_2d(close, ema_period)
+    macd_line = ewm_mean_2d(close, macd_fast) - ewm_mean_2d(close, macd_slow)
+    signal_line = ewm_mean_2d(macd_line, macd_signal)
+
+    delta = np.empty_like(close)
+    delta[:, :1] = np.nan
+    np.subtract(close[:, 1:], close[:, :-1], out=delta[:, 1:])
+    with np.errstate(invalid="ignore"):
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+    avg_gain = ewm_mean_2d(gain, rsi_period)
+    avg_loss = ewm_mean_2d(loss, rsi_period)
+    avg_loss[avg_loss == 0] = np.nan
+    rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    prev_close = np.empty_like(close)
+    prev_close[:, :1] = np.nan
+    prev_close[:, 1:] = close[:, :-1]
+    tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+    atr = ewm_mean_2d(tr, atr_period)
+
+    return {
+        "close": close,
+        "ema": ema,
+        "macd": macd_line,
+        "macd_signal": signal_line,
+        "macd_hist": macd_line - signal_line,
+        "rsi": rsi,
+        "atr": atr,
+    }
+
+
+def trend_decisions_batch(frame: Dict[str, np.ndarray], valid: np.ndarray) -> np.ndarray:
+    """
+    Son bar'a göre trend: fiyat > EMA ve MACD > Signal -> LONG, tersi -> SHORT, aksi NEUTRAL (0).
+    get_daily_trend kuralları ile aynı.
+    """
+    close, ema = frame["close"][:, -1], frame["ema"][:, -1]
+    macd, sig = frame["macd"][:, -1], frame["macd_signal"][:, -1]
+    out = np.zeros(len(close), dtype=np.int8)
+    ok = valid & ~(np.isnan(ema) | np.isnan(macd) | np.isnan(sig))
+    out[ok & (close > ema) & (macd > sig)] = LONG
+    out[ok & (close < ema) & (macd < sig)] = SHORT
+    return out
+
+
+def entry_decisions_batch(
+    frame: Dict[str, np.ndarray],
+    trends: np.ndarray,
+    valid: np.ndarray,
+    rsi_threshold: float = 50,
+) -> np.ndarray:
+    """
+    Son bar'a göre entry kararı; get_entry_signal kuralları ile aynı.
+    trends: trend_decisions_batch çıktısı (LONG / SHORT / 0=neutral).
+    """
+    close, ema = frame["close"][:, -1], frame["ema"][:, -1]
+    macd, sig, rsi = frame["macd"][:, -1], frame["macd_signal"][:, -1], frame["rsi"][:, -1]
+    out = np.zeros(len(close), dtype=np.int8)
+    ok = valid & ~(np.isnan(ema) | np.isnan(macd) | np.isnan(sig) | np.isnan(rsi))
+    long_ok = ok & (trends != SHORT) & (close > ema) & (macd > sig) & (rsi > rsi_threshold)
+    short_ok = ok & (trends != LONG) & (close < ema) & (macd < sig) & (rsi < rsi_threshold)
+    out[long_ok] = LONG
+    # get_entry_signal önce long'a bakar
+    out[short_ok & ~long_ok] = SHORT
+    return out
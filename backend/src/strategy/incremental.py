@@ -0,0 +1,298 @@
+"""
+Artımlı (streaming) indikatörler - EMA, MACD, RSI, ATR için O(1) bar-bar güncelleme.
+
+indicators.py'deki compute_* fonksiyonları her çağrıda tüm geçmişi pandas ewm ile baştan
+hesaplar. Buradaki sınıflar rekürsif state'i tutar ve update(bar) ile her yeni bar'da
+tek adım ilerler. Çıktı compute_* (ewm adjust=False) ile birebir aynıdır: pandas'ın ewm
+rekürsiyonu (ağırlık normalizasyonu ve NaN davranışı dahil) aynen uygulanır.
+
+bar: ccxt OHLCV satırı [timestamp, open, high, low, close, volume]. EMA/MACD/RSI düz
+kapanış fiyatı (float) da kabul eder; ATR high/low/close gerektirdiği için satır ister.
+
+Kullanım:
+    ema = IncrementalEMA(200).seed(ohlcv)     # geçmişten başlat
+    value = ema.update(new_bar)               # yeni kapanan bar
+
+    state = ema.snapshot()                    # oluşmakta olan bar'ı denemek için
+    ema.update(forming_bar)
+    ema.restore(state)
+"""
+
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+Bar = Union[float, int, Sequence[Any]]
+
+_NAN = float("nan")
+
+
+def _close(bar: Bar) -> float:
+    if isinstance(bar, (int, float)):
+        return float(bar)
+    return float(bar[4])
+
+
+class _EWM:
+    """
+    pandas Series.ewm(span=period, adjust=False).mean() rekürsiyonu.
+    pandas/_libs/window/aggregations.pyx::ewm ile aynı adımlar (ignore_na=False, min_periods=1).
+    """
+
+    __slots__ = ("_alpha", "_old_wt_factor", "_weighted", "_old_wt", "_nobs", "_started")
+
+    def __init__(self, span: int):
+        com = (span - 1) / 2.0
+        self._alpha = 1.0 / (1.0 + com)
+        self._old_wt_factor = 1.0 - self._alpha
+        self._weighted = _NAN
+        self._old_wt = 1.0
+        self._nobs = 0
+        self._started = False
+
+    @property
+    def value(self) -> float:
+        return self._weighted if self._nobs >= 1 else _NAN
+
+    def update(self, x: float) -> float:
+        is_observation = x == x
+        if not self._started:
+            self._started = True
+            self._weighted = x
+            self._nobs = int(is_observation)
+            self._old_wt = 1.0
+            return self.value
+        self._nobs += is_observation
+        weighted = self._weighted
+        if weighted == weighted:
+            self._old_wt *= self._old_wt_factor
+            if is_observation:
+                # pandas: sabit seride sayısal hata olmasın diye eşitse güncelleme yok
+                if weighted != x:
+                    weighted = self._old_wt * weighted + self._alpha * x
+                    weighted /= self._old_wt + self._alpha
+                self._old_wt = 1.0
+        elif is_observation:
+            weighted = x
+        self._weighted = weighted
+        return self.value
+
+    def snapshot(self) -> Tuple[float, float, int, bool]:
+        return (self._weighted, self._old_wt, self._nobs, self._started)
+
+    def restore(self, state: Tuple[float, float, int, bool]) -> None:
+        self._weighted, self._old_wt, self._nobs, self._started = state
+
+
+class IncrementalEMA:
+    """EMA(period); compute_ema ile aynı."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self._ewm = _EWM(period)
+
+    @property
+    def value(self) -> float:
+        return self._ewm.value
+
+    def update(self, bar: Bar) -> float:
+        return self._ewm.update(_close(bar))
+
+    def seed(self, history: Iterable[Bar]) -> "IncrementalEMA":
+        for bar in history:
+            self.update(bar)
+        return self
+
+    def snapshot(self) -> Tuple:
+        return self._ewm.snapshot()
+
+    def restore(self, state: Tuple) -> None:
+        self._ewm.restore(state)
+
+
+class IncrementalMACD:
+    """MACD(fast, slow, signal); compute_macd ile aynı. update -> (macd_line, signal_line, histogram)."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = fast
+        self.slow = slow
+        self.signal_period = signal
+        self._fast = _EWM(fast)
+        self._slow = _EWM(slow)
+        self._signal = _EWM(signal)
+        self.macd = _NAN
+        self.signal = _NAN
+        self.histogram = _NAN
+
+    @property
+    def value(self) -> Tuple[float, float, float]:
+        return self.macd, self.signal, self.histogram
+
+    def update(self, bar: Bar) -> Tuple[float, float, float]:
+        close = _close(bar)
+        self.macd = self._fast.update(close) - self._slow.update(close)
+        self.signal = self._signal.update(self.macd)
+        self.histogram = self.macd - self.signal
+        return self.value
+
+    def seed(self, history: Iterable[Bar]) -> "IncrementalMACD":
+        for bar in history:
+            self.update(bar)
+        return self
+
+    def snapshot(self) -> Tuple:
+        return (
+            self._fast.snapshot(),
+            self._slow.snapshot(),
+            self._signal.snapshot(),
+            self.macd,
+            self.signal,
+            self.histogram,
+        )
+
+    def restore(self, state: Tuple) -> None:
+        fast, slow, signal, self.macd, self.signal, self.histogram = state
+        self._fast.restore(fast)
+        self._slow.restore(slow)
+        self._signal.restore(signal)
+
+
+class IncrementalRSI:
+    """RSI(period); compute_rsi ile aynı (avg_loss 0 iken NaN)."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._gain = _EWM(period)
+        self._loss = _EWM(period)
+        self._prev_close = _NAN
+        self.value = _NAN
+
+    def update(self, bar: Bar) -> float:
+        close = _close(bar)
+        delta = close - self._prev_close
+        self._prev_close = close
+        # pandas where: NaN delta (ilk bar) 0.0 olur
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = self._gain.update(gain)
+        avg_loss = self._loss.update(loss)
+        if avg_loss == 0 or avg_loss != avg_loss:
+            self.value = _NAN
+        else:
+            rs = avg_gain / avg_loss
+            self.value = 100 - (100 / (1 + rs))
+        return self.value
+
+    def seed(self, history: Iterable[Bar]) -> "IncrementalRSI":
+        for bar in history:
+            self.update(bar)
+        return self
+
+    def snapshot(self) -> Tuple:
+        return (self._gain.snapshot(), self._loss.snapshot(), self._prev_close, self.value)
+
+    def restore(self, state: Tuple) -> None:
+        gain, loss, self._prev_close, self.value = state
+        self._gain.restore(gain)
+        self._loss.restore(loss)
+
+
+class IncrementalATR:
+    """ATR(period); compute_atr ile aynı. bar: OHLCV satırı."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._ewm = _EWM(period)
+        self._prev_close = _NAN
+
+    @property
+    def value(self) -> float:
+        return self._ewm.value
+
+    def update(self, bar: Sequence[Any]) -> float:
+        high, low, close = float(bar[2]), float(bar[3]), float(bar[4])
+        prev_close = self._prev_close
+        self._prev_close = close
+        # pandas concat(...).max(axis=1): NaN'lar atlanır
+        ranges = [r for r in (high - low, abs(high - prev_close), abs(low - prev_close)) if r == r]
+        tr = max(ranges) if ranges else _NAN
+        return self._ewm.update(tr)
+
+    def seed(self, history: Iterable[Sequence[Any]]) -> "IncrementalATR":
+        for bar in history:
+            self.update(bar)
+        return self
+
+    def snapshot(self) -> Tuple:
+        return (self._ewm.snapshot(), self._prev_close)
+
+    def restore(self, state: Tuple) -> None:
+        ewm, self._prev_close = state
+        self._ewm.restore(ewm)
+
+
+class IncrementalIndicatorSet:
+    """
+    add_indicators_to_df ile aynı indikatörleri tek sembol için canlı tutar.
+    update(bar) -> {"close", "ema", "macd", "macd_signal", "macd_hist", "rsi", "atr"}
+    """
+
+    def __init__(
+        self,
+        ema_period: int = 200,
+        macd_fast: int = 12,
+        macd_slow: int = 26,
+        macd_signal: int = 9,
+        rsi_period: int = 14,
+        atr_period: int = 14,
+    ):
+        self.ema = IncrementalEMA(ema_period)
+        self.macd = IncrementalMACD(macd_fast, macd_slow, macd_signal)
+        self.rsi = IncrementalRSI(rsi_period)
+        self.atr = IncrementalATR(atr_period)
+        self.count = 0
+        self.last_timestamp: Optional[int] = None
+        self.last_close = _NAN
+
+    def update(self, bar: Sequence[Any]) -> Dict[str, float]:
+        self.ema.update(bar)
+        self.macd.update(bar)
+        self.rsi.update(bar)
+        self.atr.update(bar)
+        self.count += 1
+        self.last_timestamp = int(bar[0])
+        self.last_close = float(bar[4])
+        return self.values()
+
+    def values(self) -> Dict[str, float]:
+        macd_line, signal_line, hist = self.macd.value
+        return {
+            "close": self.last_close,
+            "ema": self.ema.value,
+            "macd": macd_line,
+            "macd_signal": signal_line,
+            "macd_hist": hist,
+            "rsi": self.rsi.value,
+            "atr": self.atr.value,
+        }
+
+    def seed(self, history: Iterable[Sequence[Any]]) -> "IncrementalIndicatorSet":
+        for bar in history:
+            self.update(bar)
+        return self
+
+    def snapshot(self) -> Tuple:
+        return (
+            self.ema.snapshot(),
+            self.macd.snapshot(),
+            self.rsi.snapshot(),
+            self.atr.snapshot(),
+            self.count,
+            self.last_timestamp,
+            self.last_close,
+        )
+
+    def restore(self, state: Tuple) -> None:
+        ema, macd, rsi, atr, self.count, self.last_timestamp, self.last_close = state
+        self.ema.restore(ema)
+        self.macd.restore(macd)
+        self.rsi.restore(rsi)
+        self.atr.restore(atr)
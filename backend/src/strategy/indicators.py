@@ -3,22 +3,52 @@
 
 Girdi: get_klines formatı [timestamp, open, high, low, close, volume] listesi
 veya (open, high, low, close) array'leri.
+
+Backend: compute_indicators / compute_atr_values varsayılan olarak NumPy kernel'lerini
+(indicators_np) kullanır; set_indicator_backend("pandas") ile pandas versiyonuna dönülür.
+Config: strategy.indicator_backend (numpy | pandas).
+pandas import'u lazy: sadece pandas backend'i ve DataFrame fonksiyonları kullanıldığında yüklenir.
 """
 
-from typing import List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 import numpy as np
-import pandas as pd
+
+from . import indicators_np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+INDICATOR_BACKENDS = ("numpy", "pandas")
+_backend = "numpy"
+
+
+def set_indicator_backend(name: str) -> None:
+    """compute_indicators için varsayılan backend'i seçer: 'numpy' | 'pandas'."""
+    global _backend
+    name = str(name or "numpy").lower().strip()
+    if name not in INDICATOR_BACKENDS:
+        raise ValueError(f"Geçersiz indikatör backend'i: {name}")
+    _backend = name
+
+
+def get_indicator_backend() -> str:
+    """Aktif indikatör backend'i."""
+    return _backend
 
 
-def _to_series(ohlcv: List[List], key: str) -> pd.Series:
+def _to_series(ohlcv: List[List], key: str) -> "pd.Series":
     """OHLCV listesinden tek sütun Series. key: 'open','high','low','close','volume'."""
+    import pandas as pd
+
     idx = {"open": 1, "high": 2, "low": 3, "close": 4, "volume": 5}[key]
     return pd.Series([row[idx] for row in ohlcv], dtype=float)
 
 
-def ohlcv_to_dataframe(ohlcv: List[List]) -> pd.DataFrame:
+def ohlcv_to_dataframe(ohlcv: List[List]) -> "pd.DataFrame":
     """ccxt OHLCV listesini DataFrame'e çevirir."""
+    import pandas as pd
+
     if not ohlcv:
         return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
     df = pd.DataFrame(
@@ -30,23 +60,27 @@ def ohlcv_to_dataframe(ohlcv: List[List]) -> pd.DataFrame:
     return df
 
 
-def compute_ema(close: Union[pd.Series, List[float]], period: int) -> pd.Series:
+def compute_ema(close: Union["pd.Series", List[float]], period: int) -> "pd.Series":
     """EMA(period). close: kapanış fiyatları."""
+    import pandas as pd
+
     if isinstance(close, list):
         close = pd.Series(close)
     return close.ewm(span=period, adjust=False).mean()
 
 
 def compute_macd(
-    close: Union[pd.Series, List[float]],
+    close: Union["pd.Series", List[float]],
     fast: int = 12,
     slow: int = 26,
     signal: int = 9,
-) -> Tuple[pd.Series, pd.Series, pd.Series]:
+) -> Tuple["pd.Series", "pd.Series", "pd.Series"]:
     """
     MACD line, signal line, histogram.
     Returns: (macd_line, signal_line, histogram)
     """
+    import pandas as pd
+
     if isinstance(close, list):
         close = pd.Series(close)
     ema_fast = close.ewm(span=fast, adjust=False).mean()
@@ -57,8 +91,10 @@ def compute_macd(
     return macd_line, signal_line, histogram
 
 
-def compute_rsi(close: Union[pd.Series, List[float]], period: int = 14) -> pd.Series:
+def compute_rsi(close: Union["pd.Series", List[float]], period: int = 14) -> "pd.Series":
     """RSI(period)."""
+    import pandas as pd
+
     if isinstance(close, list):
         close = pd.Series(close)
     delta = close.diff()
@@ -72,12 +108,14 @@ def compute_rsi(close: Union[pd.Series, List[float]], period: int = 14) -> pd.Se
 
 
 def compute_atr(
-    high: Union[pd.Series, List[float]],
-    low: Union[pd.Series, List[float]],
-    close: Union[pd.Series, List[float]],
+    high: Union["pd.Series", List[float]],
+    low: Union["pd.Series", List[float]],
+    close: Union["pd.Series", List[float]],
     period: int = 14,
-) -> pd.Series:
+) -> "pd.Series":
     """ATR(period)."""
+    import pandas as pd
+
     if isinstance(high, list):
         high, low, close = pd.Series(high), pd.Series(low), pd.Series(close)
     prev_close = close.shift(1)
@@ -89,14 +127,14 @@ def compute_atr(
 
 
 def add_indicators_to_df(
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     ema_period: int = 200,
     macd_fast: int = 12,
     macd_slow: int = 26,
     macd_signal: int = 9,
     rsi_period: int = 14,
     atr_period: int = 14,
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """
     DataFrame'e EMA, MACD, RSI, ATR ekler (sütunlar: ema, macd, signal, macd_hist, rsi, atr).
     """
@@ -110,3 +148,58 @@ def add_indicators_to_df(
     df["rsi"] = compute_rsi(c, rsi_period)
     df["atr"] = compute_atr(h, l, c, atr_period)
     return df
+
+
+IndicatorInput = Union[List[List], Dict[str, np.ndarray]]
+
+
+def compute_indicators(
+    ohlcv: IndicatorInput,
+    ema_period: int = 200,
+    macd_fast: int = 12,
+    macd_slow: int = 26,
+    macd_signal: int = 9,
+    rsi_period: int = 14,
+    atr_period: int = 14,
+    backend: Optional[str] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    add_indicators_to_df ile aynı sütunları sütun başına numpy array olarak döndürür
+    (timestamp, open, high, low, close, volume, ema, macd, macd_signal, macd_hist, rsi, atr).
+
+    Args:
+        ohlcv: get_klines listesi veya indicators_np.ohlcv_to_arrays çıktısı
+        backend: None ise aktif backend (get_indicator_backend)
+    """
+    backend = backend or _backend
+    params = dict(
+        ema_period=ema_period,
+        macd_fast=macd_fast,
+        macd_slow=macd_slow,
+        macd_signal=macd_signal,
+        rsi_period=rsi_period,
+        atr_period=atr_period,
+    )
+    arrays = ohlcv if isinstance(ohlcv, dict) else indicators_np.ohlcv_to_arrays(ohlcv)
+    if backend == "numpy":
+        return indicators_np.indicator_arrays(arrays, **params)
+    import pandas as pd
+
+    df = add_indicators_to_df(pd.DataFrame(arrays), **params)
+    return {col: df[col].to_numpy(dtype=np.float64) for col in df.columns}
+
+
+def compute_atr_values(
+    ohlcv: IndicatorInput,
+    period: int = 14,
+    backend: Optional[str] = None,
+) -> np.ndarray:
+    """ATR(period) serisi; compute_indicators ile aynı backend seçimi."""
+    backend = backend or _backend
+    arrays = ohlcv if isinstance(ohlcv, dict) else indicators_np.ohlcv_to_arrays(ohlcv)
+    h, l, c = arrays["high"], arrays["low"], arrays["close"]
+    if backend == "numpy":
+        return indicators_np.atr_np(h, l, c, period)
+    import pandas as pd
+
+    return compute_atr(pd.Series(h), pd.Series(l), pd.Series(c), period).to_numpy(dtype=np.float64)
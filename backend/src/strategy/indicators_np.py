@@ -0,0 +1,132 @@
+"""
+NumPy indikatör kernel'leri - pandas'sız EMA, MACD, RSI, ATR.
+
+Kullandığımız kısa serilerde (50–300 bar) DataFrame oluşturma, pd.concat(...).max(axis=1)
+ve .copy() maliyeti hesaplamanın kendisinden büyüktür. Bu kernel'ler contiguous float64
+array'ler üzerinde çalışır ve indicators.py'deki pandas versiyonlarıyla birebir aynı sonucu
+verir (ewm adjust=False rekürsiyonu pandas ile aynı adımlarla uygulanır).
+
+Parity ve hız karşılaştırması: scripts/bench_indicators.py
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+OHLCV_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+
+def ohlcv_to_arrays(ohlcv: List[List[Any]]) -> Dict[str, np.ndarray]:
+    """ccxt OHLCV listesini sütun başına contiguous float64 array'e çevirir (None -> NaN)."""
+    if not ohlcv:
+        return {col: np.empty(0, dtype=np.float64) for col in OHLCV_COLUMNS}
+    data = np.array([row[:6] for row in ohlcv], dtype=np.float64).T.copy()
+    return {col: data[i] for i, col in enumerate(OHLCV_COLUMNS)}
+
+
+def ewm_mean(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Series.ewm(span=span, adjust=False).mean() ile aynı.
+    pandas'ın rekürsiyonu (ağırlık normalizasyonu, eşit değer kısayolu, NaN davranışı) korunur.
+    """
+    n = len(values)
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+    com = (span - 1) / 2.0
+    alpha = 1.0 / (1.0 + com)
+    old_wt_factor = 1.0 - alpha
+    vals = values.tolist()
+    out = [0.0] * n
+    weighted = vals[0]
+
+    if not np.isnan(values).any():
+        # Hızlı yol: NaN yokken ağırlık her adımda old_wt_factor'dır
+        denom = old_wt_factor + alpha
+        out[0] = weighted
+        for i in range(1, n):
+            cur = vals[i]
+            if weighted != cur:
+                weighted = (old_wt_factor * weighted + alpha * cur) / denom
+            out[i] = weighted
+        return np.array(out, dtype=np.float64)
+
+    nan = float("nan")
+    nobs = int(weighted == weighted)
+    old_wt = 1.0
+    out[0] = weighted if nobs else nan
+    for i in range(1, n):
+        cur = vals[i]
+        is_observation = cur == cur
+        nobs += is_observation
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_observation:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        out[i] = weighted if nobs else nan
+    return np.array(out, dtype=np.float64)
+
+
+def ema_np(close: np.ndarray, period: int) -> np.ndarray:
+    """EMA(period)."""
+    return ewm_mean(close, period)
+
+
+def macd_np(
+    close: np.ndarray,
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(macd_line, signal_line, histogram)."""
+    macd_line = ewm_mean(close, fast) - ewm_mean(close, slow)
+    signal_line = ewm_mean(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def rsi_np(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """RSI(period). avg_loss 0 iken NaN (pandas versiyonu gibi)."""
+    delta = np.empty_like(close)
+    if len(close):
+        delta[0] = np.nan
+        np.subtract(close[1:], close[:-1], out=delta[1:])
+    with np.errstate(invalid="ignore"):
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+    avg_gain = ewm_mean(gain, period)
+    avg_loss = ewm_mean(loss, period)
+    avg_loss[avg_loss == 0] = np.nan
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def atr_np(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """ATR(period). True range için NaN'lar atlanır (pandas max(axis=1) gibi)."""
+    prev_close = np.empty_like(close)
+    if len(close):
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+    tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+    return ewm_mean(tr, period)
+
+
+def indicator_arrays(
+    arrays: Dict[str, np.ndarray],
+    ema_period: int = 200,
+    macd_fast: int = 12,
+    macd_slow: int = 26,
+    macd_signal: int = 9,
+    rsi_period: int = 14,
+    atr_period: int = 14,
+) -> Dict[str, np.ndarray]:
+    """add_indicators_to_df karşılığı: OHLCV array'lerine ema, macd, macd_signal, macd_hist, rsi, atr ekler."""
+    c, h, l = arrays["close"], arrays["high"], arrays["low"]
+    out = dict(arrays)
+    out["ema"] = ema_np(c, ema_period)
+    out["macd"], out["macd_signal"], out["macd_hist"] = macd_np(c, macd_fast, macd_slow, macd_signal)
+    out["rsi"] = rsi_np(c, rsi_period)
+    out["atr"] = atr_np(h, l, c, atr_period)
+    return out
@@ -0,0 +1,140 @@
+"""
+Market Snapshot - Tek döngüde tek sembol için ortak piyasa verisi.
+
+Bir _run_once geçişinde sinyal (get_entry_signal), stop (get_atr_and_stop_price) ve trailing
+(ATR) kodu aynı mumları ve aynı indikatör frame'ini okur. Böylece aynı sembol için mumlar
+döngü başına bir kez çekilir ve sinyal ile stop fiyatı farklı mum setlerinden hesaplanmaz.
+
+Kullanım:
+    snapshot = build_market_snapshot(symbol, exchange)
+    signal = get_entry_signal(symbol, exchange, snapshot=snapshot)
+    atr, stop, entry = get_atr_and_stop_price(symbol, exchange, signal, snapshot=snapshot)
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from ..core.config_manager import get_config
+except ImportError:
+    from core.config_manager import get_config
+
+from .indicators import compute_atr_values, compute_indicators, ohlcv_to_dataframe
+from .indicators_np import ohlcv_to_arrays
+from .trend_filter import drop_forming_bar
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class MarketSnapshot:
+    """
+    Bir sembolün entry timeframe mumları ve bunlardan türetilen indikatörler.
+    İndikatör frame'leri ve ATR değerleri parametre başına bir kez hesaplanıp saklanır.
+    daily_trend: get_daily_trend tarafından doldurulur (aynı döngüde tekrar hesaplanmaz).
+    """
+
+    def __init__(self, symbol: str, timeframe: str, ohlcv: List[List[Any]]):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.ohlcv = ohlcv or []
+        self.daily_trend: Optional[str] = None
+        self._df: Optional["pd.DataFrame"] = None
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+        self._frames: Dict[Tuple[int, ...], Dict[str, np.ndarray]] = {}
+        self._atr: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.ohlcv)
+
+    @property
+    def df(self) -> "pd.DataFrame":
+        """Ham OHLCV DataFrame (indikatörsüz; pandas ilk erişimde yüklenir)."""
+        if self._df is None:
+            self._df = ohlcv_to_dataframe(self.ohlcv)
+        return self._df
+
+    @property
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """OHLCV sütunları (float64 array)."""
+        if self._arrays is None:
+            self._arrays = ohlcv_to_arrays(self.ohlcv)
+        return self._arrays
+
+    @property
+    def last_close(self) -> float:
+        """Son mumun kapanışı."""
+        return float(self.arrays["close"][-1])
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """Son mumun açılış zamanı (ms)."""
+        if not self.ohlcv:
+            return None
+        return int(self.ohlcv[-1][0])
+
+    def indicators(
+        self,
+        ema_period: int = 200,
+        macd_fast: int = 12,
+        macd_slow: int = 26,
+        macd_signal: int = 9,
+        rsi_period: int = 14,
+        atr_period: int = 14,
+    ) -> Dict[str, np.ndarray]:
+        """compute_indicators sonucu (sütun -> array); aynı parametrelerle tekrar hesaplanmaz."""
+        key = (ema_period, macd_fast, macd_slow, macd_signal, rsi_period, atr_period)
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = compute_indicators(
+                self.arrays,
+                ema_period=ema_period,
+                macd_fast=macd_fast,
+                macd_slow=macd_slow,
+                macd_signal=macd_signal,
+                rsi_period=rsi_period,
+                atr_period=atr_period,
+            )
+            self._frames[key] = frame
+        return frame
+
+    def atr(self, period: int = 14) -> float:
+        """Son mumun ATR(period) değeri. Yetersiz veri veya NaN ise 0.0."""
+        if period in self._atr:
+            return self._atr[period]
+        value = 0.0
+        if len(self.ohlcv) >= period:
+            last = compute_atr_values(self.arrays, period)[-1]
+            if not np.isnan(last):
+                value = float(last)
+        self._atr[period] = value
+        return value
+
+
+def build_market_snapshot(
+    symbol: str,
+    exchange,
+    timeframe: Optional[str] = None,
+    limit: int = 250,
+    closed_only: bool = False,
+    now_ms: Optional[int] = None,
+) -> MarketSnapshot:
+    """
+    Sembolün entry timeframe mumlarını bir kez çekip MarketSnapshot oluşturur.
+
+    Args:
+        symbol: Sembol (exchange formatında)
+        exchange: BaseExchange
+        timeframe: None ise config'ten strategy.timeframe (15m)
+        limit: Mum sayısı (EMA200 için en az 200+)
+        closed_only: True ise oluşmakta olan son bar atılır (bar kapanışında değerlendirme)
+        now_ms: closed_only için referans zaman (sunucu saati); None ise yerel saat
+    """
+    if timeframe is None:
+        config = get_config()
+        timeframe = config.get("strategy.timeframe") or "15m"
+    ohlcv = exchange.get_klines(symbol, timeframe, limit=limit)
+    if closed_only:
+        ohlcv = drop_forming_bar(ohlcv, timeframe, now_ms)
+    return MarketSnapshot(symbol, timeframe, ohlcv)
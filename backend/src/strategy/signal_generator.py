@@ -9,20 +9,33 @@ MACD "kesişim" için: son bar'da MACD > Signal (long) veya MACD < Signal (short
 ve bir önceki bar'da tersi (momentum dönüşü) isteğe bağlı; basit haliyle son bar koşulu yeterli.
 """
 
-from typing import Literal, Optional
+from typing import List, Literal, Optional, Tuple
 
-import pandas as pd
+import numpy as np
 
 try:
-    from ..core.config_manager import ConfigManager
+    from ..core.config_manager import get_config
 except ImportError:
-    from core.config_manager import ConfigManager
-
-from .indicators import add_indicators_to_df, ohlcv_to_dataframe
-from .trend_filter import TrendDirection, get_daily_trend
+    from core.config_manager import get_config
+
+from .batch import (
+    LONG,
+    NONE,
+    SHORT,
+    decode_direction,
+    entry_decisions_batch,
+    group_by_length,
+    indicators_batch,
+    stack_ohlcv,
+    trend_decisions_batch,
+)
+from .market_snapshot import MarketSnapshot
+from .trend_filter import TrendDirection, cache_daily_trend, drop_forming_bar, get_daily_trend, peek_daily_trend
 
 SignalDirection = Literal["long", "short"]
 
+_TREND_CODES = {"long": LONG, "short": SHORT}
+
 
 def get_entry_signal(
     symbol: str,
@@ -30,6 +43,7 @@ def get_entry_signal(
     daily_trend: Optional[TrendDirection] = None,
     timeframe: Optional[str] = None,
     limit: int = 250,
+    snapshot: Optional[MarketSnapshot] = None,
 ) -> Optional[SignalDirection]:
     """
     15m grafikte entry sinyali: long, short veya None.
@@ -40,15 +54,16 @@ def get_entry_signal(
         daily_trend: None ise get_daily_trend ile hesaplanır
         timeframe: None ise config'ten 15m
         limit: 15m mum sayısı
+        snapshot: Döngüde paylaşılan MarketSnapshot; verilirse mumlar tekrar çekilmez
 
     Returns:
         "long" | "short" | None
     """
-    config = ConfigManager()
+    config = get_config()
     if timeframe is None:
         timeframe = config.get("strategy.timeframe") or "15m"
     if daily_trend is None:
-        daily_trend = get_daily_trend(symbol, exchange)
+        daily_trend = get_daily_trend(symbol, exchange, snapshot=snapshot)
 
     ema_period = int(config.get("strategy.entry.ema_period") or 200)
     macd_fast = int(config.get("strategy.entry.macd_fast") or 12)
@@ -57,13 +72,12 @@ def get_entry_signal(
     rsi_period = int(config.get("strategy.entry.rsi_period") or 14)
     rsi_threshold = float(config.get("strategy.entry.rsi_threshold") or 50)
 
-    ohlcv = exchange.get_klines(symbol, timeframe, limit=limit)
-    if not ohlcv or len(ohlcv) < ema_period:
+    if snapshot is None:
+        snapshot = MarketSnapshot(symbol, timeframe, exchange.get_klines(symbol, timeframe, limit=limit))
+    if len(snapshot) < ema_period:
         return None
 
-    df = ohlcv_to_dataframe(ohlcv)
-    df = add_indicators_to_df(
-        df,
+    frame = snapshot.indicators(
         ema_period=ema_period,
         macd_fast=macd_fast,
         macd_slow=macd_slow,
@@ -72,14 +86,13 @@ def get_entry_signal(
         atr_period=14,
     )
 
-    last = df.iloc[-1]
-    close = last["close"]
-    ema = last["ema"]
-    macd = last["macd"]
-    sig = last["macd_signal"]
-    rsi = last["rsi"]
+    close = frame["close"][-1]
+    ema = frame["ema"][-1]
+    macd = frame["macd"][-1]
+    sig = frame["macd_signal"][-1]
+    rsi = frame["rsi"][-1]
 
-    if any(pd.isna(x) for x in [ema, macd, sig, rsi]):
+    if any(np.isnan(x) for x in [ema, macd, sig, rsi]):
         return None
 
     # LONG: günlük long veya neutral; 15m fiyat > EMA, MACD > Signal, RSI > 50
@@ -102,34 +115,32 @@ def get_atr_and_stop_price(
     atr_multiplier: Optional[float] = None,
     timeframe: Optional[str] = None,
     limit: int = 50,
+    snapshot: Optional[MarketSnapshot] = None,
 ) -> tuple:
     """
     Stop mesafesi (ATR * multiplier) ve stop fiyatı.
     Long: stop = entry - atr * mult; Short: stop = entry + atr * mult.
     Entry olarak son kapanış veya mevcut fiyat kullanılabilir; burada son close kullanıyoruz.
+    snapshot verilirse sinyal ile aynı mumlar kullanılır (tekrar çekilmez).
 
     Returns:
         (atr_value, stop_price, entry_price)
     """
-    config = ConfigManager()
+    config = get_config()
     if timeframe is None:
         timeframe = config.get("strategy.timeframe") or "15m"
     if atr_multiplier is None:
         atr_multiplier = float(config.get("strategy.stop.atr_multiplier") or 1.5)
     atr_period = int(config.get("strategy.stop.atr_period") or 14)
 
-    ohlcv = exchange.get_klines(symbol, timeframe, limit=limit)
-    if not ohlcv or len(ohlcv) < atr_period:
+    if snapshot is None:
+        snapshot = MarketSnapshot(symbol, timeframe, exchange.get_klines(symbol, timeframe, limit=limit))
+    if len(snapshot) < atr_period:
         return 0.0, 0.0, 0.0
 
-    df = ohlcv_to_dataframe(ohlcv)
-    from .indicators import compute_atr
-
-    df["atr"] = compute_atr(df["high"], df["low"], df["close"], atr_period)
-    last = df.iloc[-1]
-    entry_price = float(last["close"])
-    atr_value = float(last["atr"])
-    if pd.isna(atr_value) or atr_value <= 0:
+    entry_price = snapshot.last_close
+    atr_value = snapshot.atr(atr_period)
+    if np.isnan(atr_value) or atr_value <= 0:
         return 0.0, 0.0, entry_price
 
     distance = atr_value * atr_multiplier
@@ -139,3 +150,83 @@ def get_atr_and_stop_price(
         stop_price = entry_price + distance
 
     return atr_value, stop_price, entry_price
+
+
+def get_entry_signals_batch(
+    symbols: List[str],
+    exchange,
+    timeframe: Optional[str] = None,
+    limit: int = 250,
+    trend_limit: int = 300,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Çok sembol için günlük trend ve entry kararlarını tek vektörel geçişte hesaplar.
+    Kurallar get_daily_trend / get_entry_signal ile aynıdır; aynı mumlarla aynı kararı verir.
+
+    Mumlar iki toplu exchange.get_klines_many isteğiyle çekilir. Trend cache'te olan sembollerin
+    günlük mumları çekilmez; hesaplanan trendler cache'e yazılır. Mumu alınamayan sembolün satırı
+    geçersiz sayılır (entry 0); diğer semboller etkilenmez.
+    Kütüphane API'si: engine taraması (_scan_symbols) henüz sembol başına get_entry_signal kullanır.
+
+    Args:
+        symbols: Semboller (exchange formatında)
+        exchange: BaseExchange
+        timeframe: None ise config'ten 15m
+        limit: Entry timeframe mum sayısı
+        trend_limit: Günlük mum sayısı
+
+    Returns:
+        (entries, trends): symbols ile hizalı int8 array'ler.
+        entries: LONG=1, SHORT=-1, NONE=0; trends: LONG=1, SHORT=-1, NEUTRAL=0
+    """
+    config = get_config()
+    if timeframe is None:
+        timeframe = config.get("strategy.timeframe") or "15m"
+    trend_timeframe = config.get("strategy.trend_filter.timeframe") or "1d"
+    trend_params = dict(
+        ema_period=int(config.get("strategy.trend_filter.ema_period") or 200),
+        macd_fast=int(config.get("strategy.trend_filter.macd_fast") or 12),
+        macd_slow=int(config.get("strategy.trend_filter.macd_slow") or 26),
+        macd_signal=int(config.get("strategy.trend_filter.macd_signal") or 9),
+    )
+    entry_params = dict(
+        ema_period=int(config.get("strategy.entry.ema_period") or 200),
+        macd_fast=int(config.get("strategy.entry.macd_fast") or 12),
+        macd_slow=int(config.get("strategy.entry.macd_slow") or 26),
+        macd_signal=int(config.get("strategy.entry.macd_signal") or 9),
+        rsi_period=int(config.get("strategy.entry.rsi_period") or 14),
+    )
+    rsi_threshold = float(config.get("strategy.entry.rsi_threshold") or 50)
+
+    trends = np.zeros(len(symbols), dtype=np.int8)
+    fetched = np.ones(len(symbols), dtype=bool)
+    missing = []
+    for i, symbol in enumerate(symbols):
+        cached = peek_daily_trend(symbol, trend_timeframe)
+        if cached is None:
+            missing.append(i)
+        else:
+            trends[i] = _TREND_CODES.get(cached, NONE)
+    if missing:
+        klines = exchange.get_klines_many([(symbols[i], trend_timeframe, trend_limit) for i in missing])
+        daily = []
+        for i in missing:
+            key = (symbols[i], trend_timeframe)
+            fetched[i] = key in klines
+            daily.append(drop_forming_bar(klines.get(key), trend_timeframe))
+        for bars, idx in group_by_length(daily, trend_params["ema_period"]).items():
+            close, high, low, valid = stack_ohlcv([daily[j] for j in idx], bars)
+            frame = indicators_batch(close, high, low, **trend_params)
+            trends[[missing[j] for j in idx]] = trend_decisions_batch(frame, valid)
+        for j, i in enumerate(missing):
+            if fetched[i]:
+                cache_daily_trend(symbols[i], daily[j], decode_direction(trends[i], "neutral"), trend_timeframe)
+
+    klines = exchange.get_klines_many([(s, timeframe, limit) for s in symbols])
+    entry_ohlcv = [klines.get((s, timeframe)) or [] for s in symbols]
+    entries = np.zeros(len(symbols), dtype=np.int8)
+    for bars, idx in group_by_length(entry_ohlcv, entry_params["ema_period"]).items():
+        close, high, low, valid = stack_ohlcv([entry_ohlcv[i] for i in idx], bars)
+        frame = indicators_batch(close, high, low, **entry_params)
+        entries[idx] = entry_decisions_batch(frame, trends[idx], valid & fetched[idx], rsi_threshold)
+    return entries, trends
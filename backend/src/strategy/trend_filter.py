@@ -5,27 +5,111 @@ Kurallar:
   Fiyat > EMA200 ve MACD > Signal  → LONG (sadece long bak)
   Fiyat < EMA200 ve MACD < Signal → SHORT (sadece short bak)
   Aksi halde                      → NEUTRAL (15m hangi yöne sinyal verirse o yönde açılabilir)
+
+Trend sadece yeni günlük bar kapandığında değişebilir. Sonuçlar (symbol, trend parametreleri,
+son kapanan bar zamanı) anahtarıyla cache'lenir; gün kapanışında anahtar değiştiği için
+cache kendiliğinden geçersiz olur. İstatistik: get_trend_cache_stats().
 """
 
-from typing import Literal, Optional
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 
-import pandas as pd
+import numpy as np
 
 try:
-    from ..core.config_manager import ConfigManager
+    from ..core.config_manager import get_config
+    from ..core.timeframes import timeframe_to_ms
 except ImportError:
-    from core.config_manager import ConfigManager
+    from core.config_manager import get_config
+    from core.timeframes import timeframe_to_ms
+
+from .indicators import compute_indicators
 
-from .indicators import add_indicators_to_df, ohlcv_to_dataframe
+if TYPE_CHECKING:
+    from .market_snapshot import MarketSnapshot
 
 TrendDirection = Literal["long", "short", "neutral"]
 
+# (symbol, timeframe, ema_period, macd_fast, macd_slow, macd_signal, last_closed_bar_ts)
+TrendCacheKey = Tuple[str, str, int, int, int, int, int]
+
+
+class TrendCache:
+    """
+    Günlük trend sonuçları için thread-safe cache.
+    Aynı sembol+parametre için yeni bir kapanmış bar geldiğinde eski kayıt silinir.
+    """
+
+    def __init__(self):
+        self._entries: Dict[TrendCacheKey, Tuple[TrendDirection, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: TrendCacheKey, count: bool = True) -> Optional[TrendDirection]:
+        """count=False: hits/misses istatistiğine yansımaz (sadece bakmak için)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if not count:
+                return entry[0] if entry is not None else None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: TrendCacheKey, trend: TrendDirection) -> None:
+        with self._lock:
+            # Aynı sembol+parametre için önceki günün kaydını at
+            for old in [k for k in self._entries if k[:-1] == key[:-1] and k != key]:
+                del self._entries[old]
+            self._entries[key] = (trend, time.time())
+
+    def clear(self, symbol: Optional[str] = None) -> None:
+        """Cache'i temizler. symbol verilirse sadece o sembolün kayıtları."""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == symbol]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """hits, misses, hit_rate, size ve kayıtların yaşı (saniye)."""
+        with self._lock:
+            now = time.time()
+            ages = [now - stored_at for _, stored_at in self._entries.values()]
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total * 100, 2) if total else 0.0,
+                "size": len(self._entries),
+                "oldest_age_seconds": round(max(ages), 1) if ages else None,
+                "newest_age_seconds": round(min(ages), 1) if ages else None,
+            }
+
+
+_trend_cache = TrendCache()
+
+
+def get_trend_cache_stats() -> Dict[str, Any]:
+    """Trend cache istatistikleri (hits, misses, size, age)."""
+    return _trend_cache.stats()
+
+
+def clear_trend_cache(symbol: Optional[str] = None) -> None:
+    """Trend cache'ini temizler (örn. trend parametreleri değiştiğinde)."""
+    _trend_cache.clear(symbol)
+
 
 def get_daily_trend(
     symbol: str,
     exchange,
     timeframe: Optional[str] = None,
     limit: int = 300,
+    snapshot: Optional["MarketSnapshot"] = None,
 ) -> TrendDirection:
     """
     Günlük (1d) grafiğe göre trend yönü döndürür.
@@ -35,25 +119,128 @@ def get_daily_trend(
         exchange: BaseExchange (get_klines kullanır)
         timeframe: None ise config'ten strategy.trend_filter.timeframe (1d)
         limit: Kaç mum çekilecek (EMA200 için en az 200+)
+        snapshot: Döngüde paylaşılan MarketSnapshot; trend bir kez hesaplanıp üzerine yazılır
 
     Returns:
         "long" | "short" | "neutral"
     """
-    config = ConfigManager()
+    if snapshot is not None and snapshot.daily_trend is not None:
+        return snapshot.daily_trend
+    trend = _compute_daily_trend(symbol, exchange, timeframe, limit)
+    if snapshot is not None:
+        snapshot.daily_trend = trend
+    return trend
+
+
+def peek_daily_trend(symbol: str, timeframe: Optional[str] = None) -> Optional[TrendDirection]:
+    """
+    Son kapanan bar için cache'lenmiş trend varsa döndürür, yoksa None. Borsaya istek atmaz.
+    Async engine günlük mumları sadece cache'te olmayan semboller için çekmek için kullanır.
+    """
+    timeframe, ema_period, macd_fast, macd_slow, macd_signal = _trend_settings(timeframe)
+    try:
+        tf_ms = timeframe_to_ms(timeframe)
+    except ValueError:
+        return None
+    key = (symbol, timeframe, ema_period, macd_fast, macd_slow, macd_signal, _last_closed_ts(tf_ms))
+    return _trend_cache.get(key, count=False)
+
+
+def _trend_settings(timeframe: Optional[str]) -> Tuple[str, int, int, int, int]:
+    """Config'ten (timeframe, ema_period, macd_fast, macd_slow, macd_signal)."""
+    config = get_config()
     if timeframe is None:
         timeframe = config.get("strategy.trend_filter.timeframe") or "1d"
-    ema_period = int(config.get("strategy.trend_filter.ema_period") or 200)
-    macd_fast = int(config.get("strategy.trend_filter.macd_fast") or 12)
-    macd_slow = int(config.get("strategy.trend_filter.macd_slow") or 26)
-    macd_signal = int(config.get("strategy.trend_filter.macd_signal") or 9)
+    return (
+        timeframe,
+        int(config.get("strategy.trend_filter.ema_period") or 200),
+        int(config.get("strategy.trend_filter.macd_fast") or 12),
+        int(config.get("strategy.trend_filter.macd_slow") or 26),
+        int(config.get("strategy.trend_filter.macd_signal") or 9),
+    )
+
+
+def _compute_daily_trend(
+    symbol: str,
+    exchange,
+    timeframe: Optional[str],
+    limit: int,
+) -> TrendDirection:
+    timeframe, ema_period, macd_fast, macd_slow, macd_signal = _trend_settings(timeframe)
 
-    ohlcv = exchange.get_klines(symbol, timeframe, limit=limit)
+    try:
+        tf_ms = timeframe_to_ms(timeframe)
+    except ValueError:
+        ohlcv = exchange.get_klines(symbol, timeframe, limit=limit)
+        return _trend_from_ohlcv(ohlcv, ema_period, macd_fast, macd_slow, macd_signal)
+
+    # Son kapanan bar'ın açılış zamanı; gün kapanışında değişir ve cache'i geçersiz kılar
+    last_closed_ts = _last_closed_ts(tf_ms)
+    key = (symbol, timeframe, ema_period, macd_fast, macd_slow, macd_signal, last_closed_ts)
+    cached = _trend_cache.get(key)
+    if cached is not None:
+        return cached
+
+    ohlcv = drop_forming_bar(exchange.get_klines(symbol, timeframe, limit=limit), timeframe)
+    trend = _trend_from_ohlcv(ohlcv, ema_period, macd_fast, macd_slow, macd_signal)
+    cache_daily_trend(symbol, ohlcv, trend, timeframe)
+    return trend
+
+
+def cache_daily_trend(
+    symbol: str,
+    ohlcv: List[List[Any]],
+    trend: TrendDirection,
+    timeframe: Optional[str] = None,
+) -> None:
+    """
+    Dışarıda (örn. batch) kapanmış barlarla hesaplanan trendi cache'e yazar.
+    Borsa son kapanan bar'ı henüz yayınlamadıysa cache'lenmez; sonraki çağrıda tekrar denenir.
+    """
+    timeframe, ema_period, macd_fast, macd_slow, macd_signal = _trend_settings(timeframe)
+    try:
+        last_closed_ts = _last_closed_ts(timeframe_to_ms(timeframe))
+    except ValueError:
+        return
+    if ohlcv and int(ohlcv[-1][0]) == last_closed_ts:
+        _trend_cache.put((symbol, timeframe, ema_period, macd_fast, macd_slow, macd_signal, last_closed_ts), trend)
+
+
+def _last_closed_ts(tf_ms: int, now_ms: Optional[int] = None) -> int:
+    """Şu an (veya now_ms) itibarıyla son kapanmış bar'ın açılış zamanı (ms)."""
+    if now_ms is None:
+        now_ms = int(time.time() * 1000)
+    return now_ms // tf_ms * tf_ms - tf_ms
+
+
+def drop_forming_bar(
+    ohlcv: Optional[List[List[Any]]],
+    timeframe: str,
+    now_ms: Optional[int] = None,
+) -> List[List[Any]]:
+    """
+    Son bar henüz kapanmadıysa (oluşmakta olan bar) listeden çıkarır.
+    now_ms: Referans zaman (örn. sunucu saatine göre); None ise yerel saat.
+    """
+    ohlcv = ohlcv or []
+    if ohlcv and int(ohlcv[-1][0]) > _last_closed_ts(timeframe_to_ms(timeframe), now_ms):
+        return ohlcv[:-1]
+    return ohlcv
+
+
+def _trend_from_ohlcv(
+    ohlcv: List[List[Any]],
+    ema_period: int,
+    macd_fast: int,
+    macd_slow: int,
+    macd_signal: int,
+) -> TrendDirection:
+    """Verilen mumların son bar'ına göre trend yönü."""
     if not ohlcv or len(ohlcv) < ema_period:
         return "neutral"
 
-    df = ohlcv_to_dataframe(ohlcv)
-    df = add_indicators_to_df(
-        df,
+    frame = compute_indicators(
+        ohlcv,
         ema_period=ema_period,
         macd_fast=macd_fast,
         macd_slow=macd_slow,
@@ -63,13 +250,12 @@ def get_daily_trend(
     )
 
     # Son kapanan mum (son tamamlanmış bar)
-    last = df.iloc[-1]
-    close = last["close"]
-    ema = last["ema"]
-    macd = last["macd"]
-    sig = last["macd_signal"]
+    close = frame["close"][-1]
+    ema = frame["ema"][-1]
+    macd = frame["macd"][-1]
+    sig = frame["macd_signal"][-1]
 
-    if pd.isna(ema) or pd.isna(macd) or pd.isna(sig):
+    if np.isnan(ema) or np.isnan(macd) or np.isnan(sig):
         return "neutral"
 
     if close > ema and macd > sig:
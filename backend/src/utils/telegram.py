@@ -8,15 +8,13 @@ Yoksa veya enabled false ise sessizce atlanır.
 from typing import Optional
 
 try:
-    from ..core.config_manager import ConfigManager
+    from ..core.config_manager import get_config
 except ImportError:
-    from core.config_manager import ConfigManager
-
-import httpx
+    from core.config_manager import get_config
 
 
 def _is_enabled() -> bool:
-    config = ConfigManager()
+    config = get_config()
     return bool(config.get("telegram.enabled") and config.get("telegram.bot_token") and config.get("telegram.chat_id"))
 
 
@@ -24,11 +22,13 @@ def _send(text: str) -> bool:
     if not _is_enabled():
         return False
     try:
-        config = ConfigManager()
+        config = get_config()
         token = config.get("telegram.bot_token", "").strip()
         chat_id = str(config.get("telegram.chat_id", "")).strip()
         if not token or not chat_id:
             return False
+        import httpx  # İlk bildirimde yüklenir; engine/API başlangıcını yavaşlatmaz
+
         url = f"https://api.telegram.org/bot{token}/sendMessage"
         with httpx.Client(timeout=10.0) as client:
             r = client.post(url, json={"chat_id": chat_id, "text": text, "disable_web_page_preview": True})
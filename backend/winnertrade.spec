@@ -29,26 +29,43 @@ uvicorn_imports = [
 app_imports = [
     'api',
     'api.main',
+    'api.response_cache',
     'api.routes',
     'api.routes.config',
     'api.routes.dashboard',
     'api.routes.engine_control',
     'core',
     'core.config_manager',
+    'core.config_watch',
+    'core.events',
     'core.config_schema',
+    'core.timeframes',
     'core.paths',
     'core.state',
     'core.logger',
     'storage',
     'storage.config_storage',
+    'storage.trade_ledger',
     'exchanges',
     'exchanges.factory',
+    'exchanges.async_base_exchange',
+    'exchanges.async_futures',
+    'exchanges.async_paper_trader',
     'exchanges.base_exchange',
     'exchanges.binance_futures',
+    'exchanges.cached_exchange',
+    'exchanges.ccxt_tickers',
     'exchanges.mexc_futures',
     'exchanges.paper_trader',
+    'exchanges.registry',
+    'exchanges.rate_limiter',
+    'exchanges.market_cache',
     'strategy',
+    'strategy.batch',
+    'strategy.incremental',
     'strategy.indicators',
+    'strategy.indicators_np',
+    'strategy.market_snapshot',
     'strategy.signal_generator',
     'strategy.trend_filter',
     'risk',
@@ -56,11 +73,19 @@ app_imports = [
     'execution',
     'execution.order_executor',
     'execution.trailing_stop',
+    'execution.position_book',
+    'execution.trailing_monitor',
+    'execution.exchange_stop',
+    'execution.intrabar',
     'stats',
     'stats.statistics',
+    'stats.event_log',
+    'stats.log_writer',
     'stats.trade_logger',
     'engine',
+    'engine.async_loop',
     'engine.loop',
+    'engine.scheduler',
     'utils',
     'utils.telegram',
 ]
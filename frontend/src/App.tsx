@@ -1,11 +1,17 @@
 import { useEffect, useState } from 'react';
-import type { Stats, Position, Ticker } from './services/api';
+import type { Stats, Position, Ticker, StreamEvent } from './services/api';
 import { api } from './services/api';
 import { isNetworkError, toFriendlyApiError } from './utils/apiErrors';
 import SettingsPanel from './SettingsPanel';
 
 /** Veri yenileme aralığı (ms). Daha hızlı için 500–800 kullanılabilir; backend yükü artar. */
 const REFRESH_MS = 1000;
+/** Stream (/api/stream) bağlıyken yedek yenileme aralığı (ms); güncellemeler olaylarla gelir. */
+const STREAM_REFRESH_MS = 15000;
+/** Art arda gelen pozisyon olaylarında tek tam yenileme için bekleme (ms). */
+const POSITION_REFRESH_DEBOUNCE_MS = 500;
+/** Ekranda tutulan trailing log satırı (/api/logs/trailing limiti ile aynı). */
+const TRAILING_LOG_LIMIT = 100;
 const DEFAULT_SYMBOL = 'BTC/USDT';
 
 export default function App() {
@@ -25,6 +31,7 @@ export default function App() {
   const [error, setError] = useState<string | null>(null);
   const [engineRunning, setEngineRunning] = useState(false);
   const [engineLoading, setEngineLoading] = useState(false);
+  const [streaming, setStreaming] = useState(false);
 
   const fetchAll = async () => {
     try {
@@ -97,12 +104,50 @@ export default function App() {
     checkConfigAndBackend();
   }, []);
 
-  // Ana ekran verisi yalnızca config varsa yenilenir
+  // Ana ekran verisi yalnızca config varsa yenilenir (stream bağlıyken seyrek)
   useEffect(() => {
     if (needsSetup !== false) return;
     fetchAll();
-    const id = setInterval(fetchAll, REFRESH_MS);
+    const id = setInterval(fetchAll, streaming ? STREAM_REFRESH_MS : REFRESH_MS);
     return () => clearInterval(id);
+  }, [needsSetup, streaming]);
+
+  // Engine olayları: fiyat/stop olaydan güncellenir, pozisyon açılış/kapanışında (debounce'lu) tam yenileme.
+  // 'stats' dinlenmez: her kapanışta position.closed ile birlikte gelir, aynı yenilemeyi tetiklerdi.
+  useEffect(() => {
+    if (needsSetup !== false) return;
+    const es = api.stream();
+    const parse = (e: Event) => JSON.parse((e as MessageEvent).data) as StreamEvent;
+    const applyMark = (symbol: string, mark: number) =>
+      setPositions((ps) => ps.map((p) => (p.symbol === symbol
+        ? { ...p, mark_price: mark, unrealized_pnl: (mark - p.entry_price) * p.size * (p.side === 'short' ? -1 : 1) }
+        : p)));
+    let refreshTimer: ReturnType<typeof setTimeout> | undefined;
+    const scheduleRefresh = () => {
+      clearTimeout(refreshTimer);
+      refreshTimer = setTimeout(fetchAll, POSITION_REFRESH_DEBOUNCE_MS);
+    };
+    es.onopen = () => setStreaming(true);
+    es.onerror = () => setStreaming(false);
+    es.addEventListener('ticker', (e) => {
+      const d = parse(e).data as { symbol: string; last: number; bid?: number; ask?: number };
+      if (d.symbol === DEFAULT_SYMBOL) setTicker({ last: d.last, bid: d.bid ?? d.last, ask: d.ask ?? d.last });
+      applyMark(d.symbol, d.last);
+    });
+    es.addEventListener('stats.snapshot', (e) => setStats(parse(e).data as unknown as Stats));
+    es.addEventListener('stop.moved', (e) => {
+      const ev = parse(e);
+      const d = ev.data as { symbol: string; side?: string; stop: number; mark: number };
+      applyMark(d.symbol, d.mark);
+      const line = `[${new Date(ev.ts).toISOString()}] TRAIL symbol=${d.symbol} side=${d.side ?? ''} mark=${d.mark} stop=${d.stop}`;
+      setTrailingLog((lines) => [...lines, line].slice(-TRAILING_LOG_LIMIT));
+    });
+    ['position.opened', 'position.closed'].forEach((topic) => es.addEventListener(topic, scheduleRefresh));
+    return () => {
+      clearTimeout(refreshTimer);
+      es.close();
+      setStreaming(false);
+    };
   }, [needsSetup]);
 
   const livePnl = positions.reduce((acc, p) => acc + (p.unrealized_pnl || 0), 0);
@@ -33,6 +33,7 @@ export interface ExchangeConfig {
   api_secret: string;
   testnet: boolean;
   paper_trade: boolean;
+  rate_limit_weight_per_minute?: number | null;
 }
 
 export interface AccountConfig {
@@ -148,6 +149,45 @@ export interface Ticker {
   ask: number;
 }
 
+export interface LogEvent {
+  ts: string;
+  ts_ms: number;
+  type: string;
+  symbol?: string;
+  [key: string]: unknown;
+}
+
+export interface EventPage {
+  events: LogEvent[];
+  next_cursor: string | null;
+}
+
+export interface EventQuery {
+  limit?: number;
+  symbol?: string;
+  since?: string;
+  until?: string;
+  cursor?: string;
+  days?: number;
+}
+
+function eventQuery(q: EventQuery): string {
+  const params = new URLSearchParams();
+  Object.entries(q).forEach(([k, v]) => {
+    if (v !== undefined && v !== null && v !== '') params.set(k, String(v));
+  });
+  const s = params.toString();
+  return s ? `?${s}` : '';
+}
+
+/** /api/stream (Server-Sent Events) olayı: position.opened | position.closed | stop.moved | ticker | stats | stats.snapshot */
+export interface StreamEvent<T = Record<string, unknown>> {
+  seq: number;
+  ts: number;
+  topic: string;
+  data: T;
+}
+
 export const api = {
   stats: () => get<Stats>('/api/stats'),
   positions: (symbol?: string) => get<Position[]>(symbol ? `/api/positions?symbol=${encodeURIComponent(symbol)}` : '/api/positions'),
@@ -156,6 +196,10 @@ export const api = {
   logsTrades: (limit = 100) => get<string[]>(`/api/logs/trades?limit=${limit}`),
   logsSignals: (limit = 100) => get<string[]>(`/api/logs/signals?limit=${limit}`),
   logsTrailing: (limit = 100) => get<string[]>(`/api/logs/trailing?limit=${limit}`),
+  events: (log: 'trades' | 'signals' | 'trailing', q: EventQuery = {}) =>
+    get<EventPage>(`/api/events/${log}${eventQuery(q)}`),
+  stream: (topics?: string[]) =>
+    new EventSource(`${API_BASE}/api/stream${topics && topics.length ? `?topics=${encodeURIComponent(topics.join(','))}` : ''}`),
   lastSignal: () => get<{ raw: string | null; direction: string | null; symbol: string | null }>('/api/last_signal'),
   engineStatus: () => get<{ running: boolean; interval_seconds: number | null }>('/api/engine/status'),
   engineStart: (interval_seconds = 60) => post<{ status: string; interval_seconds: number }>(`/api/engine/start?interval_seconds=${interval_seconds}`),